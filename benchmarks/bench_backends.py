@@ -0,0 +1,88 @@
+"""
+Сравнение задержки всех читающих методов менеджера БД: PostgreSQL (DBManager) против
+встроенной SQLite (SQLiteDBManager) на одинаковых синтетических данных.
+
+Запуск из корня проекта (нужна БД PostgreSQL из data/database.ini, таблицы companies и vacancies
+будут пересозданы; файл SQLite создается во временном каталоге):
+    python -m benchmarks.bench_backends --rows 100000 --repeat 20
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.bench_insert import make_employers, make_vacancies, reset_tables
+from config import config, db_batch_size
+from src.dbmanager import AbstractDBManager, create_db_manager
+
+
+def queries(db: AbstractDBManager) -> dict[str, Callable[[], Any]]:
+    """
+    Возвращает читающие методы менеджера БД для замера (в обход кэша результатов);
+    потоковые методы читаются до конца.
+    """
+    return {
+        "get_companies_and_vacancies_count": lambda: db.get_companies_and_vacancies_count(use_cache=False),
+        "get_all_vacancies": lambda: db.get_all_vacancies(use_cache=False),
+        "get_avg_salary": lambda: db.get_avg_salary(use_cache=False),
+        "get_salary_stats": lambda: db.get_salary_stats(use_cache=False),
+        "get_vacancies_with_higher_salary": lambda: db.get_vacancies_with_higher_salary(use_cache=False),
+        "get_vacancies_with_keyword": lambda: db.get_vacancies_with_keyword("Python", use_cache=False),
+        "search_vacancies_top50": lambda: db.search_vacancies("developer", 50, use_cache=False),
+        "iter_all_vacancies": lambda: sum(1 for _ in db.iter_all_vacancies()),
+        "iter_vacancies_with_higher_salary": lambda: sum(1 for _ in db.iter_vacancies_with_higher_salary()),
+        "iter_vacancies_with_keyword": lambda: sum(1 for _ in db.iter_vacancies_with_keyword("Python")),
+        "iter_vacancy_salaries": lambda: sum(1 for _ in db.iter_vacancy_salaries()),
+    }
+
+
+def measure(db: AbstractDBManager, rows: int, employers: int, repeat: int) -> dict[str, float]:
+    """
+    Заполняет таблицы и возвращает медианную задержку каждого метода в миллисекундах.
+    """
+    reset_tables(db)
+    company_ids = list(db.insert_companies_bulk(make_employers(employers)))
+    start = time.perf_counter()
+    db.insert_vacancies_bulk(make_vacancies(rows, company_ids), db_batch_size)
+    print(f"{type(db).__name__}: вставка {rows / (time.perf_counter() - start):,.0f} строк/с")
+
+    results: dict[str, float] = {}
+    for name, query in queries(db).items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - started)
+        results[name] = statistics.median(timings) * 1000
+
+    db.drop_table("vacancies")
+    db.drop_table("companies")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--employers", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends = {"postgresql": create_db_manager("postgresql", **config(section="postgresql")),
+                    "sqlite": create_db_manager("sqlite", path=str(Path(tmp_dir, "bench.sqlite3")))}
+        results: dict[str, dict[str, float]] = {}
+        for name, db in backends.items():
+            try:
+                results[name] = measure(db, args.rows, args.employers, args.repeat)
+            finally:
+                db.close()
+
+    print(f"{'метод':<36}{'postgresql, мс':>16}{'sqlite, мс':>14}")
+    for query in results["postgresql"]:
+        print(f"{query:<36}{results['postgresql'][query]:>16.2f}{results['sqlite'][query]:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Замер получения подробностей вакансий (/vacancies/{id}) на локальной замене api.hh.ru: вакансий в секунду
+при разном числе одновременных запросов и оценка времени обработки 50 000 вакансий.
+
+Подробности записываются во встроенную БД SQLite в памяти через main.enrich_data, поэтому сервер
+PostgreSQL не нужен. Повторный запуск обогащения на тех же данных не должен выполнять ни одного запроса.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_enrich --employers 20 --vacancies 100 --latency 0.05 --workers 1 8 32
+    python -m benchmarks.bench_enrich --max-rps 10
+"""
+import argparse
+import time
+
+import requests
+
+from benchmarks.datagen import employer_id, generate_vacancy
+from benchmarks.fake_hh import FakeHHServer
+from main import enrich_data
+from src.api import Parser
+from src.http_client import HttpClient
+from src.sqlite_dbmanager import SQLiteDBManager
+from src.vacancy import Vacancy
+
+
+def fill_db(db: SQLiteDBManager, server: FakeHHServer, employers: int, vacancies: int) -> None:
+    """
+    Заполняет БД работодателями и вакансиями, ссылки которых указывают на server.
+    """
+    hh_api = Parser(f"{server.url}/employers", favorite_companies_id_hh=server.employer_ids)
+    company_ids = db.insert_companies_bulk(hh_api.get_employer_objects())
+    db.insert_vacancies_bulk(Vacancy.new_vacancy(generate_vacancy(employer_id(i), index, server.seed, server.url),
+                                                 company_id)
+                             for i, company_id in enumerate(sorted(company_ids))
+                             for index in range(vacancies))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employers", type=int, default=20)
+    parser.add_argument("--vacancies", type=int, default=100, help="вакансий у каждого работодателя")
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка ответа сервера, с")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--max-rps", type=float, default=1000.0,
+                        help="лимит запросов в секунду HTTP-клиента (у api.hh.ru - hh_api_max_rps)")
+    args = parser.parse_args()
+
+    total = args.employers * args.vacancies
+    print(f"{total:,} вакансий, задержка ответа {args.latency * 1000:.0f} мс, лимит {args.max_rps:g} запросов/с")
+    with FakeHHServer(employers=args.employers, vacancies_per_employer=args.vacancies,
+                      latency=args.latency) as server:
+        for workers in args.workers:
+            db = SQLiteDBManager(":memory:")
+            try:
+                db.create_table()
+                fill_db(db, server, args.employers, args.vacancies)
+
+                session = requests.Session()
+                client = HttpClient(session, max_rps=args.max_rps, burst=workers, max_concurrency=workers)
+                hh_api = Parser(f"{server.url}/employers", max_workers=workers, client=client)
+
+                requests_before = server.requests_count
+                started = time.perf_counter()
+                updated = enrich_data(db, hh_api)
+                seconds = time.perf_counter() - started
+                rate = updated / seconds if seconds else 0.0
+
+                # все вакансии уже обогащены и не менялись: повторный запуск не обращается к серверу
+                fetched = server.requests_count - requests_before
+                enrich_data(db, hh_api)
+                repeated = server.requests_count - requests_before - fetched
+            finally:
+                db.close()
+
+            print(f"workers={workers:<4}{updated:>8} вакансий{seconds:>9.2f} с{rate:>10,.0f} /с"
+                  f"{fetched:>8} запросов"
+                  f"   50 000 вакансий: ~{50_000 / rate / 60 if rate else float('inf'):.1f} мин"
+                  f"   повторный запуск: {repeated} запросов")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Сравнение скорости вставки вакансий в БД: построчный INSERT против пакетного INSERT ... VALUES.
+
+Запуск из корня проекта (нужна БД из data/database.ini, таблицы companies и vacancies будут пересозданы):
+    python -m benchmarks.bench_insert --rows 20000 --batch-size 1000
+"""
+import argparse
+import time
+
+from config import config, db_batch_size
+from src.dbmanager import DBManager
+from src.employer import Employer
+from src.vacancy import Vacancy
+
+
+def make_employers(count: int) -> list[Employer]:
+    """
+    Создает синтетических работодателей.
+    """
+    return [Employer(str(i), f"Company {i}", f"https://hh.ru/employer/{i}", "Москва", "",
+                     "", f"https://api.hh.ru/vacancies?employer_id={i}", 0) for i in range(count)]
+
+
+def make_vacancies(count: int, company_ids: list[int]) -> list[Vacancy]:
+    """
+    Создает синтетические вакансии, равномерно распределенные по работодателям.
+    """
+    return [Vacancy(str(i), f"Python developer {i}", f"https://api.hh.ru/vacancies/{i}",
+                    {"from": 100_000 + i % 1000, "to": 200_000 + i % 1000}, "Опыт работы с Python",
+                    company_ids[i % len(company_ids)]) for i in range(count)]
+
+
+def reset_tables(db: DBManager) -> None:
+    """
+    Пересоздает таблицы перед замером.
+    """
+    db.drop_table("vacancies")
+    db.drop_table("companies")
+    db.create_table()
+
+
+def measure(db: DBManager, vacancies: list[Vacancy], batch_size: int | None) -> float:
+    """
+    Возвращает скорость вставки вакансий в строках в секунду.
+    """
+    start = time.perf_counter()
+    db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(vacancies, "vacancies",
+                                                                            batch_size=batch_size)
+    return len(vacancies) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--employers", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=db_batch_size)
+    args = parser.parse_args()
+
+    db = DBManager(**config())
+    results: dict[str, float] = {}
+    for label, batch_size in (("построчно", None), (f"пакетами по {args.batch_size}", args.batch_size)):
+        reset_tables(db)
+        company_ids = list(db.insert_companies_bulk(make_employers(args.employers)))
+        results[label] = measure(db, make_vacancies(args.rows, company_ids), batch_size)
+
+    db.drop_table("vacancies")
+    db.drop_table("companies")
+
+    for label, rate in results.items():
+        print(f"{label}: {rate:,.0f} строк/с")
+
+
+if __name__ == "__main__":
+    main()
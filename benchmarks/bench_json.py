@@ -0,0 +1,51 @@
+"""
+Микробенчмарк разбора страниц выдачи /vacancies в объекты Vacancy (объектов в секунду):
+прежний путь (json.loads + Vacancy.new_vacancy) против типизированного разбора через msgspec.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_json --pages 200 --per-page 100
+"""
+import argparse
+import json
+import time
+
+from benchmarks.datagen import generate_vacancies_page
+from src.json_decoder import JsonDecoder, MsgspecJsonDecoder, StdlibJsonDecoder, msgspec
+
+
+def objects_per_second(decoder: JsonDecoder, pages: list[bytes], repeat: int) -> float:
+    """
+    Разбирает все страницы repeat раз и возвращает лучшее число объектов вакансий в секунду.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = sum(len(decoder.decode_vacancies_page(page, 1).items) for page in pages)
+        best = max(best, count / (time.perf_counter() - started))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    total = args.pages * args.per_page
+    pages = [json.dumps(generate_vacancies_page("1", total, page, args.per_page), ensure_ascii=False).encode()
+             for page in range(args.pages)]
+    print(f"{total:,} вакансий, {sum(map(len, pages)) / 2 ** 20:.1f} МиБ JSON")
+
+    stdlib = objects_per_second(StdlibJsonDecoder(), pages, args.repeat)
+    print(f"json + new_vacancy: {stdlib:,.0f} объектов/с")
+    if msgspec is None:
+        print("msgspec не установлен, типизированный разбор не замерен")
+        return
+
+    fast = objects_per_second(MsgspecJsonDecoder(), pages, args.repeat)
+    print(f"msgspec (структуры): {fast:,.0f} объектов/с (x{fast / stdlib:.1f})")
+
+
+if __name__ == "__main__":
+    main()
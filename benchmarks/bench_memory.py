@@ -0,0 +1,67 @@
+"""
+Замер памяти на объект Vacancy (tracemalloc): прежнее представление со словарем атрибутов
+и словарем зарплаты против текущего представления на слотах.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_memory --count 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+
+from src.vacancy import Vacancy
+
+
+class LegacyVacancy:
+    """
+    Прежнее представление вакансии: атрибуты в __dict__, зарплата - словарь на каждый объект.
+    """
+
+    def __init__(self, vacancy_id: str, name: str, url: str, salary: dict, requirement: str,
+                 company_id: int) -> None:
+        self.__vacancy_id = vacancy_id
+        self.__name = name
+        self.__url = url
+        self.__salary = {'from': salary.get('from') or 0, 'to': salary.get('to') or 0}
+        self.__requirement = requirement
+        self.__company_id = company_id
+
+
+def bytes_per_object(factory: Callable[..., object], count: int) -> float:
+    """
+    Создает count объектов и возвращает прирост выделенной памяти в байтах на объект.
+
+    Строки создаются заранее и общие для всех объектов, поэтому замер показывает
+    только стоимость самого объекта.
+    """
+    name, url, requirement = "Python developer", "https://api.hh.ru/vacancies/1", "Опыт работы с Python"
+    salary = {"from": 100_000, "to": 200_000}
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory("1", name, url, salary, requirement, i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # список ссылок на объекты не относится к стоимости объекта
+    list_overhead = 8 * len(objects)
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    legacy = bytes_per_object(LegacyVacancy, args.count)
+    current = bytes_per_object(Vacancy, args.count)
+    print(f"{args.count:,} вакансий")
+    print(f"до (__dict__ + словарь зарплаты): {legacy:.0f} байт/объект, {legacy * args.count / 2 ** 20:,.0f} МиБ")
+    print(f"после (__slots__, два int):       {current:.0f} байт/объект, {current * args.count / 2 ** 20:,.0f} МиБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Сравнение задержки поиска вакансий: последовательный LIKE против индексного поиска search_vacancies.
+
+Синтетическая таблица генерируется на стороне сервера (generate_series), поэтому заполнение 1 млн строк
+занимает секунды. Запуск из корня проекта (нужна БД из data/database.ini, таблицы будут пересозданы):
+    python -m benchmarks.bench_search --rows 1000000 --repeat 5
+"""
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from benchmarks.bench_insert import reset_tables
+from config import config
+from src.dbmanager import DBManager
+
+QUERIES = ("Python", "разработчик", "аналитик данных", "Pyhton")
+
+
+def fill_synthetic(db: DBManager, rows: int) -> None:
+    """
+    Заполняет таблицы одной компанией и rows вакансиями со случайными названиями и требованиями.
+    """
+    with db._connection() as conn, conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO companies (employer_id, name, city) VALUES ('0', 'Synthetic', 'Москва');
+        """)
+        cur.execute("""
+            INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement)
+            SELECT i::text,
+                   (ARRAY['Python', 'Java', 'Go', 'Старший', 'Ведущий', 'Junior'])[1 + i % 6] || ' ' ||
+                   (ARRAY['разработчик', 'аналитик данных', 'тестировщик', 'developer', 'инженер'])[1 + i % 5],
+                   (SELECT id FROM companies LIMIT 1),
+                   'https://api.hh.ru/vacancies/' || i,
+                   50000 + i % 200000, 100000 + i % 300000,
+                   (ARRAY['Опыт разработки на Python', 'Знание SQL и PostgreSQL', 'Опыт работы с Linux',
+                          'Английский язык', 'Знание Kubernetes'])[1 + i % 5] || ' ' || md5(i::text)
+            FROM generate_series(1, %s) AS i;
+        """, (rows,))
+        cur.execute("ANALYZE vacancies;")
+
+
+def like_scan(db: DBManager, keyword: str) -> list[tuple]:
+    """
+    Прежняя реализация get_vacancies_with_keyword.
+    """
+    with db._connection() as conn, conn.cursor() as cur:
+        cur.execute("""
+            SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+            FROM vacancies AS v
+            JOIN companies AS c ON v.company_id = c.id
+            WHERE v.name LIKE %s;
+        """, (f'%{keyword}%',))
+        return cur.fetchall()
+
+
+def measure(func: Callable[[], list], repeat: int) -> float:
+    """
+    Возвращает медианное время выполнения в миллисекундах.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    db = DBManager(**config())
+    reset_tables(db)
+    fill_synthetic(db, args.rows)
+
+    print(f"{'запрос':<20}{'LIKE, мс':>12}{'поиск, мс':>12}{f'поиск top-{args.limit}, мс':>20}")
+    for query in QUERIES:
+        like_ms = measure(lambda: like_scan(db, query), args.repeat)
+        search_ms = measure(lambda: db.search_vacancies(query), args.repeat)
+        top_ms = measure(lambda: db.search_vacancies(query, args.limit), args.repeat)
+        print(f"{query:<20}{like_ms:>12.1f}{search_ms:>12.1f}{top_ms:>20.1f}")
+
+    db.drop_table("vacancies")
+    db.drop_table("companies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Замер снимков данных: запись снимка, открытие и построение VacancyTable без БД, загрузка снимка
+в БД через COPY против пакетной вставки INSERT ... VALUES.
+
+Запуск из корня проекта (нужна БД из data/database.ini, таблицы companies и vacancies будут пересозданы):
+    python -m benchmarks.bench_snapshot --rows 200000
+    python -m benchmarks.bench_snapshot --rows 1000000 --no-db
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_insert import make_employers, make_vacancies, reset_tables
+from config import config, db_batch_size
+from src.dbmanager import DBManager
+from src.snapshot import Snapshot, write_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--employers", type=int, default=100)
+    parser.add_argument("--no-db", action="store_true", help="не замерять загрузку в БД")
+    args = parser.parse_args()
+
+    employers = make_employers(args.employers)
+    company_rows = [(i + 1, e.employer_id, e.name, e.alternate_url, e.city, e.description, e.site_url,
+                     e.vacancies_url, e.open_vacancies) for i, e in enumerate(employers)]
+    vacancies = make_vacancies(args.rows, [row[0] for row in company_rows])
+    # подробности вакансий не получены: их столбцы снимка пустые
+    vacancy_rows = [DBManager._vacancy_row(v) + ("",) * 5 for v in vacancies]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for compression in (None, "zlib"):
+            path = Path(tmp_dir, f"snapshot_{compression}.cw5")
+            start = time.perf_counter()
+            write_snapshot(path, {"companies": company_rows, "vacancies": vacancy_rows}, compression)
+            written = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with Snapshot(path) as snapshot:
+                salaries = snapshot.table("vacancies").column("salary_max")
+                total = sum(salaries)
+            scanned = time.perf_counter() - start
+            print(f"сжатие {compression}: {path.stat().st_size / 2 ** 20:,.1f} МиБ, запись {written:.2f} с, "
+                  f"открытие и проход по столбцу {scanned:.3f} с (сумма {total})")
+
+        try:
+            from src.vacancy_table import VacancyTable
+        except ImportError:
+            print("numpy не установлен, VacancyTable.from_snapshot не замерен")
+        else:
+            start = time.perf_counter()
+            with Snapshot(Path(tmp_dir, "snapshot_None.cw5")) as snapshot:
+                average = VacancyTable.from_snapshot(snapshot).average_salary()
+            print(f"VacancyTable.from_snapshot + средняя зарплата: {time.perf_counter() - start:.3f} с ({average})")
+
+        if args.no_db:
+            return
+
+        db = DBManager(**config())
+        reset_tables(db)
+        start = time.perf_counter()
+        with Snapshot(Path(tmp_dir, "snapshot_None.cw5")) as snapshot:
+            db.load_snapshot(snapshot)
+        copy_rate = args.rows / (time.perf_counter() - start)
+
+        reset_tables(db)
+        company_ids = list(db.insert_companies_bulk(employers))
+        start = time.perf_counter()
+        db.insert_vacancies_bulk(make_vacancies(args.rows, company_ids), db_batch_size)
+        insert_rate = args.rows / (time.perf_counter() - start)
+
+        db.drop_table("vacancies")
+        db.drop_table("companies")
+        db.close()
+        print(f"load_snapshot (COPY): {copy_rate:,.0f} строк/с")
+        print(f"insert_vacancies_bulk: {insert_rate:,.0f} строк/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Замер упорядочивания вакансий по зарплате: сортировка через сравнения Vacancy.__lt__ против сортировки
+по готовому ключу (sort_by_salary), top-k через кучу и объединение отсортированных вакансий каждого
+работодателя (merge_sorted: полностью и первые k вакансий) против сортировки всех вакансий заново.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_sort --count 1000000
+"""
+import argparse
+import gc
+import random
+import time
+from itertools import groupby, islice
+from typing import Any, Callable
+
+from benchmarks.datagen import CURRENCIES
+from src.vacancy import Vacancy
+from src.vacancy_order import (bottom_k, merge_sorted, salary_norm_key, salary_range_key, sort_by_salary,
+                               top_k)
+
+
+def make_vacancies(count: int, employers: int, seed: int = 0) -> list[Vacancy]:
+    """
+    Создает вакансии с разными вилками и валютами; примерно у каждой пятой вакансии зарплата не указана.
+    """
+    rng = random.Random(seed)
+    vacancies = []
+    for i in range(count):
+        if rng.random() < 0.2:
+            salary_from = salary_to = 0
+        else:
+            salary_from = rng.choice((0, rng.randrange(30_000, 300_000, 1000)))
+            salary_to = rng.choice((0, salary_from + rng.randrange(10_000, 200_000, 1000)))
+        vacancies.append(Vacancy.from_salary_range(str(i), f"Вакансия {i}", f"https://api.hh.ru/vacancies/{i}",
+                                                   salary_from, salary_to, "", i % employers,
+                                                   rng.choice(CURRENCIES), rng.random() < 0.3))
+    return vacancies
+
+
+def timed(name: str, func: Callable[[], Any]) -> Any:
+    """
+    Выполняет func и выводит время выполнения; мусор предыдущих замеров собирается до замера.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    print(f"{name}: {time.perf_counter() - start:.3f} с")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--employers", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=100)
+    args = parser.parse_args()
+
+    vacancies = timed(f"создание {args.count:,} вакансий", lambda: make_vacancies(args.count, args.employers))
+
+    by_lt = timed("sorted(vacancies, reverse=True) через Vacancy.__lt__",
+                  lambda: sorted(vacancies, reverse=True))
+    by_key = timed("sort_by_salary (ключ salary_norm)", lambda: sort_by_salary(vacancies))
+    timed("sort_by_salary (ключ (from, to))", lambda: sort_by_salary(vacancies, key=salary_range_key))
+    # порядок вакансий без зарплаты в конце совпадает с __lt__ (-1), а равные ключи - устойчивы в обоих случаях
+    assert [v.salary_norm for v in by_lt] == [v.salary_norm for v in by_key]
+
+    top = timed(f"top_k({args.k}) через кучу", lambda: top_k(vacancies, args.k))
+    timed(f"bottom_k({args.k}) через кучу", lambda: bottom_k(vacancies, args.k))
+    assert [v.salary_norm for v in top] == [v.salary_norm for v in by_key[:args.k]]
+
+    # вакансии, отсортированные по работодателям, как после получения с hh.ru
+    per_employer = [sort_by_salary(group) for _, group in
+                    groupby(sorted(vacancies, key=lambda v: v.company_id), key=lambda v: v.company_id)]
+    merged = timed(f"merge_sorted ({len(per_employer)} потоков)", lambda: list(merge_sorted(per_employer)))
+    # объединение ленивое: первые вакансии доступны без обработки остальных
+    timed(f"первые {args.k} вакансий merge_sorted", lambda: list(islice(merge_sorted(per_employer), args.k)))
+    timed("sort_by_salary всех вакансий заново",
+          lambda: sort_by_salary(vacancy for stream in per_employer for vacancy in stream))
+    assert [salary_norm_key(v) for v in merged] == [salary_norm_key(v) for v in by_key]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Генератор синтетических данных в формате API hh.ru: N работодателей по M вакансий.
+
+Данные детерминированы (зависят только от seed), поэтому результаты замеров сопоставимы между коммитами.
+"""
+import random
+from typing import Any
+
+POSITIONS = ("Python-разработчик", "Java developer", "Аналитик данных", "Тестировщик", "DevOps-инженер",
+             "Frontend developer", "Руководитель проекта", "Data Scientist", "Системный администратор")
+REQUIREMENTS = ("Опыт коммерческой разработки на <highlighttext>Python</highlighttext> от 3 лет",
+                "Знание SQL и PostgreSQL", "Опыт работы с Linux и Docker", "Английский язык не ниже B1",
+                "Понимание принципов REST API", "Опыт работы с Kubernetes")
+CITIES = ("Москва", "Санкт-Петербург", "Новосибирск", "Казань", "Екатеринбург")
+CURRENCIES = ("RUR", "RUR", "RUR", "RUR", "USD", "KZT")
+KEY_SKILLS = ("Python", "SQL", "PostgreSQL", "Docker", "Linux", "Git", "Kubernetes", "REST API", "Английский язык")
+EXPERIENCE = ("Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет")
+SCHEDULES = ("Полный день", "Удаленная работа", "Гибкий график", "Сменный график")
+
+
+def employer_id(index: int) -> str:
+    """
+    Возвращает id работодателя с номером index.
+    """
+    return str(1_000_000 + index)
+
+
+def generate_employer(index: int, base_url: str, open_vacancies: int) -> dict[str, Any]:
+    """
+    Возвращает ответ /employers/{id} для работодателя с номером index.
+
+    Args:
+        index(int): номер работодателя.
+        base_url(str): адрес сервера, на который указывают ссылки vacancies_url.
+        open_vacancies(int): число открытых вакансий работодателя.
+    """
+    emp_id = employer_id(index)
+    return {
+        "id": emp_id,
+        "name": f"Компания {index}",
+        "alternate_url": f"https://hh.ru/employer/{emp_id}",
+        "area": {"id": str(index % 5 + 1), "name": CITIES[index % len(CITIES)]},
+        "description": "<p>Описание компании.</p>" * 20,
+        "site_url": f"https://company{index}.example",
+        "vacancies_url": f"{base_url}/vacancies?employer_id={emp_id}",
+        "open_vacancies": open_vacancies,
+        "industries": [{"id": "7.540", "name": "Разработка программного обеспечения"}],
+    }
+
+
+def generate_employers_page(total: int, page: int, per_page: int, base_url: str, open_vacancies: int,
+                            area: str | None = None) -> dict[str, Any]:
+    """
+    Возвращает страницу поиска /employers среди total работодателей (при заданном area - только
+    работодателей этого региона).
+    """
+    indexes = [i for i in range(total) if area is None or str(i % 5 + 1) == area]
+    items = []
+    for i in indexes[page * per_page:(page + 1) * per_page]:
+        employer = generate_employer(i, base_url, open_vacancies)
+        items.append({"id": employer["id"], "name": employer["name"], "url": f"{base_url}/employers/{employer['id']}",
+                      "alternate_url": employer["alternate_url"], "vacancies_url": employer["vacancies_url"],
+                      "open_vacancies": employer["open_vacancies"]})
+    return {"items": items, "found": len(indexes), "pages": -(-len(indexes) // per_page), "page": page,
+            "per_page": per_page}
+
+
+def vacancy_id(emp_id: str, index: int) -> str:
+    """
+    Возвращает id вакансии с номером index работодателя emp_id.
+    """
+    return f"{emp_id}{index:06d}"
+
+
+def generate_vacancy(emp_id: str, index: int, seed: int = 0, base_url: str = "https://api.hh.ru") -> dict[str, Any]:
+    """
+    Возвращает элемент выдачи /vacancies для вакансии index работодателя emp_id;
+    ссылка url указывает на /vacancies/{id} сервера base_url.
+    """
+    rng = random.Random(f"{seed}:{emp_id}:{index}")
+    salary_from = rng.randrange(40_000, 300_000, 5_000)
+    vac_id = vacancy_id(emp_id, index)
+    return {
+        "id": vac_id,
+        "name": rng.choice(POSITIONS),
+        "url": f"{base_url}/vacancies/{vac_id}?host=hh.ru",
+        "alternate_url": f"https://hh.ru/vacancy/{vac_id}",
+        "salary": {"from": salary_from if rng.random() > 0.2 else None,
+                   "to": salary_from + rng.randrange(0, 150_000, 5_000) if rng.random() > 0.3 else None,
+                   "currency": rng.choice(CURRENCIES),
+                   "gross": rng.random() > 0.5},
+        "snippet": {"requirement": rng.choice(REQUIREMENTS),
+                    "responsibility": "Разработка и поддержка сервисов."},
+        "employer": {"id": emp_id},
+        "area": {"id": "1", "name": "Москва"},
+        "published_at": "2024-07-01T10:00:00+0300",
+    }
+
+
+def generate_vacancies_page(emp_id: str, total: int, page: int, per_page: int, seed: int = 0,
+                            base_url: str = "https://api.hh.ru") -> dict[str, Any]:
+    """
+    Возвращает страницу выдачи /vacancies работодателя с total вакансиями.
+    """
+    start = page * per_page
+    items = [generate_vacancy(emp_id, i, seed, base_url) for i in range(start, min(start + per_page, total))]
+    return {"items": items, "found": total, "pages": -(-total // per_page), "page": page, "per_page": per_page}
+
+
+def generate_vacancy_details(emp_id: str, index: int, seed: int = 0,
+                             base_url: str = "https://api.hh.ru") -> dict[str, Any]:
+    """
+    Возвращает ответ /vacancies/{id} для вакансии index работодателя emp_id: элемент выдачи,
+    дополненный описанием, ключевыми навыками, опытом и графиком работы.
+    """
+    rng = random.Random(f"{seed}:{emp_id}:{index}:details")
+    details = generate_vacancy(emp_id, index, seed, base_url)
+    details.update({
+        "description": "<p>Обязанности: разработка и поддержка сервисов.</p>" * rng.randint(5, 30),
+        "key_skills": [{"name": name} for name in rng.sample(KEY_SKILLS, rng.randint(0, 5))],
+        "experience": {"id": "exp", "name": rng.choice(EXPERIENCE)},
+        "schedule": {"id": "schedule", "name": rng.choice(SCHEDULES)},
+        "employment": {"id": "full", "name": "Полная занятость"},
+    })
+    return details
@@ -0,0 +1,156 @@
+"""
+Локальная замена api.hh.ru для замеров: /employers (поиск), /employers/{id}, /vacancies?employer_id=...
+и /vacancies/{id} с настраиваемыми задержкой, числом вакансий (и, следовательно, страниц), долей ошибок
+и лимитом частоты запросов.
+
+Пример:
+    with FakeHHServer(employers=100, vacancies_per_employer=500, latency=0.05) as server:
+        hh_api = Parser(f"{server.url}/employers", favorite_companies_id_hh=server.employer_ids)
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.datagen import (employer_id, generate_employer, generate_employers_page, generate_vacancies_page,
+                                generate_vacancy_details)
+
+
+class FakeHHServer:
+    """
+    Представляет HTTP-сервер, отдающий синтетические ответы в формате API hh.ru.
+    """
+
+    def __init__(self, employers: int, vacancies_per_employer: int, latency: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0, rate_limit: float | None = None) -> None:
+        """
+        Args:
+            employers(int): число работодателей.
+            vacancies_per_employer(int): число вакансий у каждого работодателя.
+            latency(float): задержка каждого ответа в секундах.
+            error_rate(float): доля ответов 503 на запросы страниц и подробностей вакансий.
+            seed(int): зерно генератора данных и ошибок.
+            rate_limit(float | None): лимит запросов в секунду; сверх лимита сервер отвечает 429
+            с заголовком Retry-After.
+        """
+        self.employers = employers
+        self.vacancies_per_employer = vacancies_per_employer
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.rate_limit = rate_limit
+        self.requests_count = 0
+        self.throttled_count = 0
+        self.bytes_sent = 0
+        self.__window_start = time.monotonic()
+        self.__window_requests = 0
+        self._lock = threading.Lock()
+        self.__rng = random.Random(seed)
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__make_handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def employer_ids(self) -> list[str]:
+        return [employer_id(i) for i in range(self.employers)]
+
+    def __enter__(self) -> 'FakeHHServer':
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def throttled(self) -> bool:
+        """
+        Учитывает запрос в текущем секундном окне и проверяет, превышен ли лимит частоты.
+        """
+        if self.rate_limit is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now - self.__window_start >= 1.0:
+                self.__window_start, self.__window_requests = now, 0
+            self.__window_requests += 1
+            if self.__window_requests > self.rate_limit:
+                self.throttled_count += 1
+                return True
+            return False
+
+    def respond(self, path: str, query: dict[str, list[str]]) -> tuple[int, Any]:
+        """
+        Возвращает код ответа и тело для запроса path с параметрами query.
+        """
+        if self.throttled():
+            return 429, {"errors": [{"type": "too_many_requests"}]}
+
+        segments = path.strip("/").split("/")
+        if segments[0] == "employers" and len(segments) == 1:
+            page = int(query.get("page", ["0"])[0])
+            per_page = int(query.get("per_page", ["20"])[0])
+            area = query.get("area", [None])[0]
+            return 200, generate_employers_page(self.employers, page, per_page, self.url,
+                                                self.vacancies_per_employer, area)
+
+        if segments[0] == "employers" and len(segments) == 2:
+            index = int(segments[1]) - 1_000_000
+            if not 0 <= index < self.employers:
+                return 404, {"errors": [{"type": "not_found"}]}
+            return 200, generate_employer(index, self.url, self.vacancies_per_employer)
+
+        if segments[0] == "vacancies" and len(segments) <= 2:
+            with self._lock:
+                failed = self.__rng.random() < self.error_rate
+            if failed:
+                return 503, {"errors": [{"type": "service_unavailable"}]}
+
+            if len(segments) == 2:
+                # id вакансии - id работодателя и 6 цифр номера вакансии
+                emp_id, index = segments[1][:-6], int(segments[1][-6:])
+                if not (0 <= int(emp_id) - 1_000_000 < self.employers and index < self.vacancies_per_employer):
+                    return 404, {"errors": [{"type": "not_found"}]}
+                return 200, generate_vacancy_details(emp_id, index, self.seed, self.url)
+
+            page = int(query.get("page", ["0"])[0])
+            per_page = int(query.get("per_page", ["20"])[0])
+            emp_id = query.get("employer_id", [""])[0]
+            return 200, generate_vacancies_page(emp_id, self.vacancies_per_employer, page, per_page, self.seed,
+                                                self.url)
+
+        return 404, {"errors": [{"type": "not_found"}]}
+
+    def __make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                parts = urlsplit(self.path)
+                status, payload = server.respond(parts.path, parse_qs(parts.query))
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                with server._lock:
+                    server.requests_count += 1
+                    server.bytes_sent += len(body)
+
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
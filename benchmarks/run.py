@@ -0,0 +1,208 @@
+"""
+Сквозной замер загрузки данных и запросов на локальной замене api.hh.ru.
+
+Замеряются этапы загрузки (время, число объектов, объектов в секунду, пиковая память),
+полная загрузка через main.load_data (с конвейером и без) и задержка каждого читающего метода DBManager.
+Результаты записываются в JSON (по умолчанию benchmarks/results/<коммит>.json), два файла
+можно сравнить ключом --compare.
+
+Запуск из корня проекта (для этапов с БД нужна БД из data/database.ini, таблицы будут пересозданы):
+    python -m benchmarks.run --employers 50 --vacancies 400 --latency 0.02
+    python -m benchmarks.run --no-db
+    python -m benchmarks.run --compare benchmarks/results/aaaaaaa.json benchmarks/results/bbbbbbb.json
+"""
+import argparse
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.bench_insert import reset_tables
+from benchmarks.fake_hh import FakeHHServer
+from config import ROOT_PATH, config, db_batch_size, ingest_queue_size
+from main import load_data
+from src.api import Parser
+from src.dbmanager import DBManager
+from src.employer import Employer
+
+RESULTS_PATH = ROOT_PATH.joinpath("benchmarks", "results")
+
+
+def git_revision() -> str:
+    """
+    Возвращает короткий хэш текущего коммита (или "unknown" вне git).
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_PATH, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure_stage(results: dict[str, Any], name: str, func: Callable[[], Any],
+                  count: Callable[[Any], int] = len, trace_memory: bool = False) -> Any:
+    """
+    Выполняет этап, записывает в results время, число объектов, пропускную способность
+    и (при trace_memory) пиковую выделенную память, и возвращает результат этапа.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - start
+    stage: dict[str, Any] = {"seconds": round(seconds, 4)}
+    if trace_memory:
+        stage["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    items = count(value)
+    stage["items"] = items
+    stage["items_per_second"] = round(items / seconds, 1) if seconds else None
+    results["stages"][name] = stage
+    print(f"{name:<24}{seconds:>10.3f} с{items:>10}{stage['items_per_second'] or 0:>14,.0f} /с")
+    return value
+
+
+def measure_queries(db: DBManager, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Замеряет задержку читающих методов DBManager в обход кэша результатов.
+    """
+    queries: dict[str, Callable[[], Any]] = {
+        "get_companies_and_vacancies_count": lambda: db.get_companies_and_vacancies_count(use_cache=False),
+        "get_all_vacancies": lambda: db.get_all_vacancies(use_cache=False),
+        "get_avg_salary": lambda: db.get_avg_salary(use_cache=False),
+        "get_salary_stats": lambda: db.get_salary_stats(use_cache=False),
+        "get_vacancies_with_higher_salary": lambda: db.get_vacancies_with_higher_salary(use_cache=False),
+        "get_vacancies_with_keyword": lambda: db.get_vacancies_with_keyword("Python", use_cache=False),
+        "search_vacancies_top50": lambda: db.search_vacancies("разработчик", 50, use_cache=False),
+    }
+    results: dict[str, dict[str, float]] = {}
+    for name, query in queries.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - start)
+        results[name] = {"median_ms": round(statistics.median(timings) * 1000, 3),
+                         "min_ms": round(min(timings) * 1000, 3),
+                         "max_ms": round(max(timings) * 1000, 3)}
+        print(f"{name:<36}{results[name]['median_ms']:>10.2f} мс")
+    return results
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Выполняет все замеры и возвращает результаты.
+    """
+    results: dict[str, Any] = {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "params": {key: value for key, value in vars(args).items() if key not in ("compare", "output")},
+        "stages": {},
+    }
+
+    server_params = dict(employers=args.employers, vacancies_per_employer=args.vacancies,
+                         latency=args.latency, error_rate=args.error_rate, seed=args.seed,
+                         rate_limit=args.rate_limit)
+    with FakeHHServer(**server_params) as server:
+        hh_api = Parser(f"{server.url}/employers", max_workers=args.workers,
+                        favorite_companies_id_hh=server.employer_ids)
+
+        employers_data = measure_stage(results, "fetch_employers", hh_api.get_employers)
+        employers = measure_stage(results, "parse_employers",
+                                  lambda: Employer.cast_to_object_list(employers_data))
+
+        db: DBManager | None = None
+        if args.no_db:
+            vacancies_urls = {i: employer.vacancies_url for i, employer in enumerate(employers, start=1)}
+        else:
+            db = DBManager(**config())
+            reset_tables(db)
+            vacancies_urls = measure_stage(results, "insert_companies",
+                                           lambda: db.insert_companies_bulk(employers, db_batch_size))
+
+        vacancies = measure_stage(results, "fetch_parse_vacancies",
+                                  lambda: list(hh_api.iter_vacancies(vacancies_urls)),
+                                  trace_memory=args.memory)
+
+        if db is not None:
+            measure_stage(results, "insert_vacancies",
+                          lambda: db.insert_vacancies_bulk(vacancies, db_batch_size), count=lambda inserted: inserted)
+
+            # сквозная загрузка так же, как при запуске программы, на пустых таблицах:
+            # через конвейер и последовательно (получение страниц ждет записи пакета)
+            for stage, queue_size in (("end_to_end_ingest", ingest_queue_size), ("end_to_end_sequential", 0)):
+                reset_tables(db)
+                measure_stage(results, stage, lambda: load_data(db, hh_api, incremental=False, queue_size=queue_size),
+                              count=lambda _: sum(count for _, count in
+                                                  db.get_companies_and_vacancies_count(use_cache=False)))
+            results["queries"] = measure_queries(db, args.repeat)
+
+            db.drop_table("vacancies")
+            db.drop_table("companies")
+            db.close()
+
+        results["http"] = {"requests": server.requests_count, "throttled": server.throttled_count,
+                           "bytes": server.bytes_sent}
+
+    # ru_maxrss в Linux - в килобайтах
+    results["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return results
+
+
+def compare(old_path: Path, new_path: Path) -> None:
+    """
+    Печатает изменение времени этапов и задержки запросов между двумя файлами результатов.
+    """
+    old = json.loads(old_path.read_text(encoding="utf-8"))
+    new = json.loads(new_path.read_text(encoding="utf-8"))
+    print(f"{old['revision']} -> {new['revision']}")
+
+    rows: list[tuple[str, float, float]] = []
+    for name, stage in new["stages"].items():
+        if name in old["stages"]:
+            rows.append((name, old["stages"][name]["seconds"] * 1000, stage["seconds"] * 1000))
+    for name, query in new.get("queries", {}).items():
+        if name in old.get("queries", {}):
+            rows.append((name, old["queries"][name]["median_ms"], query["median_ms"]))
+
+    for name, before, after in rows:
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<36}{before:>12.2f} мс{after:>12.2f} мс{change:>+9.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employers", type=int, default=50)
+    parser.add_argument("--vacancies", type=int, default=400, help="вакансий у каждого работодателя")
+    parser.add_argument("--latency", type=float, default=0.02, help="задержка ответа сервера, с")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="доля ответов 503 на страницы вакансий")
+    parser.add_argument("--rate-limit", type=float, help="лимит запросов в секунду (сверх лимита - 429)")
+    parser.add_argument("--workers", type=int, default=8, help="одновременных запросов Parser")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="повторов каждого запроса к БД")
+    parser.add_argument("--memory", action="store_true", help="замерять пиковую память этапов (медленнее)")
+    parser.add_argument("--no-db", action="store_true", help="только сетевые этапы, без БД")
+    parser.add_argument("--output", type=Path, help="файл результатов")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = run(args)
+    output = args.output or RESULTS_PATH.joinpath(f"{results['revision']}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Результаты записаны в {output}")
+
+
+if __name__ == "__main__":
+    main()
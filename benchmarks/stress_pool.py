@@ -0,0 +1,78 @@
+"""
+Нагрузочная проверка PooledDBManager: параллельные читатели во время массовой вставки вакансий.
+
+Запуск из корня проекта (нужна БД из data/database.ini, таблицы companies и vacancies будут пересозданы):
+    python -m benchmarks.stress_pool --rows 200000 --readers 8
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_insert import make_employers, make_vacancies, reset_tables
+from config import config
+from src.dbmanager import PooledDBManager
+
+
+def read_until(db: PooledDBManager, stop: threading.Event) -> tuple[list[float], list[Exception]]:
+    """
+    Вызывает читающие методы по кругу, пока не выставлен stop; возвращает задержки и ошибки.
+    """
+    methods = (db.get_companies_and_vacancies_count, db.get_avg_salary,
+               db.get_vacancies_with_higher_salary, lambda: db.get_vacancies_with_keyword("Python"))
+    latencies: list[float] = []
+    errors: list[Exception] = []
+    i = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            methods[i % len(methods)]()
+        except Exception as e:
+            errors.append(e)
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    return latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--employers", type=int, default=100)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    db = PooledDBManager(**config(), min_size=1, max_size=args.readers + 1)
+    reset_tables(db)
+    company_ids = list(db.insert_companies_bulk(make_employers(args.employers)))
+    vacancies = make_vacancies(args.rows, company_ids)
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=args.readers) as executor:
+        readers = [executor.submit(read_until, db, stop) for _ in range(args.readers)]
+        start = time.perf_counter()
+        inserted = db.insert_vacancies_bulk(vacancies)
+        insert_seconds = time.perf_counter() - start
+        stop.set()
+        results = [reader.result() for reader in readers]
+
+    latencies = [latency for reader_latencies, _ in results for latency in reader_latencies]
+    errors = [error for _, reader_errors in results for error in reader_errors]
+
+    db.drop_table("vacancies")
+    db.drop_table("companies")
+    db.close()
+
+    print(f"Вставлено {inserted} строк за {insert_seconds:.2f} с ({inserted / insert_seconds:,.0f} строк/с)")
+    print(f"Запросов читателей: {len(latencies)}, ошибок: {len(errors)}")
+    if latencies:
+        print(f"Задержка чтения: медиана {statistics.median(latencies) * 1000:.1f} мс, "
+              f"максимум {max(latencies) * 1000:.1f} мс")
+    for error in errors[:5]:
+        print(f"  {type(error).__name__}: {error}")
+    if errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,12 @@ ROOT_PATH = Path(__file__).parent
 
 DATABASE_INI_PATH = ROOT_PATH.joinpath("data", "database.ini")
 
+# СУБД: "postgresql" (сервер PostgreSQL, DBManager) или "sqlite" (встроенная БД, SQLiteDBManager);
+# переопределяется параметром backend в секции [database] файла database.ini
+db_backend = "postgresql"
+# Файл БД SQLite, если в database.ini нет секции [sqlite] с параметром path
+SQLITE_DB_PATH = ROOT_PATH.joinpath("data", "vacancies.sqlite3")
+
 favorite_companies_id_hh = ['3529', '78638', '906557', '9498112', '4649269', '5390761',
                             '6189', '3125', '26624', '15478', '2180', '1057',
                             '3776', '2733062', '1740', '87021', '4233', '740']
@@ -15,18 +21,119 @@ params_for_getting_employers = {"text": "",
                                 "only_with_vacancies": "true",
                                 "sort_by": "by_name"}
 
+# Поиск работодателей (/employers с параметрами params_for_getting_employers) вместо списка
+# favorite_companies_id_hh: id регионов hh.ru (каждый регион - отдельный поисковый запрос, пусто - без фильтра)
+# и отрасли. Один поисковый запрос hh.ru отдает не больше discovery_max_results работодателей, поэтому
+# для обхода тысяч работодателей выдачу делят по регионам.
+employer_discovery = False
+discovery_areas: list[str] = []
+discovery_industry: str | None = None
+discovery_max_results = 2000
+# Состояние обхода поиска: прерванный обход продолжается с недостающих страниц
+DISCOVERY_CHECKPOINT_PATH = ROOT_PATH.joinpath("data", "discovery_checkpoint.json")
+
 params_for_getting_vacancies = {"text": "",
                                 "page": 0,
                                 "per_page": 100,
                                 "only_with_salary": "true"}
 
+# Приведение зарплат к одной валюте: курс - стоимость единицы валюты (код hh.ru) в рублях; зарплата вакансии -
+# середина вилки (или единственная указанная граница) в salary_base_currency, зарплата до вычета налога
+# (gross) умножается на salary_net_ratio. Зарплата в валюте, которой нет в таблице, не учитывается.
+salary_base_currency = "RUR"
+currency_rates: dict[str, float] = {"RUR": 1.0, "RUB": 1.0, "USD": 90.0, "EUR": 98.0, "KZT": 0.19,
+                                    "BYR": 28.0, "UZS": 0.0072, "KGS": 1.03, "AZN": 53.0, "GEL": 33.0}
+salary_net_ratio = 0.87
+
+# Максимальное число одновременных запросов к API при получении вакансий работодателей
+max_workers_for_getting_vacancies = 8
+
+# Ограничение частоты запросов к API hh.ru и повтор запросов при ответах 429/5xx и сетевых ошибках
+hh_api_max_rps = 10
+hh_api_burst = 10
+hh_api_max_retries = 5
+# задержка перед повтором: случайная в [0, base * 2^попытка] секунд, но не больше max
+hh_api_backoff_base = 0.5
+hh_api_backoff_max = 30
+# Retry-After ждем полностью, но не дольше этого числа секунд: при большем значении запрос не повторяется
+# и завершается ошибкой (requests.HTTPError)
+hh_api_retry_after_max = 300
+# Тайм-аут запроса к API в секундах: (установка соединения, ожидание ответа); запрос, превысивший тайм-аут,
+# повторяется как при сетевой ошибке
+hh_api_timeout = (5, 30)
+
+# Размер пакета строк при массовой вставке в БД
+db_batch_size = 1000
+
+# Конвейер загрузки: число пакетов вакансий, ожидающих записи в БД, пока продолжается получение
+# страниц с hh.ru (0 - без конвейера: страницы получаются, только когда запись запрашивает следующие)
+ingest_queue_size = 8
+
+# Подробности вакансий (описание, ключевые навыки, опыт, график) - отдельный запрос /vacancies/{id}
+# на каждую вакансию: получать ли их после загрузки и сколько вакансий обрабатывать за запуск
+# (None - все ожидающие; остальные будут обработаны при следующих запусках)
+enrich_vacancies = False
+enrich_limit: int | None = None
+
+# Размеры пула соединений PooledDBManager
+db_pool_min_size = 1
+db_pool_max_size = 10
+
+# Число строк, получаемых серверным курсором за одно обращение при потоковом чтении
+db_stream_itersize = 2000
+
+# Число строк на странице постраничных запросов (get_*_page) по умолчанию
+db_page_size = 50
+
+# Максимальное число результатов читающих запросов в кэше DBManager (0 - кэш отключен)
+db_query_cache_size = 128
+
+# Инкрементальная синхронизация: при запуске обновляются только изменившиеся строки,
+# а при завершении программы таблицы не удаляются
+incremental_sync = True
+
+# Снимок данных (companies и vacancies) для восстановления БД и аналитики без обращения к hh.ru
+SNAPSHOT_PATH = ROOT_PATH.joinpath("data", "snapshot.cw5")
+
+# Разбор ответов API hh.ru: "msgspec" - типизированный разбор сразу в структуры (требует пакет msgspec),
+# "json" - стандартная библиотека, "auto" - msgspec, если он установлен
+json_decoder = "auto"
+
+# Кэш ответов API hh.ru на диске
+HTTP_CACHE_PATH = ROOT_PATH.joinpath("data", "http_cache")
+http_cache_max_size_bytes = 200 * 1024 * 1024
+# Время жизни ответа в кэше (в секундах) по первому сегменту пути запроса;
+# после истечения ответ перепроверяется условным запросом (ETag / Last-Modified)
+http_cache_ttl = {"employers": 24 * 60 * 60,
+                  "vacancies": 15 * 60}
+
+# Метрики HTTP-запросов и SQL-запросов: сводка выводится после загрузки данных;
+# если задан путь, метрики дополнительно записываются в файл в формате "prometheus" или "json"
+metrics_enabled = False
+METRICS_OUTPUT_PATH: Path | None = None
+metrics_output_format = "prometheus"
+
+
+def get_db_backend(filename=DATABASE_INI_PATH) -> str:
+    """
+    Возвращает выбранную СУБД: параметр backend секции [database] файла database.ini или db_backend.
+    Args:
+         filename(Path): конфигурационный файл БД
+    Returns:
+        str: "postgresql" или "sqlite".
+    """
+    parser = ConfigParser()
+    parser.read(filename)
+    return parser.get("database", "backend", fallback=db_backend)
+
 
-def config(filename=DATABASE_INI_PATH, section="postgresql") -> dict[str, str]:
+def config(filename=DATABASE_INI_PATH, section: str | None = None) -> dict[str, str]:
     """
     Конфигурируем БД из файла по ссылке (считываем конфигурационный файл).
     Args:
-         filename(Path): конфигурационные данные БД postgresql
-         section(str): секция в конфигурационном файле
+         filename(Path): конфигурационные данные БД
+         section(str | None): секция в конфигурационном файле, по умолчанию - секция выбранной СУБД
+         (см. get_db_backend)
     Returns:
         db(dict): словарь с параметрами соединения, которые будут передаваться в DBManager() в дальнейшем.
     """
@@ -35,13 +142,17 @@ def config(filename=DATABASE_INI_PATH, section="postgresql") -> dict[str, str]:
     # read config file
     parser.read(filename)
 
-    # get section, default to postgresql
+    # get section, default to the selected backend
+    if section is None:
+        section = get_db_backend(filename)
 
     db_params = {}
     if parser.has_section(section):
         params = parser.items(section)
         for param in params:
             db_params[param[0]] = param[1]
+    elif section == "sqlite":
+        db_params["path"] = str(SQLITE_DB_PATH)
     else:
         raise Exception(f'Section {section} is not found in the {filename} file.')
     return db_params
@@ -1,11 +1,186 @@
-from config import config
-from src.dbmanager import DBManager
+import argparse
+import csv
+import json
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable, TextIO
+
+from config import (DISCOVERY_CHECKPOINT_PATH, HTTP_CACHE_PATH, METRICS_OUTPUT_PATH, SNAPSHOT_PATH, db_batch_size,
+                    db_page_size, discovery_areas, discovery_industry, employer_discovery, enrich_limit,
+                    enrich_vacancies, http_cache_max_size_bytes, incremental_sync, ingest_queue_size,
+                    metrics_output_format)
+from src.cache import DiskResponseCache
+from src.discovery import DiscoveryCheckpoint
+from src.metrics import metrics
+from src.dbmanager import AbstractDBManager, Page, create_db_manager
 from src.api import Parser
+from src.pipeline import IngestPipeline
+from src.snapshot import Snapshot, export_snapshot
 from src.employer import Employer
 from src.vacancy import Vacancy
 
 
-def interact_with_user():
+def load_data(db: AbstractDBManager, hh_api: Parser, incremental: bool,
+              queue_size: int = ingest_queue_size, employer_ids: list[str] | None = None) -> None:
+    """
+    Загружает работодателей и их вакансии с hh.ru в БД.
+
+    Вакансии передаются в БД через конвейер (IngestPipeline): страницы получаются в отдельном потоке,
+    пока предыдущие пакеты записываются в БД.
+
+    Args:
+        db(AbstractDBManager): менеджер БД.
+        hh_api(Parser): клиент API hh.ru.
+        incremental(bool): синхронизировать изменения (upsert и удаление снятых вакансий)
+        вместо вставки всех строк.
+        queue_size(int): число пакетов вакансий в очереди конвейера; 0 - без конвейера.
+        employer_ids(list[str] | None): id работодателей, по умолчанию - favorite_companies_id_hh.
+    """
+    employers_list: list[Employer] = hh_api.get_employer_objects(employer_ids)
+
+    if incremental:
+        data_id_and_vacancies_url = db.sync_companies(employers_list, db_batch_size)
+    else:
+        data_id_and_vacancies_url = db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(
+            employers_list, 'companies', batch_size=db_batch_size)
+
+    # вакансии записываются пакетами по мере получения страниц, без сборки полного списка
+    vacancies_data: Iterable[Vacancy] = hh_api.iter_vacancies(data_id_and_vacancies_url)
+    pipeline = IngestPipeline(vacancies_data, db_batch_size, queue_size) if queue_size else None
+    try:
+        if incremental:
+            # удаляются снятые вакансии только тех работодателей, все страницы которых получены без ошибок
+            stats = db.sync_vacancies(pipeline or vacancies_data, hh_api.completed_companies, db_batch_size)
+            print(f"Вакансии синхронизированы: добавлено {stats['inserted']}, обновлено {stats['updated']}, "
+                  f"без изменений {stats['unchanged']}, удалено {stats['deleted']}.")
+        else:
+            db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(pipeline or vacancies_data,
+                                                                                    'vacancies',
+                                                                                    batch_size=db_batch_size)
+    finally:
+        # при ошибке записи останавливаем получение страниц
+        if pipeline is not None:
+            pipeline.close()
+
+
+def enrich_data(db: AbstractDBManager, hh_api: Parser, limit: int | None = enrich_limit,
+                queue_size: int = ingest_queue_size) -> int:
+    """
+    Получает с hh.ru подробности вакансий, у которых их еще нет или которые изменились
+    с последнего получения, и записывает их в БД.
+
+    Подробности запрашиваются параллельно (Parser.iter_vacancy_details) и передаются в БД через конвейер
+    пакетами; каждый пакет фиксируется отдельно, поэтому прерванный запуск продолжается со следующих
+    вакансий. Число вакансий и скорость получения выводятся в stderr.
+
+    Args:
+        db(AbstractDBManager): менеджер БД.
+        hh_api(Parser): клиент API hh.ru.
+        limit(int | None): максимальное число вакансий за запуск, None - все ожидающие.
+        queue_size(int): число пакетов в очереди конвейера; 0 - без конвейера.
+    Returns:
+        int: количество вакансий, получивших подробности.
+    """
+    pending = db.get_vacancies_to_enrich(limit)
+    started = time.perf_counter()
+
+    details = hh_api.iter_vacancy_details(pending)
+    pipeline = IngestPipeline(details, db_batch_size, queue_size) if queue_size else None
+    try:
+        updated = db.update_vacancy_details(pipeline or details, db_batch_size)
+    finally:
+        if pipeline is not None:
+            pipeline.close()
+
+    elapsed = time.perf_counter() - started
+    rate = updated / elapsed if elapsed else 0.0
+    print(f"Подробности получены для {updated} из {len(pending)} вакансий за {elapsed:.1f} с "
+          f"({rate:.1f} вакансий/с).", file=sys.stderr)
+    return updated
+
+
+def print_rows(rows: Iterable[tuple[Any, ...]]) -> None:
+    """
+    Выводит строки результата запроса по одной, по мере их получения из БД.
+
+    Args:
+        rows(Iterable[tuple[Any, ...]]): строки результата запроса.
+    """
+    printed = 0
+    for row in rows:
+        print(row)
+        printed += 1
+
+    if not printed:
+        print("Вакансии не найдены")
+
+
+def discover_employers(hh_api: Parser, checkpoint: DiscoveryCheckpoint, areas: list[str] = discovery_areas,
+                       industry: str | None = discovery_industry) -> list[str]:
+    """
+    Находит работодателей поиском hh.ru, продолжая прерванный обход из checkpoint, и выводит их число в stderr.
+
+    Args:
+        hh_api(Parser): клиент API hh.ru.
+        checkpoint(DiscoveryCheckpoint): состояние обхода.
+        areas(list[str]): id регионов hh.ru, пусто - без фильтра по региону.
+        industry(str | None): id отрасли hh.ru.
+    Returns:
+        list[str]: id найденных работодателей.
+    """
+    employer_ids = hh_api.discover_employer_ids(areas, industry, checkpoint)
+    print(f"Найдено работодателей: {len(employer_ids)}.", file=sys.stderr)
+    if not checkpoint.is_complete():
+        print(f"Часть страниц поиска работодателей не получена, они будут запрошены при следующем запуске "
+              f"(состояние обхода: {checkpoint.path}).", file=sys.stderr)
+    return employer_ids
+
+
+def ingest(db: AbstractDBManager, incremental: bool, enrich: bool = enrich_vacancies,
+           discover: bool = employer_discovery, areas: list[str] = discovery_areas,
+           industry: str | None = discovery_industry) -> None:
+    """
+    Загружает данные с hh.ru в БД через кэш ответов и выводит статистику кэша и метрики.
+
+    Args:
+        db(AbstractDBManager): менеджер БД с созданными таблицами.
+        incremental(bool): синхронизировать изменения вместо вставки всех строк.
+        enrich(bool): после загрузки получить подробности новых и изменившихся вакансий.
+        discover(bool): загрузить работодателей, найденных поиском hh.ru, вместо favorite_companies_id_hh;
+        состояние обхода удаляется после загрузки, если все страницы поиска получены.
+        areas(list[str]): id регионов hh.ru для поиска работодателей.
+        industry(str | None): id отрасли hh.ru для поиска работодателей.
+    """
+    cache = DiskResponseCache(HTTP_CACHE_PATH, http_cache_max_size_bytes)
+    hh_api = Parser("https://api.hh.ru/employers", cache=cache)
+
+    checkpoint = DiscoveryCheckpoint(DISCOVERY_CHECKPOINT_PATH) if discover else None
+    employer_ids = discover_employers(hh_api, checkpoint, areas, industry) if checkpoint is not None else None
+    load_data(db, hh_api, incremental, employer_ids=employer_ids)
+    if checkpoint is not None and checkpoint.is_complete():
+        checkpoint.clear()
+    if enrich:
+        enrich_data(db, hh_api)
+    print(f"Кэш ответов hh.ru: {cache.stats}", file=sys.stderr)
+    report_metrics()
+
+
+def report_metrics() -> None:
+    """
+    Выводит сводку метрик загрузки и, если задан METRICS_OUTPUT_PATH, записывает метрики в файл.
+    """
+    if not metrics.enabled:
+        return
+
+    print(metrics.summary(), file=sys.stderr)
+    if METRICS_OUTPUT_PATH is not None:
+        text = metrics.to_json() if metrics_output_format == "json" else metrics.to_prometheus()
+        METRICS_OUTPUT_PATH.write_text(text, encoding="utf-8")
+
+
+def interact_with_user(incremental: bool = incremental_sync):
     """
         Функция для взаимодействия с пользователем и управления работой программы.
 
@@ -15,24 +190,20 @@ def interact_with_user():
          на вакансию
         - Получение средней зарплаты по вакансиям.
         - Получение списка всех вакансий, у которых зарплата выше средней по всем вакансиям
-        - Получение списка всех вакансий, в названии которых содержится ключевое слово
+        - Поиск вакансий по ключевым словам в названии и требованиях, от наиболее релевантных
         - Завершение программы
 
         Пользователь может выбирать действие, вводя соответствующий номер, и программа будет
         выполнять выбранное действие.
+
+        Args:
+            incremental(bool): синхронизировать данные с hh.ru вместо полной перезагрузки и
+            сохранять таблицы при завершении программы.
         """
-    params = config()
-    db = DBManager(**params)
+    db = create_db_manager()
     db.create_table()
 
-    hh_api = Parser("https://api.hh.ru/employers")
-
-    employers_data: list[dict] = hh_api.get_employers()
-    employers_list: list[Employer] = Employer.cast_to_object_list(employers_data)
-    data_id_and_vacancies_url = db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(employers_list,
-                                                                                                        'companies')
-    vacancies_data: list[Vacancy] = hh_api.get_vacancies(data_id_and_vacancies_url)
-    db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(vacancies_data, 'vacancies')
+    ingest(db, incremental)
 
     while True:
         print("\nВыберите действие:")
@@ -41,7 +212,7 @@ def interact_with_user():
               "названия вакансии и зарплаты и ссылки на вакансию.")
         print("3. Получить среднюю зарплату по вакансиям.")
         print("4. Получить список всех вакансий, у которых зарплата выше средней по всем вакансиям.")
-        print("5. Получить список всех вакансий, в названии которых содержится ключевое слово.")
+        print("5. Найти вакансии по ключевым словам в названии и требованиях (от наиболее релевантных).")
         print("6. Завершить программу.")
 
         user_choice = input("Введите номер действия: ")
@@ -49,17 +220,19 @@ def interact_with_user():
         if user_choice == "1":
             print(db.get_companies_and_vacancies_count())
         elif user_choice == "2":
-            print(db.get_all_vacancies())
+            print_rows(db.iter_all_vacancies())
         elif user_choice == "3":
             print(db.get_avg_salary())
+            print_rows(db.get_salary_stats())
         elif user_choice == "4":
-            print(db.get_vacancies_with_higher_salary())
+            print_rows(db.iter_vacancies_with_higher_salary())
         elif user_choice == "5":
-            search_query = input("Введите ключевое слово: ")
-            print(db.get_vacancies_with_keyword(search_query))
+            search_query = input("Введите ключевые слова: ")
+            print_rows(db.iter_vacancies_with_keyword(search_query))
         elif user_choice == "6":
-            db.drop_table("vacancies")
-            db.drop_table("companies")
+            if not incremental:
+                db.drop_table("vacancies")
+                db.drop_table("companies")
             print("Программа завершена.")
             break
 
@@ -67,5 +240,203 @@ def interact_with_user():
             print("Некорректный ввод. Повторите попытку.")
 
 
+VACANCY_COLUMNS = ("company", "vacancy", "salary_min", "salary_max", "url")
+
+QUERY_COMMANDS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "companies": ("Список компаний и количество вакансий у каждой компании.", ("company", "vacancies_count")),
+    "vacancies": ("Список всех вакансий.", VACANCY_COLUMNS),
+    "avg": ("Средняя зарплата по вакансиям.", ("avg_salary",)),
+    "stats": ("Статистика по зарплатам: по всем вакансиям и по каждой компании.",
+              ("company", "vacancies_count", "avg_salary", "median_salary", "min_salary", "max_salary")),
+    "above-avg": ("Вакансии с зарплатой выше средней.", VACANCY_COLUMNS),
+    "search": ("Поиск вакансий по ключевым словам в названии и требованиях.", VACANCY_COLUMNS),
+    "salary": ("Вакансии с зарплатой (в базовой валюте) в заданных границах, от большей к меньшей.",
+               VACANCY_COLUMNS + ("salary",)),
+}
+
+
+def query_rows(db: AbstractDBManager, args: argparse.Namespace) -> Iterable[tuple[Any, ...]]:
+    """
+    Возвращает строки результата запроса для подкоманды args.command; списки читаются потоково,
+    а с --limit или --after - постранично (курсор следующей страницы выводится в stderr).
+    """
+    if args.command == "companies":
+        return db.get_companies_and_vacancies_count()
+    if args.command == "avg":
+        return [(db.get_avg_salary(),)]
+    if args.command == "stats":
+        return db.get_salary_stats()
+    if args.command == "salary":
+        return db.get_vacancies_by_salary(args.salary_from, args.salary_to, args.limit)
+
+    limit = db_page_size if args.limit is None else args.limit
+    if args.command == "vacancies":
+        if args.limit is None and args.after is None and args.order == "id":
+            return db.iter_all_vacancies()
+        return page_rows(db.get_vacancies_page(args.after, limit, args.order))
+    paged = args.limit is not None or args.after is not None
+    if args.command == "above-avg":
+        if not paged:
+            return db.iter_vacancies_with_higher_salary()
+        return page_rows(db.get_vacancies_with_higher_salary_page(args.after, limit))
+    if not paged:
+        return db.iter_vacancies_with_keyword(args.query)
+    return page_rows(db.get_vacancies_with_keyword_page(args.query, args.after, limit))
+
+
+def page_rows(page: Page) -> list[tuple[Any, ...]]:
+    """
+    Возвращает строки страницы и выводит в stderr параметр для получения следующей страницы.
+    """
+    if page.next_after is not None:
+        # через "=", так как курсор может начинаться с "-"
+        print(f"Следующая страница: --after={page.next_after}", file=sys.stderr)
+    return page.rows
+
+
+def write_rows(rows: Iterable[tuple[Any, ...]], columns: tuple[str, ...], output_format: str,
+               stream: TextIO | None = None) -> None:
+    """
+    Записывает строки в поток по мере их получения в формате JSON Lines или CSV (с заголовком).
+
+    Args:
+        rows(Iterable[tuple[Any, ...]]): строки результата запроса.
+        columns(tuple[str, ...]): имена столбцов.
+        output_format(str): "jsonl" или "csv".
+        stream(TextIO | None): поток вывода, по умолчанию - текущий sys.stdout.
+    """
+    stream = stream if stream is not None else sys.stdout
+    if output_format == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return
+
+    for row in rows:
+        stream.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_default) + "\n")
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Приводит значения из БД, не поддерживаемые json (Decimal), к числам.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Создает разбор аргументов командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        description="Вакансии работодателей с hh.ru. Без подкоманды запускается интерактивное меню.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    ingest_parser = subparsers.add_parser("ingest", help="Полная перезагрузка данных с hh.ru (таблицы пересоздаются).")
+    sync_parser = subparsers.add_parser("sync", help="Инкрементальная синхронизация данных с hh.ru.")
+    for load_parser in (ingest_parser, sync_parser):
+        load_parser.add_argument("--discover", action="store_true", default=employer_discovery,
+                                 help="найти работодателей поиском hh.ru вместо списка favorite_companies_id_hh "
+                                      "(прерванный поиск продолжается при следующем запуске)")
+        load_parser.add_argument("--area", action="append", dest="areas", default=None,
+                                 help="id региона hh.ru для поиска работодателей (можно указать несколько раз)")
+        load_parser.add_argument("--industry", default=discovery_industry,
+                                 help="id отрасли hh.ru для поиска работодателей")
+    enrich_parser = subparsers.add_parser(
+        "enrich", help="Получение подробностей (описание, навыки, опыт, график) новых и изменившихся вакансий.")
+    enrich_parser.add_argument("--limit", type=int, default=enrich_limit,
+                               help="обработать не больше N вакансий (остальные - при следующих запусках)")
+
+    export_parser = subparsers.add_parser("export", help="Выгрузка companies и vacancies в файл снимка.")
+    export_parser.add_argument("path", nargs="?", type=Path, default=SNAPSHOT_PATH,
+                               help=f"путь к файлу снимка (по умолчанию {SNAPSHOT_PATH})")
+    export_parser.add_argument("--compress", action="store_true",
+                               help="сжать столбцы zlib (меньше файл, но чтение с распаковкой)")
+    import_parser = subparsers.add_parser("import", help="Загрузка снимка в БД без обращения к hh.ru.")
+    import_parser.add_argument("path", nargs="?", type=Path, default=SNAPSHOT_PATH,
+                               help=f"путь к файлу снимка (по умолчанию {SNAPSHOT_PATH})")
+
+    subparsers.add_parser(
+        "dedupe", help="Удаление повторов работодателей и вакансий, оставшихся от схемы без уникальных ключей "
+                       "(вакансии удаляемых повторов работодателя переносятся на оставшегося).")
+
+    for command, (help_text, _) in QUERY_COMMANDS.items():
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", dest="output_format",
+                               help="формат вывода (по умолчанию jsonl)")
+        if command == "search":
+            subparser.add_argument("query", help="ключевые слова")
+        if command in ("vacancies", "above-avg", "search"):
+            subparser.add_argument("--limit", type=int,
+                                   help=f"вывести одну страницу из N вакансий (по умолчанию {db_page_size} с --after)")
+            subparser.add_argument("--after", help="курсор следующей страницы из вывода предыдущей")
+        if command == "vacancies":
+            subparser.add_argument("--order", choices=("id", "salary"), default="id",
+                                   help="порядок: id - в порядке добавления, salary - вакансии с зарплатой, "
+                                        "от большей к меньшей (постранично)")
+        if command == "salary":
+            subparser.add_argument("--from", type=int, dest="salary_from", help="нижняя граница зарплаты")
+            subparser.add_argument("--to", type=int, dest="salary_to", help="верхняя граница зарплаты")
+            subparser.add_argument("--limit", type=int, help="вывести только N вакансий с наибольшей зарплатой")
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Точка входа: подкоманды ingest/sync загружают данные с hh.ru, enrich дополняет вакансии
+    подробностями с hh.ru, export/import выгружают и загружают
+    снимок данных, dedupe удаляет повторы, оставшиеся от прежней схемы,
+    подкоманды запросов читают уже загруженные данные из БД без обращения к hh.ru,
+    без подкоманды запускается интерактивное меню.
+
+    Args:
+        argv(list[str] | None): аргументы командной строки, по умолчанию - sys.argv[1:].
+    """
+    args = build_arg_parser().parse_args(argv)
+
+    if args.command is None:
+        interact_with_user()
+        return
+
+    db = create_db_manager()
+    try:
+        if args.command == "ingest":
+            db.drop_table("vacancies")
+            db.drop_table("companies")
+            db.create_table()
+            ingest(db, incremental=False, discover=args.discover, areas=args.areas or discovery_areas,
+                   industry=args.industry)
+        elif args.command == "sync":
+            db.create_table()
+            ingest(db, incremental=True, discover=args.discover, areas=args.areas or discovery_areas,
+                   industry=args.industry)
+        elif args.command == "enrich":
+            db.create_table()
+            cache = DiskResponseCache(HTTP_CACHE_PATH, http_cache_max_size_bytes)
+            enrich_data(db, Parser("https://api.hh.ru/employers", cache=cache), args.limit)
+            report_metrics()
+        elif args.command == "export":
+            counts = export_snapshot(db, args.path, "zlib" if args.compress else None)
+            print(f"Снимок {args.path}: работодателей {counts['companies']}, вакансий {counts['vacancies']}.",
+                  file=sys.stderr)
+        elif args.command == "dedupe":
+            counts = db.remove_duplicates()
+            print(f"Удалено повторов: работодателей {counts['companies']} (перенесено вакансий "
+                  f"{counts['moved_vacancies']}), вакансий {counts['vacancies']}.", file=sys.stderr)
+            db.create_table()
+        elif args.command == "import":
+            db.create_table()
+            with Snapshot(args.path) as snapshot:
+                counts = db.load_snapshot(snapshot)
+            print(f"Из снимка {args.path} добавлено работодателей {counts['companies']}, "
+                  f"вакансий {counts['vacancies']}.", file=sys.stderr)
+        else:
+            write_rows(query_rows(db, args), QUERY_COMMANDS[args.command][1], args.output_format)
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
-    interact_with_user()
+    main()
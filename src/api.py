@@ -1,9 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+from urllib.parse import urlsplit
 
 import requests
 
-from config import favorite_companies_id_hh, params_for_getting_employers, params_for_getting_vacancies
+from config import (discovery_max_results, favorite_companies_id_hh, http_cache_ttl,
+                    max_workers_for_getting_vacancies, params_for_getting_employers, params_for_getting_vacancies)
+from src.cache import CachedResponse, ResponseCache
+from src.discovery import DiscoveryCheckpoint
+from src.employer import Employer
+from src.http_client import HttpClient
+from src.json_decoder import JsonDecoder, VacanciesPage, VacancyDetails, make_decoder
+from src.metrics import metrics
 from src.vacancy import Vacancy
 
 
@@ -38,15 +49,43 @@ class Parser(API):
     Наследует функциональность от абстрактного класса API.
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, max_workers: int = max_workers_for_getting_vacancies,
+                 cache: ResponseCache | None = None, cache_ttl: dict[str, float] | None = None,
+                 favorite_companies_id_hh: list[str] = favorite_companies_id_hh,
+                 client: HttpClient | None = None, decoder: JsonDecoder | None = None) -> None:
         """
         Метод для инициализации класса API.
+
+        Args:
+            url(str): базовая ссылка на API работодателей.
+            max_workers(int): максимальное число одновременных запросов при получении вакансий.
+            cache(ResponseCache | None): кэш ответов API, по умолчанию запросы не кэшируются.
+            cache_ttl(dict[str, float] | None): время жизни ответов в кэше по первому сегменту пути.
+            favorite_companies_id_hh(list[str]): id работодателей, получаемых get_employers.
+            client(HttpClient | None): HTTP-клиент с ограничением частоты и повторами,
+            по умолчанию создается с настройками из config.
+            decoder(JsonDecoder | None): разборщик ответов API, по умолчанию - заданный в config.
         """
+        if max_workers < 1:
+            raise ValueError("Число одновременных запросов должно быть положительным.")
+
         self.__url: str = url
         self.__headers: dict = {"User-Agent": "HH-User-Agent"}
         self.__params: dict = {"text": "", "page": 0, "per_page": 100}
         self.__vacancies: list[dict] = []
         self.__favorite_companies_id_hh: list[str] = favorite_companies_id_hh
+        self.__max_workers: int = max_workers
+        # работодатели, все страницы вакансий которых получены без ошибок при последнем обходе
+        self.__completed_companies: set[int] = set()
+        # одна сессия на все запросы: соединения с api.hh.ru переиспользуются между потоками
+        if client is None:
+            session = requests.Session()
+            session.headers.update(self.__headers)
+            client = HttpClient(session, max_concurrency=max_workers)
+        self.__client: HttpClient = client
+        self.__cache: ResponseCache | None = cache
+        self.__cache_ttl: dict[str, float] = cache_ttl if cache_ttl is not None else http_cache_ttl
+        self.__decoder: JsonDecoder = decoder if decoder is not None else make_decoder()
 
     @property
     def url(self):
@@ -73,47 +112,404 @@ class Parser(API):
     def favorite_companies_id_hh(self):
         return self.__favorite_companies_id_hh
 
-    def get_employers(self) -> list[dict]:
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+    @property
+    def completed_companies(self):
+        return self.__completed_companies
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    @property
+    def client(self):
+        return self.__client
+
+    @property
+    def decoder(self):
+        return self.__decoder
+
+    def get_employers(self, employer_ids: list[str] | None = None) -> list[dict]:
         """
         Метод для получения работодателей в формате JSON.
+
+        Работодатель, запрос по которому завершился ошибкой (после всех повторов), пропускается.
+        Args:
+            employer_ids(list[str] | None): id работодателей, по умолчанию - favorite_companies_id_hh.
         Returns:
             list[dict]: Список с работодателями в формате JSON.
         """
-        self.__params = params_for_getting_employers
+        return self._fetch_employers(self.__decoder.decode, employer_ids)
 
-        employers_data_list: list[dict] = []
-        for employer_id in self.__favorite_companies_id_hh:
-            response = requests.get(f'https://api.hh.ru/employers/{employer_id}', params=self.__params)
-            response.raise_for_status()  # Проверяем статус ответа, вызывает исключение для ошибок HTTP
-            data_employer = response.json()
-            employers_data_list.append(data_employer)
+    def get_employer_objects(self, employer_ids: list[str] | None = None) -> list[Employer]:
+        """
+        Метод для получения работодателей в виде объектов класса Работодатель.
 
-        return employers_data_list
+        Ответы разбираются сразу в объекты, без промежуточных словарей (если это поддерживает
+        разборщик); работодатель, запрос по которому завершился ошибкой, пропускается.
+        Args:
+            employer_ids(list[str] | None): id работодателей, по умолчанию - favorite_companies_id_hh;
+            например, найденные discover_employer_ids.
+        Returns:
+            list[Employer]: Список объектов класса Работодатель.
+        """
+        return self._fetch_employers(self.__decoder.decode_employer, employer_ids)
 
-    def get_vacancies(self, data: dict[int, str]) -> list[Vacancy]:
+    def _fetch_employers(self, decode: Callable[[bytes], Any], employer_ids: list[str] | None = None) -> list[Any]:
+        """
+        Запрашивает работодателей и разбирает ответы функцией decode.
+
+        Запросы выполняются параллельно в пуле из max_workers потоков, порядок результатов
+        совпадает с порядком employer_ids. Параметры собираются заново для каждого запроса,
+        состояние экземпляра в потоках пула не изменяется.
+        Args:
+            decode(Callable[[bytes], Any]): функция разбора тела ответа.
+            employer_ids(list[str] | None): id работодателей, по умолчанию - favorite_companies_id_hh.
+        Returns:
+            list[Any]: результаты разбора ответов, полученных без ошибок.
+        """
+        ids = employer_ids if employer_ids is not None else self.__favorite_companies_id_hh
+
+        def fetch(employer_id: str) -> Any:
+            try:
+                return decode(self._get_content(f'{self.__url}/{employer_id}', dict(params_for_getting_employers)))
+            except (requests.RequestException, ValueError) as e:
+                print(f"Ошибка при выполнении запроса работодателя {employer_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            return [employer for employer in executor.map(fetch, ids) if employer is not None]
+
+    def discover_employer_ids(self, areas: Iterable[str] | None = None, industry: str | None = None,
+                              checkpoint: DiscoveryCheckpoint | None = None,
+                              max_workers: int | None = None) -> list[str]:
+        """
+        Находит работодателей поиском /employers с параметрами params_for_getting_employers
+        (по умолчанию - только с открытыми вакансиями).
+
+        Каждый регион из areas - отдельный поисковый запрос (без areas - один запрос без фильтра
+        по региону). Первые страницы всех запросов, а по мере их получения и остальные страницы
+        запрашиваются параллельно в общем пуле потоков. Каждая полученная страница отмечается
+        в checkpoint, поэтому прерванный обход с тем же checkpoint запрашивает только недостающие
+        страницы; страница, запрос которой завершился ошибкой, будет запрошена при следующем обходе
+        (проверить полноту можно через checkpoint.is_complete). hh.ru отдает не больше
+        discovery_max_results результатов одного запроса, остальные страницы не запрашиваются.
+        Args:
+            areas(Iterable[str] | None): id регионов hh.ru.
+            industry(str | None): id отрасли hh.ru.
+            checkpoint(DiscoveryCheckpoint | None): состояние обхода, по умолчанию - новое в памяти.
+            max_workers(int | None): число одновременных запросов, по умолчанию - заданное при создании.
+        Returns:
+            list[str]: id найденных работодателей без повторов.
+        """
+        workers = max_workers if max_workers is not None else self.__max_workers
+        checkpoint = checkpoint if checkpoint is not None else DiscoveryCheckpoint()
+
+        base_params = dict(params_for_getting_employers)
+        if industry is not None:
+            base_params['industry'] = industry
+        queries = [{**base_params, 'area': area} for area in areas] if areas else [base_params]
+        keys = [checkpoint.query_key(params) for params in queries]
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        running: dict[Future, tuple[str, dict[str, Any], int]] = {}
+
+        def submit(key: str, params: dict[str, Any], page: int) -> None:
+            running[executor.submit(self._get_employers_page, params, page)] = (key, params, page)
+
+        checkpoint.retain(keys)
+        try:
+            for key, params in zip(keys, queries):
+                checkpoint.add_query(key)
+                for page in checkpoint.pending_pages(key):
+                    submit(key, params, page)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, params, page = running.pop(future)
+                    result = future.result()
+                    if result is None:
+                        continue
+                    employer_ids, pages = result
+                    first_page = checkpoint.pages(key) is None
+                    checkpoint.record_page(key, page, pages, employer_ids)
+                    # остальные страницы запроса известны только после получения первой
+                    if first_page:
+                        for rest_page in checkpoint.pending_pages(key):
+                            submit(key, params, rest_page)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return checkpoint.employer_ids(keys)
+
+    def _get_employers_page(self, params: dict[str, Any], page: int) -> tuple[list[str], int] | None:
+        """
+        Получает одну страницу поиска работодателей.
+        Args:
+            params(dict[str, Any]): параметры поискового запроса.
+            page(int): номер страницы.
+        Returns:
+            tuple[list[str], int] | None: id работодателей на странице и число доступных страниц выдачи
+            или None при ошибке запроса.
+        """
+        try:
+            data = self.__decoder.decode(self._get_content(self.__url, {**params, 'page': page}))
+        except (requests.RequestException, ValueError) as e:
+            print(f"Ошибка при выполнении поиска работодателей (страница {page}): {e}")
+            return None
+
+        per_page = data.get('per_page') or params.get('per_page', 100)
+        found = data.get('found', 0)
+        pages = data.get('pages')
+        if pages is None:
+            pages = -(-found // per_page)
+        if found > discovery_max_results and page == 0:
+            print(f"Поиск работодателей {params}: найдено {found}, доступны первые {discovery_max_results}; "
+                  f"для полного обхода сузьте запрос (регионы, отрасль).")
+        pages = max(min(pages, discovery_max_results // per_page), 1)
+        return [str(item['id']) for item in data.get('items', []) if item.get('id')], pages
+
+    def get_vacancies(self, data: dict[int, str], max_workers: int | None = None) -> list[Vacancy]:
         """
         Метод для получения вакансий в формате JSON.
+
+        Собирает в список все вакансии, полученные через iter_vacancies.
         Args:
             data(dict[int, str]): словарь с данными, где ключом является id работодателя,
             а значением - api - ссылка на вакансии работодателя.
+            max_workers(int | None): число одновременных запросов, по умолчанию - заданное при создании.
         Returns:
             list[Vacancy]: Список с объектами класса Вакансия.
         """
+        return list(self.iter_vacancies(data, max_workers))
+
+    def iter_vacancies(self, data: dict[int, str], max_workers: int | None = None) -> Iterator[Vacancy]:
+        """
+        Генератор вакансий работодателей со всех страниц выдачи.
+
+        Первая страница каждого работодателя содержит метаданные pages/found, по которым
+        остальные страницы запрашиваются параллельно в пуле потоков поверх общей сессии.
+        Страницы разбираются в объекты вакансий там же, в потоках пула.
+        Одновременно в работе находятся первые страницы не более чем max_workers работодателей,
+        поэтому потребление памяти не зависит от общего числа вакансий.
+        Порядок вакансий совпадает с порядком работодателей в data и номеров страниц.
+        Ошибка запроса страницы не влияет на остальные страницы и работодателей.
+        Работодатели, все страницы которых получены без ошибок, накапливаются в completed_companies.
+        Параметры запроса (params_for_getting_vacancies) передаются каждой странице отдельно,
+        поэтому одновременные обходы одного экземпляра не мешают друг другу.
+        Args:
+            data(dict[int, str]): словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+            max_workers(int | None): число одновременных запросов, по умолчанию - заданное при создании.
+        Yields:
+            Vacancy: экземпляр класса Вакансия.
+        """
+        params = dict(params_for_getting_vacancies)
+        workers = max_workers if max_workers is not None else self.__max_workers
+
+        self.__completed_companies.clear()
+        employers = iter(data.items())
+        executor = ThreadPoolExecutor(max_workers=workers)
         try:
-            vacancies_data_list: list[Vacancy] = []
+            window: deque[tuple[int, str, Future]] = deque(
+                (company_id, url, executor.submit(self._get_vacancies_page, company_id, url, 0, params))
+                for company_id, url in islice(employers, workers)
+            )
+            while window:
+                company_id, url, first_page_future = window.popleft()
 
-            self.__params = params_for_getting_vacancies
+                next_employer = next(employers, None)
+                if next_employer is not None:
+                    next_id, next_url = next_employer
+                    window.append((next_id, next_url,
+                                   executor.submit(self._get_vacancies_page, next_id, next_url, 0, params)))
 
-            for key, value in data.items():
-                self.__url = value
-                response = requests.get(self.__url, params=self.__params)
-                response.raise_for_status()  # Проверяем статус ответа, вызывает исключение для ошибок HTTP
-                vacancies: list[dict[str, Any]] = response.json()['items']
-                employer_vacancies: list[Vacancy] = Vacancy.cast_to_object_list(vacancies, key)
-                vacancies_data_list.extend(employer_vacancies)
+                first_page = first_page_future.result()
+                if first_page is None:
+                    continue
+
+                # остальные страницы ставим в очередь до того, как отдавать вакансии первой
+                pages = self._count_pages(first_page, params)
+                rest_pages = [executor.submit(self._get_vacancies_page, company_id, url, page, params)
+                              for page in range(1, pages)]
+
+                yield from first_page.items
+                completed = True
+                for page_future in rest_pages:
+                    page_data = page_future.result()
+                    if page_data is None:
+                        completed = False
+                        continue
+                    yield from page_data.items
 
-            return vacancies_data_list
+                if completed:
+                    self.__completed_companies.add(company_id)
+        finally:
+            # при досрочной остановке генератора запросы, ожидающие в очереди, отменяются,
+            # а уже выполняющиеся дожидаются завершения, чтобы не оставлять потоки пула
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_vacancy_details(self, vacancies: Iterable[tuple[str, str]],
+                             max_workers: int | None = None) -> Iterator[VacancyDetails]:
+        """
+        Генератор подробностей вакансий: описания, ключевых навыков, опыта и графика работы.
+
+        Каждая вакансия запрашивается отдельно по ссылке /vacancies/{id}, запросы выполняются
+        параллельно в пуле потоков; частоту и число одновременных запросов ограничивает HTTP-клиент,
+        поэтому скорость получения определяется лимитом API (hh_api_max_rps), а не задержкой ответов.
+        Повторы vacancy_id пропускаются. В работе одновременно не более 2 * max_workers запросов,
+        поэтому потребление памяти не зависит от числа вакансий. Порядок совпадает с порядком vacancies.
+        Вакансия, запрос которой завершился ошибкой, пропускается.
+        Args:
+            vacancies(Iterable[tuple[str, str]]): пары (vacancy_id, api - ссылка на вакансию).
+            max_workers(int | None): число одновременных запросов, по умолчанию - заданное при создании.
+        Yields:
+            VacancyDetails: подробности вакансии.
+        """
+        workers = max_workers if max_workers is not None else self.__max_workers
+
+        seen: set[str] = set()
+        unique = ((vacancy_id, url) for vacancy_id, url in vacancies
+                  if not (vacancy_id in seen or seen.add(vacancy_id)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            window: deque[Future] = deque(executor.submit(self._get_vacancy_details, vacancy_id, url)
+                                          for vacancy_id, url in islice(unique, 2 * workers))
+            while window:
+                details = window.popleft().result()
+                next_vacancy = next(unique, None)
+                if next_vacancy is not None:
+                    window.append(executor.submit(self._get_vacancy_details, *next_vacancy))
+                if details is not None:
+                    yield details
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        except requests.RequestException as e:
-            print(f"Ошибка при выполнении запроса: {e}")
-            return []
+    def _get_vacancy_details(self, vacancy_id: str, url: str) -> VacancyDetails | None:
+        """
+        Получает подробности одной вакансии.
+        Args:
+            vacancy_id(str): id вакансии на hh.ru.
+            url(str): api - ссылка на вакансию.
+        Returns:
+            VacancyDetails | None: подробности вакансии или None при ошибке запроса.
+        """
+        try:
+            return self.__decoder.decode_vacancy_details(self._get_content(url, {}), vacancy_id)
+        except (requests.RequestException, ValueError) as e:
+            print(f"Ошибка при выполнении запроса вакансии {vacancy_id}: {e}")
+            return None
+
+    @staticmethod
+    def _count_pages(first_page: VacanciesPage, params: dict[str, Any]) -> int:
+        """
+        Определяет число страниц выдачи по метаданным первой страницы.
+        Args:
+            first_page(VacanciesPage): первая страница выдачи.
+            params(dict[str, Any]): параметры запроса выдачи (per_page, если его нет в ответе).
+        Returns:
+            int: число страниц.
+        """
+        pages = first_page.pages
+        if pages is None:
+            per_page = first_page.per_page or params.get('per_page', 100)
+            pages = -(-first_page.found // per_page)
+        return max(pages, 1)
+
+    def _get_vacancies_page(self, company_id: int, vacancies_url: str, page: int,
+                            params: dict[str, Any]) -> VacanciesPage | None:
+        """
+        Получает одну страницу вакансий работодателя.
+        Args:
+            company_id(int): id работодателя.
+            vacancies_url(str): api - ссылка на вакансии работодателя.
+            page(int): номер страницы.
+            params(dict[str, Any]): параметры запроса выдачи без номера страницы (не изменяются).
+        Returns:
+            VacanciesPage | None: разобранная страница выдачи или None при ошибке запроса.
+        """
+        try:
+            return self.__decoder.decode_vacancies_page(
+                self._get_content(vacancies_url, {**params, 'page': page}), company_id)
+        except (requests.RequestException, ValueError) as e:
+            print(f"Ошибка при выполнении запроса вакансий работодателя {company_id} (страница {page}): {e}")
+            return None
+
+    def _get_content(self, url: str, params: dict[str, Any]) -> bytes:
+        """
+        Выполняет GET-запрос и возвращает тело ответа, используя кэш, если он задан.
+
+        Свежий ответ из кэша возвращается без обращения к сети. Устаревший ответ с ETag или
+        Last-Modified перепроверяется условным запросом, и при ответе 304 тело берется из кэша.
+        Args:
+            url(str): ссылка на ресурс API.
+            params(dict[str, Any]): параметры запроса.
+        Returns:
+            bytes: тело ответа.
+        """
+        if self.__cache is None:
+            return self._http_get(url, params=params).content
+
+        # ключ строится по итоговой ссылке, параметры отсортированы для стабильности
+        full_url = requests.Request('GET', url, params=sorted(params.items())).prepare().url
+        key = self.__cache.make_key(full_url)
+        ttl = self._ttl_for(url)
+
+        cached = self.__cache.get(key)
+        if cached is not None and cached.is_fresh(ttl):
+            self.__cache.record_hit()
+            return cached.content
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        response = self._http_get(full_url, headers=headers, allow_not_modified=cached is not None)
+        if response.status_code == 304:
+            self.__cache.record_revalidation()
+            self.__cache.set(key, CachedResponse(cached.content, cached.etag, cached.last_modified))
+            return cached.content
+
+        self.__cache.record_miss()
+
+        fresh = CachedResponse(response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        if ttl > 0 or fresh.can_revalidate():
+            self.__cache.set(key, fresh)
+
+        return response.content
+
+    def _http_get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None,
+                  allow_not_modified: bool = False) -> requests.Response:
+        """
+        Выполняет GET-запрос через HTTP-клиент (с ограничением частоты и повторами)
+        и замеряет его (этап "http" в метриках).
+        Args:
+            url(str): ссылка на ресурс API.
+            params(dict[str, Any] | None): параметры запроса.
+            headers(dict[str, str] | None): дополнительные заголовки.
+            allow_not_modified(bool): считать ответ 304 успешным (для условных запросов).
+        Returns:
+            requests.Response: ответ сервера.
+        """
+        with metrics.timer("http") as timer:
+            response = self.__client.get(url, params=params, headers=headers)
+            timer.bytes = len(response.content)
+            if not (allow_not_modified and response.status_code == 304):
+                response.raise_for_status()  # Проверяем статус ответа, вызывает исключение для ошибок HTTP
+        return response
+
+    def _ttl_for(self, url: str) -> float:
+        """
+        Возвращает время жизни ответа в кэше по первому сегменту пути ссылки.
+        Args:
+            url(str): ссылка на ресурс API.
+        """
+        segments = urlsplit(url).path.strip('/').split('/')
+        return self.__cache_ttl.get(segments[0], 0)
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+
+class CachedResponse:
+    """
+    Представляет сохраненный ответ API.
+    """
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def __init__(self, content: bytes, etag: str | None = None, last_modified: str | None = None,
+                 stored_at: float | None = None) -> None:
+        """
+        Конструктор экземпляра класса CachedResponse.
+
+        Args:
+            content(bytes): тело ответа.
+            etag(str | None): значение заголовка ETag.
+            last_modified(str | None): значение заголовка Last-Modified.
+            stored_at(float | None): время сохранения (unix time), по умолчанию - текущее.
+        """
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Проверяет, что ответ не старше ttl секунд.
+        """
+        return time.time() - self.stored_at < ttl
+
+    def can_revalidate(self) -> bool:
+        """
+        Проверяет, можно ли перепроверить ответ условным запросом.
+        """
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache(ABC):
+    """
+    Представляет абстрактный кэш ответов API с LRU-вытеснением и счетчиками обращений.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__revalidations = 0
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Возвращает ключ кэша для полной ссылки запроса (с параметрами).
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Абстрактный метод для получения ответа из кэша.
+
+        Args:
+            key(str): ключ кэша.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """
+        Абстрактный метод для сохранения ответа в кэш.
+
+        Args:
+            key(str): ключ кэша.
+            response(CachedResponse): сохраняемый ответ.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Абстрактный метод для очистки кэша.
+        """
+        pass
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.__hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.__misses += 1
+
+    def record_revalidation(self) -> None:
+        with self._lock:
+            self.__revalidations += 1
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    @property
+    def revalidations(self):
+        return self.__revalidations
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Счетчики обращений: ответы из кэша без запроса, загрузки из сети
+        и ответы, подтвержденные сервером (304 Not Modified).
+        """
+        return {"hits": self.__hits, "misses": self.__misses, "revalidations": self.__revalidations}
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    Представляет кэш ответов API в памяти процесса.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        super().__init__()
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            response = self.__entries.get(key)
+            if response is not None:
+                self.__entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self.__entries[key] = response
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.__entries.clear()
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Представляет кэш ответов API на диске.
+
+    Каждый ответ хранится в двух файлах: <ключ>.body (тело) и <ключ>.json (заголовки и время сохранения).
+    Суммарный размер тел ограничен max_size_bytes, при превышении удаляются давно не читавшиеся ответы.
+    """
+
+    def __init__(self, directory: Path, max_size_bytes: int) -> None:
+        super().__init__()
+        self.__directory = Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__max_size_bytes = max_size_bytes
+        # ключ -> размер тела; порядок - от давно использованных к недавним
+        self.__index: OrderedDict[str, int] = OrderedDict()
+        self.__size = 0
+        self.__load_index()
+
+    @property
+    def directory(self):
+        return self.__directory
+
+    @property
+    def size(self):
+        return self.__size
+
+    def __load_index(self) -> None:
+        """
+        Восстанавливает LRU-индекс по времени последнего обращения к файлам тел.
+        """
+        bodies = sorted(self.__directory.glob("*.body"), key=lambda path: path.stat().st_mtime)
+        for body in bodies:
+            if body.with_suffix(".json").exists():
+                size = body.stat().st_size
+                self.__index[body.stem] = size
+                self.__size += size
+        self.__evict()
+
+    def __paths(self, key: str) -> tuple[Path, Path]:
+        return self.__directory.joinpath(f"{key}.body"), self.__directory.joinpath(f"{key}.json")
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            if key not in self.__index:
+                return None
+            body_path, meta_path = self.__paths(key)
+            try:
+                content = body_path.read_bytes()
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.__remove(key)
+                return None
+            self.__index.move_to_end(key)
+            # mtime тела служит временем последнего обращения для LRU после перезапуска
+            os.utime(body_path)
+
+        return CachedResponse(content, meta.get("etag"), meta.get("last_modified"), meta["stored_at"])
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        body_path, meta_path = self.__paths(key)
+        meta = {"etag": response.etag, "last_modified": response.last_modified, "stored_at": response.stored_at}
+
+        with self._lock:
+            # запись через временный файл, чтобы при падении не оставить обрезанный ответ
+            self.__write_atomic(body_path, response.content)
+            self.__write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+            self.__size += len(response.content) - self.__index.get(key, 0)
+            self.__index[key] = len(response.content)
+            self.__index.move_to_end(key)
+            self.__evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self.__index):
+                self.__remove(key)
+
+    def __evict(self) -> None:
+        while self.__size > self.__max_size_bytes and self.__index:
+            self.__remove(next(iter(self.__index)))
+
+    def __remove(self, key: str) -> None:
+        self.__size -= self.__index.pop(key, 0)
+        for path in self.__paths(key):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def __write_atomic(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
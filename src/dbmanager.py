@@ -1,17 +1,112 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import AbstractContextManager, contextmanager
+from itertools import count, islice
+from typing import Any, Iterable, Iterator, NamedTuple
 
 import psycopg2
+from psycopg2.extensions import connection, cursor
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
-from config import config
+from config import (config, db_batch_size, db_page_size, db_pool_max_size, db_pool_min_size, db_query_cache_size,
+                    db_stream_itersize, get_db_backend)
 from src.api import Parser
 from src.employer import Employer
+from src.json_decoder import VacancyDetails
+from src.metrics import metrics
+from src.query_cache import QueryCache, cached_query, invalidates_cache
+from src.snapshot import COMPANY_COLUMNS, Snapshot, vacancy_rows
 from src.vacancy import Vacancy
 
 
+class InstrumentedCursor(cursor):
+    """
+    Курсор, замеряющий каждый SQL-запрос (этапы "sql_<команда>" в метриках, например sql_insert).
+
+    Для серверных курсоров замеряется объявление курсора, а не получение строк.
+    """
+
+    def execute(self, query, vars=None):
+        if not metrics.enabled:
+            return super().execute(query, vars)
+
+        with metrics.timer(self._stage(query)) as timer:
+            result = super().execute(query, vars)
+            timer.bytes = len(self.query or b"")
+        return result
+
+    def executemany(self, query, vars_list):
+        if not metrics.enabled:
+            return super().executemany(query, vars_list)
+
+        with metrics.timer(self._stage(query)) as timer:
+            result = super().executemany(query, vars_list)
+            timer.bytes = len(self.query or b"")
+        return result
+
+    def copy_expert(self, sql, file, size=8192):
+        if not metrics.enabled:
+            return super().copy_expert(sql, file, size)
+
+        with metrics.timer(self._stage(sql)):
+            return super().copy_expert(sql, file, size)
+
+    @staticmethod
+    def _stage(query: str | bytes) -> str:
+        words = query.split(None, 1)
+        command = words[0] if words else ""
+        if isinstance(command, bytes):
+            command = command.decode("ascii", "replace")
+        return f"sql_{command.lower()}"
+
+
+class _CopyReader:
+    """
+    Файлоподобный источник для COPY ... FROM STDIN: строки преобразуются в текстовый формат COPY
+    по мере чтения, поэтому весь поток не собирается в памяти.
+    """
+    # экранирование спецсимволов текстового формата COPY
+    _ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def __init__(self, rows: Iterable[tuple[Any, ...]], batch_size: int = db_batch_size) -> None:
+        self.__rows = iter(rows)
+        self.__batch_size = batch_size
+        self.__buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.__buffer) < size:
+            batch = list(islice(self.__rows, self.__batch_size))
+            if not batch:
+                break
+            self.__buffer += "".join(map(self._line, batch)).encode("utf-8")
+
+        if size < 0:
+            size = len(self.__buffer)
+        data = bytes(self.__buffer[:size])
+        del self.__buffer[:size]
+        return data
+
+    @classmethod
+    def _line(cls, row: tuple[Any, ...]) -> str:
+        return "\t".join("\\N" if value is None else str(value).translate(cls._ESCAPES) for value in row) + "\n"
+
+
+class Page(NamedTuple):
+    """
+    Страница результатов постраничного запроса: строки и курсор следующей страницы
+    (None, если страница последняя).
+    """
+    rows: list[tuple[Any, ...]]
+    next_after: str | None
+
+
 class AbstractDBManager(ABC):
     """
     Представляет абстрактный класс AbstractDBManager.
+
+    Реализации: DBManager (PostgreSQL) и SQLiteDBManager (встроенная БД SQLite); выбор реализации -
+    create_db_manager по настройкам из database.ini.
     """
     @abstractmethod
     def create_table(self) -> None:
@@ -32,23 +127,520 @@ class AbstractDBManager(ABC):
         """
         pass
 
+    @abstractmethod
+    def remove_duplicates(self) -> dict[str, int]:
+        """
+        Абстрактный метод для удаления повторов работодателей и вакансий, оставшихся от схемы
+        без уникальных ключей.
+
+        Returns:
+            dict[str, int]: число удаленных работодателей ("companies"), перенесенных на оставшегося
+            работодателя вакансий ("moved_vacancies") и удаленных вакансий ("vacancies").
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Абстрактный метод для закрытия соединения с БД.
+        """
+        pass
+
+    @abstractmethod
+    def insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(self,
+                                                                             data: Iterable[Vacancy | Employer],
+                                                                             table: str,
+                                                                             batch_size: int | None = None
+                                                                             ) -> dict[int, str]:
+        """
+        Абстрактный метод для заполнения таблицы companies или vacancies.
+
+        Args:
+             data(Iterable[Vacancy | Employer]): объекты класса Вакансия или Работодатель
+             table(str): наименование таблицы
+             batch_size(int | None): размер пакета для массовой вставки.
+        """
+        pass
+
+    @abstractmethod
+    def insert_companies_bulk(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Абстрактный метод для массовой вставки работодателей.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк в одном запросе.
+        """
+        pass
+
+    @abstractmethod
+    def insert_vacancies_bulk(self, data: Iterable[Vacancy], batch_size: int = db_batch_size) -> int:
+        """
+        Абстрактный метод для массовой вставки вакансий.
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             batch_size(int): число строк в одном запросе.
+        """
+        pass
+
+    @abstractmethod
+    def sync_companies(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Абстрактный метод для синхронизации работодателей с таблицей companies.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк в одном запросе.
+        """
+        pass
+
+    @abstractmethod
+    def sync_vacancies(self, data: Iterable[Vacancy], company_ids: Iterable[int],
+                       batch_size: int = db_batch_size) -> dict[str, int]:
+        """
+        Абстрактный метод для синхронизации вакансий с таблицей vacancies.
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             company_ids(Iterable[int]): id работодателей, вакансии которых получены полностью.
+             batch_size(int): число строк в одном запросе.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_to_enrich(self, limit: int | None = None) -> list[tuple[str, str]]:
+        """
+        Абстрактный метод для получения вакансий без подробностей (новых или изменившихся
+        с последнего получения подробностей).
+
+        Args:
+            limit(int | None): максимальное число вакансий.
+        """
+        pass
+
+    @abstractmethod
+    def update_vacancy_details(self, data: Iterable[VacancyDetails], batch_size: int = db_batch_size) -> int:
+        """
+        Абстрактный метод для записи подробностей вакансий.
+
+        Args:
+            data(Iterable[VacancyDetails]): подробности вакансий.
+            batch_size(int): число строк в одной транзакции.
+        """
+        pass
+
+    @abstractmethod
+    def load_snapshot(self, snapshot: Snapshot) -> dict[str, int]:
+        """
+        Абстрактный метод для загрузки снимка данных в таблицы.
+
+        Args:
+            snapshot(Snapshot): открытый снимок данных.
+        """
+        pass
+
+    @abstractmethod
+    def get_companies_and_vacancies_count(self) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения списка компаний и количества вакансий у каждой компании.
+        """
+        pass
+
+    @abstractmethod
+    def get_all_vacancies(self) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения списка всех вакансий.
+        """
+        pass
+
+    @abstractmethod
+    def get_avg_salary(self) -> float:
+        """
+        Абстрактный метод для получения средней зарплаты по вакансиям.
+        """
+        pass
+
+    @abstractmethod
+    def get_salary_stats(self) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения статистики по зарплатам.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_with_higher_salary(self) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения вакансий с зарплатой выше средней.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_by_salary(self, salary_from: int | None = None, salary_to: int | None = None,
+                                limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения вакансий с зарплатой в базовой валюте в заданных границах,
+        от большей зарплаты к меньшей.
+
+        Args:
+            salary_from(int | None): нижняя граница зарплаты.
+            salary_to(int | None): верхняя граница зарплаты.
+            limit(int | None): максимальное число результатов.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_with_keyword(self, keyword: str) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для получения вакансий по ключевому слову.
+
+        Args:
+            keyword (str): переданное в запрос слово
+        """
+        pass
+
+    @abstractmethod
+    def search_vacancies(self, query: str, limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Абстрактный метод для поиска вакансий с ранжированием по релевантности.
+
+        Args:
+            query(str): поисковый запрос из одного или нескольких слов.
+            limit(int | None): максимальное число результатов.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_page(self, after: str | None = None, limit: int = db_page_size, order: str = "id") -> Page:
+        """
+        Абстрактный метод для постраничного получения всех вакансий.
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+            order(str): "id" - в порядке добавления, "salary" - вакансии с зарплатой, от большей к меньшей.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_with_higher_salary_page(self, after: str | None = None, limit: int = db_page_size) -> Page:
+        """
+        Абстрактный метод для постраничного получения вакансий с зарплатой выше средней.
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        """
+        pass
+
+    @abstractmethod
+    def get_vacancies_with_keyword_page(self, keyword: str, after: str | None = None,
+                                        limit: int = db_page_size) -> Page:
+        """
+        Абстрактный метод для постраничного получения вакансий по ключевому слову, от наиболее релевантных.
+
+        Args:
+            keyword (str): переданное в запрос слово
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        """
+        pass
+
+    def get_top_vacancies(self, n: int, order: str = "salary") -> list[tuple[Any, ...]]:
+        """
+        Получает первые n вакансий в порядке order (top-N) - первую страницу get_vacancies_page.
+
+        Args:
+            n(int): число вакансий.
+            order(str): "salary" - с наибольшей зарплатой, "id" - добавленные первыми.
+        Returns:
+            list[tuple[Any, ...]]: список вакансий.
+        """
+        return self.get_vacancies_page(limit=n, order=order).rows
+
+    @abstractmethod
+    def iter_all_vacancies(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения всех вакансий.
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @abstractmethod
+    def iter_vacancies_with_higher_salary(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения вакансий с зарплатой выше средней.
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @abstractmethod
+    def iter_vacancies_with_keyword(self, keyword: str,
+                                    itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения вакансий, найденных по ключевому слову.
+
+        Args:
+            keyword (str): переданное в запрос слово
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @abstractmethod
+    def iter_vacancy_salaries(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения строк (vacancy_id, company_id, salary_min, salary_max, salary_norm).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @abstractmethod
+    def iter_company_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения строк таблицы companies (для снимка данных).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @abstractmethod
+    def iter_vacancy_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Абстрактный метод для потокового чтения строк таблицы vacancies (для снимка данных).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        pass
+
+    @staticmethod
+    def _page_key(after: str | None, first: tuple[Any, ...], limit: int) -> tuple[Any, ...]:
+        """
+        Разбирает курсор страницы - значения ключа порядка последней строки предыдущей страницы через ":".
+        Для первой страницы (after=None) возвращает first - ключ, предшествующий всем строкам.
+
+        Args:
+            after(str | None): курсор next_after.
+            first(tuple[Any, ...]): ключ первой страницы; типы его значений задают типы значений курсора.
+            limit(int): число строк на странице, не меньше 1.
+        Returns:
+            tuple[Any, ...]: значения ключа.
+        """
+        if limit < 1:
+            raise ValueError(f"Число строк на странице должно быть положительным: {limit}")
+        if after is None:
+            return first
+        try:
+            return tuple(type(value)(part) for value, part in zip(first, after.split(":"), strict=True))
+        except ValueError as error:
+            raise ValueError(f"Некорректный курсор страницы: {after!r}") from error
+
+    @staticmethod
+    def _page(rows: list[tuple[Any, ...]], limit: int, key_size: int) -> Page:
+        """
+        Собирает страницу из результата запроса с LIMIT limit + 1: последние key_size столбцов строк - ключ
+        порядка, лишняя строка означает, что есть следующая страница, и курсор указывает на последнюю строку.
+        """
+        next_after = ":".join(repr(value) for value in rows[limit - 1][-key_size:]) if len(rows) > limit else None
+        return Page([row[:-key_size] for row in rows[:limit]], next_after)
+
+    @staticmethod
+    def _unique_rows(rows: Iterable[tuple[Any, ...]]) -> Iterable[tuple[Any, ...]]:
+        """
+        Пропускает повторы строк с уже встречавшимся ключом (первый столбец).
+
+        Одна и та же запись может попасть в выдачу дважды при сдвиге страниц, а ON CONFLICT DO UPDATE
+        не допускает двух изменений одной строки в одном запросе.
+        """
+        seen: set[Any] = set()
+        for row in rows:
+            if row[0] not in seen:
+                seen.add(row[0])
+                yield row
+
+    @staticmethod
+    def _company_row(item: Employer) -> tuple[Any, ...]:
+        """
+        Возвращает значения полей работодателя в порядке столбцов таблицы companies.
+        """
+        return (item.employer_id, item.name, item.alternate_url, item.city,
+                item.description, item.site_url, item.vacancies_url, item.open_vacancies)
+
+    @staticmethod
+    def _vacancy_row(item: Vacancy) -> tuple[Any, ...]:
+        """
+        Возвращает значения полей вакансии в порядке столбцов таблицы vacancies.
+        """
+        return (item.vacancy_id, item.name, item.company_id, item.url,
+                item.salary_from, item.salary_to, item.requirement, item.salary_norm)
+
+    @staticmethod
+    def _batches(rows: Iterable[tuple[Any, ...]], batch_size: int) -> Iterable[list[tuple[Any, ...]]]:
+        """
+        Разбивает поток строк на пакеты не длиннее batch_size.
+        """
+        if batch_size < 1:
+            raise ValueError("Размер пакета должен быть положительным.")
+
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
+
 
 class DBManager(AbstractDBManager):
     """
     Представляет класс менеджера БД.
     Наследует функциональность от абстрактного класса AbstractDBManager.
+
+    Результаты читающих методов get_* и search_vacancies кэшируются до ближайшего изменения данных
+    через этот менеджер; передайте use_cache=False, чтобы выполнить запрос в обход кэша.
     """
+    # счетчик для уникальных имен серверных курсоров
+    _cursor_ids = count()
 
-    def __init__(self, dbname: str, user: str, password: str, host: str, port: int):
-        # подключение к БД идет 1 раз (так быстрее)
-        self.conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
+    _HIGHER_SALARY_SQL = """
+        WITH stats AS (
+            SELECT avg_salary FROM salary_stats WHERE is_total
+        )
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.salary_norm > (SELECT avg_salary FROM stats)
+        ORDER BY v.salary_norm DESC, v.id DESC;
+    """
+
+    # границы передаются как NULL, если не заданы; условие и порядок - по индексу на (salary_norm, id)
+    _SALARY_RANGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.salary_norm >= COALESCE(%(salary_from)s, -1)
+          AND v.salary_norm <= COALESCE(%(salary_to)s, 2147483647)
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT %(limit)s;
+    """
+
+    # найденные вакансии с оценкой релевантности score (меньше - релевантнее);
+    # запрос tsquery повторяется в тексте, а не выносится в CTE, чтобы оставаться константой для индекса
+    _KEYWORD_MATCH_SQL = """
+        SELECT c.name AS company, v.name, v.salary_min, v.salary_max, v.url, v.id,
+               -(ts_rank(v.search_vector, websearch_to_tsquery('russian', %(query)s) ||
+                                          websearch_to_tsquery('english', %(query)s))
+                 + word_similarity(%(query)s, v.name))::float8 AS score
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.search_vector @@ (websearch_to_tsquery('russian', %(query)s) ||
+                                  websearch_to_tsquery('english', %(query)s))
+           OR v.name ILIKE %(pattern)s
+           OR v.requirement ILIKE %(pattern)s
+           OR %(query)s <%% v.name
+    """
+
+    _KEYWORD_SEARCH_SQL = f"""
+        SELECT company, name, salary_min, salary_max, url
+        FROM ({_KEYWORD_MATCH_SQL}) AS found
+        ORDER BY score, id
+        LIMIT %(limit)s;
+    """
+
+    # Постраничные запросы (keyset): страница начинается сразу после ключа порядка последней строки
+    # предыдущей страницы, поэтому по индексу читаются только limit + 1 записей, как бы далеко
+    # ни была страница, - в отличие от OFFSET, при котором пропускаемые строки читаются заново.
+    # Ключ (последние столбцы строк) - id или (salary_norm, id), порядок обслуживается индексом.
+    _VACANCIES_BY_ID_PAGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.id > %(id)s
+        ORDER BY v.id
+        LIMIT %(limit)s;
+    """
+
+    _VACANCIES_BY_SALARY_PAGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE (v.salary_norm, v.id) < (%(salary)s, %(id)s)
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT %(limit)s;
+    """
+
+    _HIGHER_SALARY_PAGE_SQL = """
+        WITH stats AS (
+            SELECT avg_salary FROM salary_stats WHERE is_total
+        )
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE (v.salary_norm, v.id) < (%(salary)s, %(id)s)
+          AND v.salary_norm > (SELECT avg_salary FROM stats)
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT %(limit)s;
+    """
+
+    # релевантность не хранится в индексе: каждая страница заново оценивает найденные вакансии,
+    # но не сортирует и не передает вакансии предыдущих страниц
+    _KEYWORD_PAGE_SQL = f"""
+        SELECT company, name, salary_min, salary_max, url, score, id
+        FROM ({_KEYWORD_MATCH_SQL}) AS found
+        WHERE (score, id) > (%(score)s, %(id)s)
+        ORDER BY score, id
+        LIMIT %(limit)s;
+    """
+
+    # ключ первой страницы при порядке по убыванию: больше любых id и salary_norm (INTEGER)
+    _MAX_KEY = 2147483647
+
+    # уникальные ключи, которых нет в таблицах, созданных прежней схемой: (индекс, таблица, столбец)
+    _UNIQUE_KEYS = (("companies_employer_id_key", "companies", "employer_id"),
+                    ("vacancies_vacancy_id_key", "vacancies", "vacancy_id"))
+
+    def __init__(self, dbname: str, user: str, password: str, host: str, port: int,
+                 query_cache_size: int = db_query_cache_size):
+        # подключение к БД идет 1 раз (так быстрее); параметры сохраняются для соединений потокового чтения
+        self._connect_params = dict(dbname=dbname, user=user, password=password, host=host, port=port,
+                                    cursor_factory=InstrumentedCursor)
+        self.conn = psycopg2.connect(**self._connect_params)
+        # соединение одно, поэтому обращения из разных потоков выполняются по очереди
+        self._lock = threading.RLock()
+        # результаты читающих запросов; сбрасываются любым изменяющим методом
+        self.query_cache = QueryCache(query_cache_size)
+
+    @contextmanager
+    def _connection(self) -> Iterator[connection]:
+        """
+        Выдает соединение на время одной транзакции.
+
+        При успешном выходе из блока транзакция фиксируется, при исключении - откатывается.
+        """
+        with self._lock:
+            try:
+                yield self.conn
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с БД.
+        """
+        self.conn.close()
 
+    @invalidates_cache
     def create_table(self):
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
             CREATE TABLE IF NOT EXISTS companies(
                 id SERIAL PRIMARY KEY,
-                employer_id TEXT,
+                employer_id TEXT UNIQUE,
                 name TEXT NOT NULL,
                 alternate_url TEXT,
                 city TEXT NOT NULL,
@@ -62,7 +654,7 @@ class DBManager(AbstractDBManager):
             cur.execute("""
             CREATE TABLE IF NOT EXISTS vacancies(
                 id SERIAL PRIMARY KEY,
-                vacancy_id TEXT,
+                vacancy_id TEXT UNIQUE,
                 name TEXT NOT NULL,
                 company_id INTEGER,
                 url TEXT NOT NULL,
@@ -72,72 +664,508 @@ class DBManager(AbstractDBManager):
                 FOREIGN KEY (company_id) REFERENCES companies(id)
             );
             """)
-        self.conn.commit()
 
-    def insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(self, data: list[Vacancy | Employer],
-                                                                             table: str) -> dict[int, str]:
+            # таблицы, созданные до появления уникальных ключей, получают их отдельными индексами
+            # (имена совпадают с именами ограничений UNIQUE, поэтому для новых таблиц это no-op).
+            # Прежняя схема допускала повторы; они не удаляются молча, а останавливают создание таблиц
+            # до явного удаления командой dedupe (remove_duplicates)
+            for index, table, column in self._UNIQUE_KEYS:
+                cur.execute("SELECT to_regclass(%s);", (index,))
+                if cur.fetchone()[0] is not None:
+                    continue
+                cur.execute(f"""
+                SELECT {column} FROM {table} GROUP BY {column} HAVING COUNT(*) > 1 ORDER BY {column} LIMIT 5;
+                """)
+                duplicates = [row[0] for row in cur.fetchall()]
+                if duplicates:
+                    raise RuntimeError(f"В таблице {table} есть повторы {column} (например, {', '.join(duplicates)}), "
+                                       f"уникальный индекс {index} не создан. Удалите повторы командой "
+                                       f"`python main.py dedupe` и повторите запуск.")
+                cur.execute(f"CREATE UNIQUE INDEX {index} ON {table} ({column});")
+
+            cur.execute("CREATE INDEX IF NOT EXISTS vacancies_company_id_idx ON vacancies (company_id);")
+
+            # подробности вакансии из /vacancies/{id}; enriched_at сбрасывается при изменении вакансии,
+            # частичный индекс содержит только вакансии, ожидающие получения подробностей
+            cur.execute("""
+            ALTER TABLE vacancies
+                ADD COLUMN IF NOT EXISTS description TEXT,
+                ADD COLUMN IF NOT EXISTS key_skills TEXT,
+                ADD COLUMN IF NOT EXISTS experience TEXT,
+                ADD COLUMN IF NOT EXISTS schedule TEXT,
+                ADD COLUMN IF NOT EXISTS enriched_at TIMESTAMPTZ;
+
+            CREATE INDEX IF NOT EXISTS vacancies_not_enriched_idx ON vacancies (id) WHERE enriched_at IS NULL;
+            """)
+
+            # полнотекстовый поиск по названию и требованиям (русская и английская морфология)
+            # и триграммные индексы для поиска по подстроке и нечеткого поиска
+            cur.execute("""
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+            ALTER TABLE vacancies ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('russian', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('russian', coalesce(requirement, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(requirement, '')), 'B')
+            ) STORED;
+
+            CREATE INDEX IF NOT EXISTS vacancies_search_vector_idx ON vacancies USING GIN (search_vector);
+            CREATE INDEX IF NOT EXISTS vacancies_name_trgm_idx ON vacancies USING GIN (name gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS vacancies_requirement_trgm_idx ON vacancies USING GIN (requirement gin_trgm_ops);
+            """)
+
+            # зарплата в базовой валюте (Vacancy.salary_norm) вычисляется при загрузке, хранится и индексируется
+            # вместе с id (порядок выборок по зарплате и ключ постраничных запросов),
+            # статистика по зарплатам пересчитывается после загрузки без блокировки чтения (REFRESH ... CONCURRENTLY
+            # требует уникального индекса; итоговая строка отличается от строк компаний is_total, поэтому ее NULL
+            # в company_id уникальности не нарушает). salary_norm вакансий, загруженных до появления столбца,
+            # заполнится при ближайшей синхронизации
+            cur.execute("""
+            ALTER TABLE vacancies ADD COLUMN IF NOT EXISTS salary_norm INTEGER;
+
+            CREATE INDEX IF NOT EXISTS vacancies_salary_norm_id_idx ON vacancies (salary_norm, id);
+
+            CREATE MATERIALIZED VIEW IF NOT EXISTS salary_stats AS
+                SELECT company_id,
+                       GROUPING(company_id) = 1 AS is_total,
+                       COUNT(*) AS vacancies_count,
+                       AVG(salary_norm) AS avg_salary,
+                       percentile_cont(0.5) WITHIN GROUP (ORDER BY salary_norm) AS median_salary,
+                       MIN(salary_norm) AS min_salary,
+                       MAX(salary_norm) AS max_salary
+                FROM vacancies
+                WHERE salary_norm IS NOT NULL
+                GROUP BY GROUPING SETS ((company_id), ());
+
+            CREATE UNIQUE INDEX IF NOT EXISTS salary_stats_key ON salary_stats (is_total, company_id);
+            """)
+
+    @invalidates_cache
+    def insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(self,
+                                                                             data: Iterable[Vacancy | Employer],
+                                                                             table: str,
+                                                                             batch_size: int | None = None
+                                                                             ) -> dict[int, str]:
         """
         Заполняет таблицу данными и возвращает словарь с данными, где ключом является id работодателя,
         а значением - api - ссылка на вакансии работодателя, для дальнейшего использования по парсингу вакансий
         работодателя и заполнению таблицы vacancies.
 
+        Если передан batch_size, строки вставляются пакетами многострочными INSERT ... VALUES
+        (по одному обращению к серверу на пакет), иначе - по одной строке за запрос.
+
         Args:
-             data(list[Vacancy | Employer]): список с объектами класса Вакансия или Работодатель
+             data(Iterable[Vacancy | Employer]): объекты класса Вакансия или Работодатель
              table(str): наименование таблицы
+             batch_size(int | None): размер пакета для массовой вставки.
         Returns:
             dict[int, str]: словарь с данными, где ключом является id работодателя,
             а значением - api - ссылка на вакансии работодателя.
         """
+        if table not in ("companies", "vacancies"):
+            raise ValueError(f"Таблица '{table}' не найдена.")
+
+        if batch_size is not None:
+            if table == "companies":
+                return self.insert_companies_bulk(data, batch_size)
+            self.insert_vacancies_bulk(data, batch_size)
+            return {}
+
         data_id_and_vacancies_url: dict[int, str] = {}
 
         if table == "companies":
-            with self.conn.cursor() as cur:
+            with self._connection() as conn, conn.cursor() as cur:
                 sql = """
                 INSERT INTO companies (employer_id, name, alternate_url, city,
                 description, site_url, vacancies_url, open_vacancies) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (employer_id) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    alternate_url = EXCLUDED.alternate_url,
+                    city = EXCLUDED.city,
+                    description = EXCLUDED.description,
+                    site_url = EXCLUDED.site_url,
+                    vacancies_url = EXCLUDED.vacancies_url,
+                    open_vacancies = EXCLUDED.open_vacancies
                 RETURNING id, vacancies_url;
             """
                 for item in data:
-                    cur.execute(sql, (item.employer_id, item.name,
-                                      item.alternate_url, item.city,
-                                      item.description, item.site_url, item.vacancies_url, item.open_vacancies))
+                    cur.execute(sql, self._company_row(item))
 
                     row = cur.fetchone()
                     if row:
                         data_id_and_vacancies_url[row[0]] = row[1]
 
-            self.conn.commit()
-
-        elif table == "vacancies":
-            with self.conn.cursor() as cur:
-                sql = f"""
-                INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement)
-                VALUES (%s, %s, %s, %s, %s, %s, %s);
+        else:
+            with self._connection() as conn, conn.cursor() as cur:
+                sql = """
+                INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                       salary_norm)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (vacancy_id) DO NOTHING;
             """
                 for item in data:
-                    cur.execute(sql, (item.vacancy_id, item.name, item.company_id, item.url,
-                                      item.salary['from'], item.salary['to'], item.requirement))
+                    cur.execute(sql, self._vacancy_row(item))
 
-            self.conn.commit()
+            self._refresh_salary_stats()
 
-        else:
-            raise ValueError(f"Таблица '{table}' не найдена.")
+        return data_id_and_vacancies_url
+
+    @invalidates_cache
+    def insert_companies_bulk(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Массово вставляет работодателей пакетами INSERT ... VALUES ... RETURNING; уже существующие
+        работодатели (по employer_id) обновляются, например, в таблицах, оставшихся от прерванной загрузки.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк в одном запросе.
+        Returns:
+            dict[int, str]: словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+        """
+        data_id_and_vacancies_url: dict[int, str] = {}
+
+        with self._connection() as conn, conn.cursor() as cur:
+            # строка не может обновляться дважды одним INSERT ... ON CONFLICT DO UPDATE
+            for batch in self._batches(self._unique_rows((self._company_row(item) for item in data)), batch_size):
+                rows = execute_values(cur, """
+                    INSERT INTO companies (employer_id, name, alternate_url, city,
+                    description, site_url, vacancies_url, open_vacancies) VALUES %s
+                    ON CONFLICT (employer_id) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        alternate_url = EXCLUDED.alternate_url,
+                        city = EXCLUDED.city,
+                        description = EXCLUDED.description,
+                        site_url = EXCLUDED.site_url,
+                        vacancies_url = EXCLUDED.vacancies_url,
+                        open_vacancies = EXCLUDED.open_vacancies
+                    RETURNING id, vacancies_url;
+                """, batch, page_size=len(batch), fetch=True)
+                data_id_and_vacancies_url.update(rows)
+
+        return data_id_and_vacancies_url
+
+    @invalidates_cache
+    def insert_vacancies_bulk(self, data: Iterable[Vacancy], batch_size: int = db_batch_size) -> int:
+        """
+        Массово вставляет вакансии пакетами многострочных INSERT ... VALUES.
+
+        Данные читаются из итератора по одному пакету, поэтому можно передавать генератор
+        Parser.iter_vacancies без сборки полного списка.
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             batch_size(int): число строк в одном запросе.
+        Returns:
+            int: количество вставленных строк.
+        """
+        inserted = 0
+
+        with self._connection() as conn, conn.cursor() as cur:
+            for batch in self._batches((self._vacancy_row(item) for item in data), batch_size):
+                execute_values(cur, """
+                    INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                           salary_norm)
+                    VALUES %s
+                    ON CONFLICT (vacancy_id) DO NOTHING;
+                """, batch, page_size=len(batch))
+                inserted += cur.rowcount
+
+        self._refresh_salary_stats()
+        return inserted
+
+    @invalidates_cache
+    def sync_companies(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Синхронизирует работодателей с таблицей companies по employer_id.
+
+        Новые работодатели добавляются, изменившиеся - обновляются (INSERT ... ON CONFLICT DO UPDATE),
+        строки с неизменившимися данными не перезаписываются.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк в одном запросе.
+        Returns:
+            dict[int, str]: словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+        """
+        employer_ids: list[str] = []
+
+        with self._connection() as conn, conn.cursor() as cur:
+            for batch in self._batches(self._unique_rows((self._company_row(item) for item in data)), batch_size):
+                execute_values(cur, """
+                    INSERT INTO companies (employer_id, name, alternate_url, city,
+                    description, site_url, vacancies_url, open_vacancies) VALUES %s
+                    ON CONFLICT (employer_id) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        alternate_url = EXCLUDED.alternate_url,
+                        city = EXCLUDED.city,
+                        description = EXCLUDED.description,
+                        site_url = EXCLUDED.site_url,
+                        vacancies_url = EXCLUDED.vacancies_url,
+                        open_vacancies = EXCLUDED.open_vacancies
+                    WHERE (companies.name, companies.alternate_url, companies.city, companies.description,
+                           companies.site_url, companies.vacancies_url, companies.open_vacancies)
+                    IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.alternate_url, EXCLUDED.city, EXCLUDED.description,
+                                      EXCLUDED.site_url, EXCLUDED.vacancies_url, EXCLUDED.open_vacancies);
+                """, batch, page_size=len(batch))
+                employer_ids.extend(row[0] for row in batch)
+
+            # RETURNING не возвращает пропущенные неизменившиеся строки, поэтому словарь строим отдельным запросом
+            cur.execute("""
+                SELECT id, vacancies_url FROM companies WHERE employer_id = ANY(%s);
+            """, (employer_ids,))
+            data_id_and_vacancies_url: dict[int, str] = dict(cur.fetchall())
 
         return data_id_and_vacancies_url
 
+    @invalidates_cache
+    def sync_vacancies(self, data: Iterable[Vacancy], company_ids: Iterable[int],
+                       batch_size: int = db_batch_size) -> dict[str, int]:
+        """
+        Синхронизирует вакансии с таблицей vacancies по vacancy_id.
+
+        Новые вакансии добавляются, изменившиеся - обновляются, неизменившиеся не перезаписываются.
+        У изменившихся вакансий сбрасывается enriched_at, и их подробности будут получены заново.
+        Вакансии работодателей из company_ids, которых нет в data, удаляются как снятые с hh.ru.
+        company_ids читается после того, как data исчерпан, поэтому можно передавать
+        Parser.completed_companies вместе с генератором Parser.iter_vacancies: тогда вакансии
+        работодателей, обход которых завершился с ошибкой, не удаляются.
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             company_ids(Iterable[int]): id работодателей, вакансии которых получены полностью.
+             batch_size(int): число строк в одном запросе.
+        Returns:
+            dict[str, int]: количество добавленных, обновленных, неизменившихся и удаленных вакансий.
+        """
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE seen_vacancies (vacancy_id TEXT PRIMARY KEY) ON COMMIT DROP;
+            """)
+
+            for batch in self._batches(self._unique_rows((self._vacancy_row(item) for item in data)), batch_size):
+                # xmax = 0 только у только что вставленных строк
+                rows = execute_values(cur, """
+                    INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                           salary_norm)
+                    VALUES %s
+                    ON CONFLICT (vacancy_id) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        company_id = EXCLUDED.company_id,
+                        url = EXCLUDED.url,
+                        salary_min = EXCLUDED.salary_min,
+                        salary_max = EXCLUDED.salary_max,
+                        requirement = EXCLUDED.requirement,
+                        salary_norm = EXCLUDED.salary_norm,
+                        -- подробности устаревают при изменении вакансии, но не при пересчете salary_norm
+                        enriched_at = CASE
+                            WHEN (vacancies.name, vacancies.url, vacancies.salary_min, vacancies.salary_max,
+                                  vacancies.requirement)
+                            IS NOT DISTINCT FROM (EXCLUDED.name, EXCLUDED.url, EXCLUDED.salary_min,
+                                                  EXCLUDED.salary_max, EXCLUDED.requirement)
+                            THEN vacancies.enriched_at
+                        END
+                    WHERE (vacancies.name, vacancies.company_id, vacancies.url, vacancies.salary_min,
+                           vacancies.salary_max, vacancies.requirement, vacancies.salary_norm)
+                    IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.company_id, EXCLUDED.url, EXCLUDED.salary_min,
+                                      EXCLUDED.salary_max, EXCLUDED.requirement, EXCLUDED.salary_norm)
+                    RETURNING (xmax = 0);
+                """, batch, page_size=len(batch), fetch=True)
+                inserted = sum(1 for (is_new,) in rows if is_new)
+                stats["inserted"] += inserted
+                stats["updated"] += len(rows) - inserted
+                stats["unchanged"] += len(batch) - len(rows)
+
+                execute_values(cur, """
+                    INSERT INTO seen_vacancies (vacancy_id) VALUES %s ON CONFLICT DO NOTHING;
+                """, [(row[0],) for row in batch], page_size=len(batch))
+
+            cur.execute("""
+                DELETE FROM vacancies AS v
+                WHERE v.company_id = ANY(%s)
+                AND NOT EXISTS (SELECT 1 FROM seen_vacancies AS s WHERE s.vacancy_id = v.vacancy_id);
+            """, (list(company_ids),))
+            stats["deleted"] = cur.rowcount
+
+        if stats["inserted"] or stats["updated"] or stats["deleted"]:
+            self._refresh_salary_stats()
+        return stats
+
+    def get_vacancies_to_enrich(self, limit: int | None = None) -> list[tuple[str, str]]:
+        """
+        Получает вакансии, подробности которых еще не получены или устарели (enriched_at IS NULL),
+        в порядке добавления. Результат не кэшируется.
+
+        Args:
+            limit(int | None): максимальное число вакансий, по умолчанию - все.
+        Returns:
+            list[tuple[str, str]]: пары (vacancy_id, api - ссылка на вакансию).
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT vacancy_id, url FROM vacancies
+                WHERE enriched_at IS NULL
+                ORDER BY id
+                LIMIT %s;
+            """, (limit,))
+            return cur.fetchall()
+
+    @invalidates_cache
+    def update_vacancy_details(self, data: Iterable[VacancyDetails], batch_size: int = db_batch_size) -> int:
+        """
+        Записывает подробности вакансий и отмечает время их получения (enriched_at).
+
+        Каждый пакет записывается одним UPDATE ... FROM (VALUES ...) и фиксируется отдельной
+        транзакцией: соединение не занято, пока подробности следующего пакета запрашиваются с hh.ru,
+        а прерванное получение подробностей продолжается с места остановки.
+
+        Args:
+            data(Iterable[VacancyDetails]): подробности вакансий, например из Parser.iter_vacancy_details.
+            batch_size(int): число строк в одной транзакции.
+        Returns:
+            int: количество обновленных вакансий.
+        """
+        updated = 0
+
+        for batch in self._batches(self._unique_rows(data), batch_size):
+            with self._connection() as conn, conn.cursor() as cur:
+                execute_values(cur, """
+                    UPDATE vacancies AS v SET
+                        description = d.description,
+                        key_skills = d.key_skills,
+                        experience = d.experience,
+                        schedule = d.schedule,
+                        enriched_at = now()
+                    FROM (VALUES %s) AS d (vacancy_id, description, key_skills, experience, schedule)
+                    WHERE v.vacancy_id = d.vacancy_id;
+                """, batch, page_size=len(batch))
+                updated += cur.rowcount
+
+        return updated
+
+    @invalidates_cache
+    def load_snapshot(self, snapshot: Snapshot) -> dict[str, int]:
+        """
+        Загружает снимок данных (см. src/snapshot.py) в таблицы companies и vacancies.
+
+        Столбцы снимка передаются серверу потоком COPY во временные таблицы, откуда переносятся
+        одним INSERT ... SELECT на таблицу; пустые строки снимка становятся NULL. Уже существующие работодатели (по employer_id) и вакансии
+        (по vacancy_id) сохраняются, вакансии снимка привязываются к работодателям по employer_id.
+
+        Args:
+            snapshot(Snapshot): открытый снимок данных.
+        Returns:
+            dict[str, int]: количество добавленных работодателей и вакансий.
+        """
+        companies = snapshot.table("companies")
+        vacancies = snapshot.table("vacancies")
+
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE snapshot_companies (
+                    id INTEGER, employer_id TEXT, name TEXT, alternate_url TEXT, city TEXT, description TEXT,
+                    site_url TEXT, vacancies_url TEXT, open_vacancies INTEGER
+                ) ON COMMIT DROP;
+                CREATE TEMP TABLE snapshot_vacancies (
+                    vacancy_id TEXT, name TEXT, company_id INTEGER, url TEXT, salary_min INTEGER,
+                    salary_max INTEGER, requirement TEXT, salary_norm INTEGER, description TEXT, key_skills TEXT,
+                    experience TEXT, schedule TEXT, enriched_at TEXT
+                ) ON COMMIT DROP;
+            """)
+            cur.copy_expert("COPY snapshot_companies FROM STDIN",
+                            _CopyReader(companies.rows(column for column, _ in COMPANY_COLUMNS)))
+            cur.copy_expert("COPY snapshot_vacancies FROM STDIN", _CopyReader(vacancy_rows(vacancies)))
+
+            cur.execute("""
+                INSERT INTO companies (employer_id, name, alternate_url, city,
+                description, site_url, vacancies_url, open_vacancies)
+                SELECT employer_id, name, alternate_url, city, description, site_url, vacancies_url, open_vacancies
+                FROM snapshot_companies
+                ORDER BY id
+                ON CONFLICT (employer_id) DO NOTHING;
+            """)
+            stats = {"companies": cur.rowcount}
+
+            cur.execute("""
+                INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                       salary_norm, description, key_skills, experience, schedule, enriched_at)
+                SELECT v.vacancy_id, v.name, c.id, v.url, v.salary_min, v.salary_max, v.requirement,
+                       NULLIF(v.salary_norm, 0), NULLIF(v.description, ''), NULLIF(v.key_skills, ''),
+                       NULLIF(v.experience, ''), NULLIF(v.schedule, ''), NULLIF(v.enriched_at, '')::timestamptz
+                FROM snapshot_vacancies AS v
+                JOIN snapshot_companies AS s ON s.id = v.company_id
+                JOIN companies AS c ON c.employer_id = s.employer_id
+                ON CONFLICT (vacancy_id) DO NOTHING;
+            """)
+            stats["vacancies"] = cur.rowcount
+
+        self._refresh_salary_stats()
+        return stats
+
+    def _refresh_salary_stats(self) -> None:
+        """
+        Пересчитывает материализованную статистику по зарплатам отдельной транзакцией после фиксации записи.
+
+        Обновление CONCURRENTLY (по уникальному индексу salary_stats_key) не блокирует чтение статистики:
+        до его завершения get_avg_salary, get_salary_stats и выборки выше средней видят прежние значения.
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY salary_stats;")
+
+    @invalidates_cache
     def drop_table(self, table: str) -> None:
         """
         Удаляет таблицу, если она существует.
+        Вместе с таблицей vacancies удаляется построенная по ней статистика salary_stats.
 
         Args:
              table(str): наименование таблицы.
         """
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
+            if table == "vacancies":
+                cur.execute("DROP MATERIALIZED VIEW IF EXISTS salary_stats;")
             cur.execute(f"""
                    DROP TABLE IF EXISTS {table};
                """)
-        self.conn.commit()
 
+    @invalidates_cache
+    def remove_duplicates(self) -> dict[str, int]:
+        """
+        Удаляет повторы работодателей и вакансий, оставшиеся от схемы без уникальных ключей,
+        одной транзакцией; после удаления create_table создает уникальные индексы.
+
+        Из повторов работодателя остается строка с наименьшим id, вакансии удаляемых строк переносятся на нее;
+        из повторов вакансии остается строка с наименьшим id.
+
+        Returns:
+            dict[str, int]: число удаленных работодателей ("companies"), перенесенных на оставшегося
+            работодателя вакансий ("moved_vacancies") и удаленных вакансий ("vacancies").
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                UPDATE vacancies AS v SET company_id = k.keep_id
+                FROM (SELECT id, MIN(id) OVER (PARTITION BY employer_id) AS keep_id FROM companies) AS k
+                WHERE v.company_id = k.id AND k.id <> k.keep_id;
+            """)
+            moved = cur.rowcount
+            cur.execute("""
+                DELETE FROM companies AS c USING companies AS k
+                WHERE c.employer_id = k.employer_id AND c.id > k.id;
+            """)
+            companies = cur.rowcount
+            cur.execute("""
+                DELETE FROM vacancies AS v USING vacancies AS k
+                WHERE v.vacancy_id = k.vacancy_id AND v.id > k.id;
+            """)
+            vacancies = cur.rowcount
+
+        return {"companies": companies, "moved_vacancies": moved, "vacancies": vacancies}
+
+    @cached_query
     def get_companies_and_vacancies_count(self) -> list[tuple[Any, ...]]:
         """
         Получает список всех компаний и количество вакансий у каждой компании.
@@ -145,7 +1173,7 @@ class DBManager(AbstractDBManager):
         Returns:
             list[tuple[Any, ...]]: список всех компаний и количество вакансий у каждой компании.
         """
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
                     SELECT companies.name, COUNT(vacancies.id)
                     FROM companies
@@ -155,10 +1183,9 @@ class DBManager(AbstractDBManager):
 
             results: list[tuple[Any, ...]] = cur.fetchall()
 
-        self.conn.commit()
-
         return results
 
+    @cached_query
     def get_all_vacancies(self) -> list[tuple[Any, ...]]:
         """
         Получает список всех вакансий с указанием названия компании, названия вакансии
@@ -168,7 +1195,7 @@ class DBManager(AbstractDBManager):
             list[tuple[Any, ...]]: список всех вакансий с указанием названия компании, названия вакансии
         и зарплаты и ссылки на вакансию.
         """
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
                     SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
                     FROM vacancies as v
@@ -176,81 +1203,386 @@ class DBManager(AbstractDBManager):
                 """)
             results: list[tuple[Any, ...]] = cur.fetchall()
 
-        self.conn.commit()
-
         return results if results is not None else "Вакансии не найдены"
 
+    @cached_query
     def get_avg_salary(self) -> float:
         """
-        Получает среднюю зарплату по вакансиям.
+        Получает среднюю зарплату по вакансиям из статистики salary_stats.
 
         Returns:
             float: Средняя зарплата по вакансиям.
         """
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
-                SELECT AVG((salary_min + salary_max) / 2.0) AS avg_salary
-                FROM vacancies
-                WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL;
+                SELECT avg_salary FROM salary_stats WHERE is_total;
             """)
 
             result: tuple[Any, ...] | None = cur.fetchone()
-            avg_salary = result[0] if result[0] is not None else 0.0
+            avg_salary = result[0] if result is not None and result[0] is not None else 0.0
 
         return round(avg_salary, 2)
 
+    @cached_query
+    def get_salary_stats(self) -> list[tuple[Any, ...]]:
+        """
+        Получает статистику по зарплатам: сначала по всем вакансиям, затем по каждой компании.
+
+        Returns:
+            list[tuple[Any, ...]]: строки (компания, число вакансий, средняя, медианная,
+            минимальная и максимальная зарплата); для итоговой строки компания - "Все компании".
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT CASE WHEN s.is_total THEN 'Все компании' ELSE c.name END,
+                       s.vacancies_count, ROUND(s.avg_salary, 2), s.median_salary, s.min_salary, s.max_salary
+                FROM salary_stats AS s
+                LEFT JOIN companies AS c ON s.company_id = c.id
+                ORDER BY s.is_total DESC, c.name;
+            """)
+            results: list[tuple[Any, ...]] = cur.fetchall()
+
+        return results
+
+    @cached_query
     def get_vacancies_with_higher_salary(self) -> list[tuple[Any, ...]]:
         """
         Получает список всех вакансий, у которых зарплата выше средней по всем вакансиям.
 
+        Средняя берется из статистики salary_stats, вакансии отбираются одним проходом
+        по индексу на salary_norm.
+
         Returns:
             list[tuple[Any, ...]]: Список вакансий с зарплатой выше средней.
         """
-        with self.conn.cursor() as cur:
-            # Первый запрос: получаем среднюю зарплату
-            cur.execute("""
-                SELECT AVG((salary_min + salary_max) / 2.0) AS avg_salary
-                FROM vacancies
-                WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL;
-            """)
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(self._HIGHER_SALARY_SQL)
+            vacancies_data: list[tuple[Any, ...]] = cur.fetchall()
 
-            result: tuple[Any, ...] | None = cur.fetchone()
-            avg_salary = result[0] if result[0] is not None else 0.0
+        return vacancies_data
 
-            # Второй запрос: получаем вакансии с зарплатой выше средней
-            cur.execute(f"""
-                SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
-                FROM vacancies as v
-                JOIN companies as c ON v.company_id = c.id
-                WHERE (v.salary_min + v.salary_max) / 2.0 > {avg_salary};
-            """)
+    @cached_query
+    def get_vacancies_by_salary(self, salary_from: int | None = None, salary_to: int | None = None,
+                                limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Получает вакансии с зарплатой в базовой валюте (salary_norm) от salary_from до salary_to
+        включительно, от большей зарплаты к меньшей.
+
+        Отбор и порядок обслуживаются индексом на salary_norm, поэтому с limit запрос читает
+        только limit записей индекса (top-N по зарплате). Вакансии без зарплаты не возвращаются.
 
+        Args:
+            salary_from(int | None): нижняя граница зарплаты, по умолчанию - без ограничения.
+            salary_to(int | None): верхняя граница зарплаты, по умолчанию - без ограничения.
+            limit(int | None): максимальное число результатов, по умолчанию - все.
+        Returns:
+            list[tuple[Any, ...]]: строки (компания, вакансия, salary_min, salary_max, ссылка, salary_norm).
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(self._SALARY_RANGE_SQL, {"salary_from": salary_from, "salary_to": salary_to, "limit": limit})
             vacancies_data: list[tuple[Any, ...]] = cur.fetchall()
 
         return vacancies_data
 
+    @cached_query
     def get_vacancies_with_keyword(self, keyword: str) -> list[tuple[Any, ...]]:
         """
-        Получает список всех вакансий, в названии которых содержатся переданные в метод слова, например, python.
+        Получает список всех вакансий, в названии или требованиях которых содержатся переданные в метод слова,
+        например, python. Результаты отсортированы по релевантности (см. search_vacancies).
 
         Args:
             keyword (str): переданное в запрос слово
         Returns:
             list[tuple[Any, ...]]: список всех вакансий, в названии которых содержатся переданные в метод слова.
         """
-        with self.conn.cursor() as cur:
-            # Используем параметризацию для безопасности
-            cur.execute("""
-                SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
-                FROM vacancies AS v
-                JOIN companies AS c ON v.company_id = c.id
-                WHERE v.name LIKE %s;
-            """, (f'%{keyword}%',))
+        # кэшируется сам этот вызов, поэтому результат поиска отдельно не сохраняется
+        return self.search_vacancies(keyword, use_cache=False)
 
+    @cached_query
+    def search_vacancies(self, query: str, limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Ищет вакансии по названию и требованиям с ранжированием по релевантности.
+
+        Вакансия подходит, если выполняется одно из условий:
+        - все слова запроса встречаются в названии или требованиях с учетом русской и английской
+          морфологии (индекс GIN по search_vector); поддерживается синтаксис websearch: "фраза", -слово, or;
+        - запрос целиком встречается как подстрока без учета регистра (триграммные индексы);
+        - запрос похож на слово в названии с учетом опечаток (word_similarity из pg_trgm).
+        Совпадения в названии весят больше, чем в требованиях.
+
+        Args:
+            query(str): поисковый запрос из одного или нескольких слов.
+            limit(int | None): максимальное число результатов, по умолчанию - без ограничения.
+        Returns:
+            list[tuple[Any, ...]]: список найденных вакансий, от наиболее релевантных.
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(self._KEYWORD_SEARCH_SQL, self._search_params(query, limit))
             vacancies_data: list[tuple[Any, ...]] = cur.fetchall()
 
         return vacancies_data
 
+    @staticmethod
+    def _search_params(query: str, limit: int | None) -> dict[str, Any]:
+        """
+        Возвращает параметры поискового запроса; спецсимволы LIKE в запросе экранируются.
+        """
+        escaped = query.strip().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return {"query": query.strip(), "pattern": f"%{escaped}%", "limit": limit}
+
+    @cached_query
+    def get_vacancies_page(self, after: str | None = None, limit: int = db_page_size, order: str = "id") -> Page:
+        """
+        Получает страницу списка всех вакансий (keyset-пагинация по индексу, см. _VACANCIES_BY_ID_PAGE_SQL):
+        время получения страницы не зависит от ее номера.
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+            order(str): "id" - в порядке добавления, "salary" - вакансии с зарплатой, от большей к меньшей.
+        Returns:
+            Page: вакансии страницы (как в get_all_vacancies) и курсор следующей страницы.
+        """
+        if order == "id":
+            (last_id,) = self._page_key(after, (0,), limit)
+            return self._fetch_page(self._VACANCIES_BY_ID_PAGE_SQL, {"id": last_id}, limit, 1)
+        if order == "salary":
+            salary, last_id = self._page_key(after, (self._MAX_KEY, self._MAX_KEY), limit)
+            return self._fetch_page(self._VACANCIES_BY_SALARY_PAGE_SQL, {"salary": salary, "id": last_id}, limit, 2)
+        raise ValueError(f"Неизвестный порядок вакансий: {order!r}")
+
+    @cached_query
+    def get_vacancies_with_higher_salary_page(self, after: str | None = None, limit: int = db_page_size) -> Page:
+        """
+        Получает страницу вакансий с зарплатой выше средней, от большей зарплаты к меньшей
+        (keyset-пагинация по индексу на (salary_norm, id)).
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        Returns:
+            Page: вакансии страницы и курсор следующей страницы.
+        """
+        salary, last_id = self._page_key(after, (self._MAX_KEY, self._MAX_KEY), limit)
+        return self._fetch_page(self._HIGHER_SALARY_PAGE_SQL, {"salary": salary, "id": last_id}, limit, 2)
+
+    @cached_query
+    def get_vacancies_with_keyword_page(self, keyword: str, after: str | None = None,
+                                        limit: int = db_page_size) -> Page:
+        """
+        Получает страницу вакансий, найденных по ключевому слову, от наиболее релевантных (см. search_vacancies).
+
+        Args:
+            keyword (str): переданное в запрос слово
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        Returns:
+            Page: вакансии страницы и курсор следующей страницы.
+        """
+        score, last_id = self._page_key(after, (float("-inf"), 0), limit)
+        return self._fetch_page(self._KEYWORD_PAGE_SQL,
+                                self._search_params(keyword, None) | {"score": score, "id": last_id}, limit, 2)
+
+    def _fetch_page(self, sql: str, params: dict[str, Any], limit: int, key_size: int) -> Page:
+        """
+        Выполняет постраничный запрос с LIMIT limit + 1 и собирает страницу (см. AbstractDBManager._page).
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params | {"limit": limit + 1})
+            rows: list[tuple[Any, ...]] = cur.fetchall()
+
+        return self._page(rows, limit, key_size)
+
+    def iter_all_vacancies(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем вакансиям с указанием названия компании, названия вакансии,
+        зарплаты и ссылки на вакансию.
+
+        Строки читаются серверным курсором порциями по itersize, поэтому память не зависит
+        от размера таблицы. Итератор читает через отдельное соединение (см. _stream).
+
+        Args:
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям.
+        """
+        return self._stream("""
+            SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+            FROM vacancies as v
+            JOIN companies as c ON v.company_id = c.id;
+        """, (), itersize)
+
+    def iter_vacancies_with_higher_salary(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по вакансиям, у которых зарплата выше средней по всем вакансиям.
+
+        Args:
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям с зарплатой выше средней.
+        """
+        return self._stream(self._HIGHER_SALARY_SQL, (), itersize)
+
+    def iter_vacancies_with_keyword(self, keyword: str,
+                                    itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по вакансиям, найденным по ключевому слову (см. search_vacancies).
+
+        Args:
+            keyword (str): переданное в запрос слово
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по найденным вакансиям, от наиболее релевантных.
+        """
+        return self._stream(self._KEYWORD_SEARCH_SQL, self._search_params(keyword, None), itersize)
+
+    def iter_vacancy_salaries(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по строкам (vacancy_id, company_id, salary_min, salary_max, salary_norm)
+        всех вакансий для построения VacancyTable.
+
+        Args:
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по зарплатам вакансий.
+        """
+        return self._stream("""
+            SELECT vacancy_id, company_id, salary_min, salary_max, salary_norm FROM vacancies;
+        """, (), itersize)
+
+    def iter_company_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем строкам таблицы companies в порядке столбцов снимка (COMPANY_COLUMNS).
+
+        Args:
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по работодателям.
+        """
+        return self._stream("""
+            SELECT id, employer_id, name, alternate_url, city, description, site_url, vacancies_url, open_vacancies
+            FROM companies
+            ORDER BY id;
+        """, (), itersize)
+
+    def iter_vacancy_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем строкам таблицы vacancies в порядке столбцов снимка (VACANCY_COLUMNS).
+
+        Args:
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям.
+        """
+        return self._stream("""
+            SELECT vacancy_id, name, company_id, url, salary_min, salary_max, requirement, salary_norm,
+                   description, key_skills, experience, schedule,
+                   to_char(enriched_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+            FROM vacancies
+            ORDER BY id;
+        """, (), itersize)
+
+    def _stream(self, sql: str, params: tuple[Any, ...] | dict[str, Any], itersize: int) -> Iterator[tuple[Any, ...]]:
+        """
+        Выполняет запрос именованным (серверным) курсором и отдает строки по мере получения.
+
+        Запрос выполняется на отдельном соединении (_stream_connection), которое занято до исчерпания
+        или закрытия итератора. Поэтому недочитанный итератор не блокирует другие вызовы менеджера,
+        а их транзакции не закрывают серверный курсор итератора.
+
+        Args:
+            sql(str): текст запроса.
+            params(tuple[Any, ...] | dict[str, Any]): параметры запроса.
+            itersize(int): число строк, получаемых с сервера за одно обращение.
+        """
+        with self._stream_connection() as conn, conn.cursor(name=f"stream_{next(self._cursor_ids)}") as cur:
+            cur.itersize = itersize
+            cur.execute(sql, params)
+            yield from cur
+
+    @contextmanager
+    def _stream_connection(self) -> Iterator[connection]:
+        """
+        Выдает новое соединение для потокового чтения и закрывает его по завершении.
+
+        Основное соединение DBManager одно на все вызовы, поэтому итератору нужно свое.
+        """
+        conn = psycopg2.connect(**self._connect_params)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+class PooledDBManager(DBManager):
+    """
+    Представляет менеджер БД с пулом соединений.
+
+    Каждый вызов метода берет отдельное соединение из пула и возвращает его по завершении транзакции,
+    поэтому методы можно вызывать одновременно из разных потоков. Если свободных соединений нет,
+    вызов ждет, пока одно из них не вернется в пул.
+    """
+
+    def __init__(self, dbname: str, user: str, password: str, host: str, port: int,
+                 min_size: int = db_pool_min_size, max_size: int = db_pool_max_size,
+                 query_cache_size: int = db_query_cache_size):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Некорректные размеры пула соединений.")
+
+        self.pool = ThreadedConnectionPool(min_size, max_size, dbname=dbname, user=user, password=password,
+                                           host=host, port=port, cursor_factory=InstrumentedCursor)
+        # ThreadedConnectionPool при исчерпании пула выбрасывает исключение, семафор заставляет ждать
+        self._slots = threading.BoundedSemaphore(max_size)
+        self.query_cache = QueryCache(query_cache_size)
+
+    @contextmanager
+    def _connection(self) -> Iterator[connection]:
+        with self._slots:
+            conn = self.pool.getconn()
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self.pool.putconn(conn)
+
+    def _stream_connection(self) -> AbstractContextManager[connection]:
+        """
+        Выдает для потокового чтения отдельное соединение из пула на все время чтения.
+        """
+        return self._connection()
+
+    def close(self) -> None:
+        """
+        Закрывает все соединения пула.
+        """
+        self.pool.closeall()
+
+
+def create_db_manager(backend: str | None = None, **params: Any) -> AbstractDBManager:
+    """
+    Создает менеджер БД выбранной СУБД.
+
+    Args:
+        backend(str | None): "postgresql" или "sqlite", по умолчанию - выбранная в database.ini (get_db_backend).
+        **params: параметры подключения, по умолчанию - из секции СУБД в database.ini (config).
+    Returns:
+        AbstractDBManager: DBManager или SQLiteDBManager.
+    """
+    backend = backend if backend is not None else get_db_backend()
+    if not params:
+        params = config(section=backend)
+
+    if backend == "postgresql":
+        return DBManager(**params)
+    if backend == "sqlite":
+        # импорт здесь: модуль SQLite сам импортирует этот модуль
+        from src.sqlite_dbmanager import SQLiteDBManager
+        return SQLiteDBManager(**params)
+    raise ValueError(f"Неизвестная СУБД: {backend}")
+
 #
 # if __name__ == "__main__":
 #     params = config()
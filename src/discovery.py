@@ -0,0 +1,129 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+
+class DiscoveryCheckpoint:
+    """
+    Представляет состояние обхода поиска работодателей (/employers): для каждого поискового запроса -
+    число страниц выдачи, полученные страницы и найденные id работодателей.
+
+    После каждой полученной страницы состояние записывается в файл (через временный файл и замену,
+    поэтому прерывание не оставляет поврежденный файл), и прерванный обход продолжается
+    только с недостающих страниц. Без файла состояние хранится только в памяти.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Конструктор экземпляра класса DiscoveryCheckpoint.
+
+        Args:
+            path(Path | None): файл состояния; если он существует, состояние загружается из него.
+        """
+        self.__path: Path | None = path
+        self.__queries: dict[str, dict[str, Any]] = {}
+        if path is not None and path.exists():
+            with open(path, encoding="utf-8") as file:
+                self.__queries = json.load(file).get("queries", {})
+
+    @property
+    def path(self):
+        return self.__path
+
+    @staticmethod
+    def query_key(params: dict[str, Any]) -> str:
+        """
+        Возвращает ключ поискового запроса: параметры без номера страницы в стабильном порядке.
+        """
+        return json.dumps({key: value for key, value in params.items() if key != "page"},
+                          sort_keys=True, ensure_ascii=False)
+
+    def add_query(self, key: str) -> None:
+        """
+        Добавляет запрос в обход, если его еще нет (число страниц неизвестно до получения первой).
+        """
+        self.__queries.setdefault(key, {"pages": None, "done": [], "employers": {}})
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """
+        Удаляет из состояния запросы, которых нет в keys (например, после изменения регионов или отрасли).
+        """
+        keep = set(keys)
+        self.__queries = {key: query for key, query in self.__queries.items() if key in keep}
+
+    def pages(self, key: str) -> int | None:
+        """
+        Возвращает число страниц выдачи запроса или None, если первая страница еще не получена.
+        """
+        return self.__queries[key]["pages"]
+
+    def pending_pages(self, key: str) -> list[int]:
+        """
+        Возвращает номера еще не полученных страниц запроса; пока число страниц неизвестно - только первую.
+        """
+        query = self.__queries[key]
+        if query["pages"] is None:
+            return [0]
+        done = set(query["done"])
+        return [page for page in range(query["pages"]) if page not in done]
+
+    def record_page(self, key: str, page: int, pages: int, employer_ids: list[str]) -> None:
+        """
+        Отмечает страницу запроса полученной, добавляет найденных работодателей и сохраняет состояние.
+
+        Args:
+            key(str): ключ запроса (query_key).
+            page(int): номер страницы.
+            pages(int): число страниц выдачи запроса.
+            employer_ids(list[str]): id работодателей на странице.
+        """
+        query = self.__queries[key]
+        query["pages"] = pages
+        if page not in query["done"]:
+            query["done"].append(page)
+        query["employers"][str(page)] = employer_ids
+        self.save()
+
+    def is_complete(self, keys: Iterable[str] | None = None) -> bool:
+        """
+        Проверяет, получены ли все страницы запросов keys (по умолчанию - всех запросов).
+        """
+        queries = self.__queries.values() if keys is None else (self.__queries[key] for key in keys)
+        return all(query["pages"] is not None and len(query["done"]) >= query["pages"] for query in queries)
+
+    def employer_ids(self, keys: Iterable[str] | None = None) -> list[str]:
+        """
+        Возвращает id работодателей, найденных запросами keys (по умолчанию - всеми запросами),
+        без повторов в порядке запросов и страниц.
+        """
+        seen: set[str] = set()
+        ids: list[str] = []
+        queries = self.__queries.values() if keys is None else (self.__queries[key] for key in keys)
+        for query in queries:
+            for page in sorted(query["employers"], key=int):
+                for employer_id in query["employers"][page]:
+                    if employer_id not in seen:
+                        seen.add(employer_id)
+                        ids.append(employer_id)
+        return ids
+
+    def save(self) -> None:
+        """
+        Записывает состояние в файл, если он задан.
+        """
+        if self.__path is None:
+            return
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.__path.with_name(self.__path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"queries": self.__queries}, file, ensure_ascii=False)
+        os.replace(tmp_path, self.__path)
+
+    def clear(self) -> None:
+        """
+        Сбрасывает состояние и удаляет файл: следующий обход начнется сначала.
+        """
+        self.__queries = {}
+        if self.__path is not None:
+            self.__path.unlink(missing_ok=True)
@@ -5,6 +5,7 @@ class BaseEmployer(ABC):
     """
     Представляет абстрактный класс Работодатель.
     """
+    __slots__ = ()
 
     @classmethod
     @abstractmethod
@@ -23,6 +24,9 @@ class Employer(BaseEmployer):
     """
     Представляет класс Работодатель.
     """
+    __slots__ = ('__employer_id', '__name', '__alternate_url', '__city', '__description', '__site_url',
+                 '__vacancies_url', '__open_vacancies')
+
     employer_id: str
     name: str
     alternate_url: str
@@ -104,7 +108,7 @@ class Employer(BaseEmployer):
         employer_id = data.get("id", "")
         name = data.get("name", "")
         alternate_url = data.get("alternate_url", "")
-        city = data.get("area", {}).get("name", "")
+        city = (data.get("area") or {}).get("name", "")
         description = data.get("description", "")
         site_url = data.get("site_url", "")
         vacancies_url = data.get("vacancies_url", "")
@@ -0,0 +1,220 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+
+from config import (hh_api_backoff_base, hh_api_backoff_max, hh_api_burst, hh_api_max_retries, hh_api_max_rps,
+                    hh_api_retry_after_max, hh_api_timeout, max_workers_for_getting_vacancies)
+from src.metrics import metrics
+
+# ответы, после которых запрос повторяется; 429 и 503 дополнительно считаются признаком ограничения частоты
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """
+    Представляет ограничитель частоты запросов «корзина токенов» с адаптивной скоростью.
+
+    Скорость снижается мультипликативно при ограничении со стороны сервера и растет аддитивно
+    при успешных ответах (AIMD), поэтому частота держится чуть ниже лимита API.
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.5) -> None:
+        """
+        Args:
+            rate(float): максимальная скорость, запросов в секунду.
+            capacity(float): размер корзины (допустимый всплеск запросов).
+            min_rate(float): минимальная скорость при снижении.
+        """
+        self.__max_rate = rate
+        self.__min_rate = min(min_rate, rate)
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self.__rate
+
+    def acquire(self) -> None:
+        """
+        Забирает один токен, ожидая его появления при необходимости.
+        """
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+                self.__updated = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.__rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self.__lock:
+            self.__rate = min(self.__max_rate, self.__rate + self.__max_rate * 0.02)
+
+    def on_throttle(self) -> None:
+        with self.__lock:
+            self.__rate = max(self.__min_rate, self.__rate * 0.5)
+            # после ограничения не допускаем всплеска накопленных токенов
+            self.__tokens = min(self.__tokens, 1)
+
+
+class AdaptiveConcurrency:
+    """
+    Представляет ограничитель числа одновременных запросов с адаптивным пределом (AIMD).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1) -> None:
+        self.__max_limit = max_limit
+        self.__min_limit = min_limit
+        self.__limit = float(max_limit)
+        self.__in_flight = 0
+        self.__condition = threading.Condition()
+
+    @property
+    def limit(self):
+        return int(self.__limit)
+
+    def __enter__(self) -> 'AdaptiveConcurrency':
+        with self.__condition:
+            while self.__in_flight >= int(self.__limit):
+                self.__condition.wait()
+            self.__in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__condition.notify()
+        return False
+
+    def on_success(self) -> None:
+        with self.__condition:
+            if self.__limit < self.__max_limit:
+                self.__limit = min(self.__max_limit, self.__limit + 1 / self.__limit)
+                self.__condition.notify()
+
+    def on_throttle(self) -> None:
+        with self.__condition:
+            self.__limit = max(self.__min_limit, self.__limit / 2)
+
+
+class HttpClient:
+    """
+    Представляет HTTP-клиент API hh.ru с ограничением частоты и повтором запросов.
+
+    Перед каждым запросом берется токен из TokenBucket и место в AdaptiveConcurrency. Ответы 429/5xx
+    и сетевые ошибки повторяются с экспоненциальной задержкой со случайной составляющей (full jitter);
+    если сервер прислал Retry-After, ждем не меньше указанного (даже если это больше backoff_max), а если
+    указанное больше retry_after_max, запрос не повторяется и завершается ошибкой. Ответы 429/503 снижают частоту
+    и число одновременных запросов, успешные ответы постепенно их восстанавливают.
+    Каждый запрос ограничен тайм-аутом, поэтому зависшее соединение тоже повторяется, а не блокирует поток.
+    """
+
+    def __init__(self, session: requests.Session | None = None, max_rps: float = hh_api_max_rps,
+                 burst: float = hh_api_burst, max_concurrency: int = max_workers_for_getting_vacancies,
+                 max_retries: int = hh_api_max_retries, backoff_base: float = hh_api_backoff_base,
+                 backoff_max: float = hh_api_backoff_max,
+                 timeout: float | tuple[float, float] | None = hh_api_timeout,
+                 retry_after_max: float = hh_api_retry_after_max) -> None:
+        self.__session = session if session is not None else requests.Session()
+        self.__bucket = TokenBucket(max_rps, burst)
+        self.__concurrency = AdaptiveConcurrency(max_concurrency)
+        self.__max_retries = max_retries
+        self.__backoff_base = backoff_base
+        self.__backoff_max = backoff_max
+        self.__timeout = timeout
+        self.__retry_after_max = retry_after_max
+
+    @property
+    def session(self):
+        return self.__session
+
+    @property
+    def bucket(self):
+        return self.__bucket
+
+    @property
+    def concurrency(self):
+        return self.__concurrency
+
+    def get(self, url: str, params: dict[str, Any] | None = None,
+            headers: dict[str, str] | None = None) -> requests.Response:
+        """
+        Выполняет GET-запрос с повторами.
+
+        Returns:
+            requests.Response: последний полученный ответ (статус не проверяется).
+        Raises:
+            requests.RequestException: сетевая ошибка после исчерпания повторов.
+            requests.HTTPError: сервер просит повторить запрос позже, чем через retry_after_max секунд.
+        """
+        attempt = 0
+        while True:
+            self.__bucket.acquire()
+            try:
+                with self.__concurrency:
+                    response = self.__session.get(url, params=params, headers=headers,
+                                                 timeout=self.__timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.__max_retries:
+                    raise
+                self.__sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in RETRY_STATUSES:
+                self.__bucket.on_success()
+                self.__concurrency.on_success()
+                return response
+
+            if response.status_code in THROTTLE_STATUSES:
+                self.__bucket.on_throttle()
+                self.__concurrency.on_throttle()
+
+            if attempt >= self.__max_retries:
+                return response
+
+            retry_after = self.retry_after(response) or 0.0
+            if retry_after > self.__retry_after_max:
+                raise requests.HTTPError(f"{response.status_code}: повтор запроса разрешен через {retry_after:.0f} с, "
+                                         f"больше retry_after_max ({self.__retry_after_max} с)", response=response)
+            self.__sleep(max(self.backoff(attempt), retry_after))
+            attempt += 1
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Возвращает задержку перед повтором номер attempt (с нуля): случайную в [0, base * 2^attempt],
+        но не больше backoff_max.
+        """
+        return random.uniform(0, min(self.__backoff_max, self.__backoff_base * 2 ** attempt))
+
+    def retry_after(self, response: requests.Response) -> float | None:
+        """
+        Возвращает задержку из заголовка Retry-After (в секундах или в виде даты).
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return max(0.0, seconds)
+
+    @staticmethod
+    def __sleep(seconds: float) -> None:
+        with metrics.timer("http_backoff"):
+            time.sleep(seconds)
@@ -0,0 +1,244 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from config import json_decoder
+from src.employer import Employer
+from src.metrics import metrics
+from src.vacancy import Vacancy
+
+
+class VacanciesPage(NamedTuple):
+    """
+    Представляет страницу выдачи вакансий работодателя: вакансии и метаданные для подсчета страниц.
+    """
+    items: list[Vacancy]
+    found: int
+    pages: int | None
+    per_page: int | None
+
+
+class VacancyDetails(NamedTuple):
+    """
+    Представляет подробности вакансии из ответа /vacancies/{id}, которых нет в выдаче списка.
+    """
+    vacancy_id: str
+    description: str
+    key_skills: str
+    experience: str | None
+    schedule: str | None
+
+
+class JsonDecoder(ABC):
+    """
+    Представляет абстрактный разборщик ответов API hh.ru.
+
+    Разбор тела ответа замеряется как этап "json", создание объектов - как этап "parse".
+    """
+    name: str
+
+    @abstractmethod
+    def decode(self, content: bytes) -> Any:
+        """
+        Абстрактный метод для разбора тела ответа в стандартные типы Python (dict, list, ...).
+
+        Args:
+            content(bytes): тело ответа.
+        """
+        pass
+
+    @abstractmethod
+    def decode_employer(self, content: bytes) -> Employer:
+        """
+        Абстрактный метод для разбора ответа /employers/{id} в объект класса Работодатель.
+
+        Args:
+            content(bytes): тело ответа.
+        """
+        pass
+
+    @abstractmethod
+    def decode_vacancies_page(self, content: bytes, company_id: int) -> VacanciesPage:
+        """
+        Абстрактный метод для разбора страницы выдачи /vacancies в объекты класса Вакансия.
+
+        Args:
+            content(bytes): тело ответа.
+            company_id(int): id работодателя в БД.
+        """
+        pass
+
+    @abstractmethod
+    def decode_vacancy_details(self, content: bytes, vacancy_id: str) -> VacancyDetails:
+        """
+        Абстрактный метод для разбора ответа /vacancies/{id} в подробности вакансии.
+
+        Ключевые навыки объединяются в одну строку через ", ", для опыта и графика работы
+        берутся названия.
+
+        Args:
+            content(bytes): тело ответа.
+            vacancy_id(str): id запрошенной вакансии.
+        """
+        pass
+
+
+class StdlibJsonDecoder(JsonDecoder):
+    """
+    Представляет разборщик ответов на модуле json стандартной библиотеки:
+    ответ разбирается в словари, из которых затем создаются объекты.
+    """
+    name = "json"
+
+    def decode(self, content: bytes) -> Any:
+        with metrics.timer("json") as timer:
+            timer.bytes = len(content)
+            return json.loads(content)
+
+    def decode_employer(self, content: bytes) -> Employer:
+        data = self.decode(content)
+        with metrics.timer("parse"):
+            return Employer.new_employer(data)
+
+    def decode_vacancies_page(self, content: bytes, company_id: int) -> VacanciesPage:
+        data = self.decode(content)
+        with metrics.timer("parse"):
+            items = Vacancy.cast_to_object_list(data.get('items', []), company_id)
+        return VacanciesPage(items, data.get('found', 0), data.get('pages'), data.get('per_page'))
+
+    def decode_vacancy_details(self, content: bytes, vacancy_id: str) -> VacancyDetails:
+        data = self.decode(content)
+        with metrics.timer("parse"):
+            return VacancyDetails(vacancy_id, data.get("description") or "",
+                                  ", ".join(skill.get("name", "") for skill in data.get("key_skills") or []),
+                                  (data.get("experience") or {}).get("name"),
+                                  (data.get("schedule") or {}).get("name"))
+
+
+if msgspec is not None:
+    # Схемы ответов содержат только используемые поля: остальные поля (employer, address,
+    # snippet.responsibility и др.) пропускаются при разборе без создания объектов Python.
+
+    class _Salary(msgspec.Struct):
+        from_: int | None = msgspec.field(default=None, name="from")
+        to: int | None = None
+        currency: str | None = None
+        gross: bool | None = None
+
+    class _Snippet(msgspec.Struct):
+        requirement: str | None = None
+
+    class _VacancyItem(msgspec.Struct):
+        id: str | None = None
+        name: str | None = None
+        url: str | None = None
+        salary: _Salary | None = None
+        snippet: _Snippet | None = None
+
+    class _VacanciesPage(msgspec.Struct):
+        items: list[_VacancyItem] = []
+        found: int = 0
+        pages: int | None = None
+        per_page: int | None = None
+
+    class _Area(msgspec.Struct):
+        name: str | None = None
+
+    class _Employer(msgspec.Struct):
+        id: str | None = None
+        name: str | None = None
+        alternate_url: str | None = None
+        area: _Area | None = None
+        # описание работодателя хранится в таблице companies, поэтому поле разбирается
+        description: str | None = None
+        site_url: str | None = None
+        vacancies_url: str | None = None
+        open_vacancies: int | None = None
+
+    class _Named(msgspec.Struct):
+        name: str | None = None
+
+    class _VacancyDetails(msgspec.Struct):
+        description: str | None = None
+        key_skills: list[_Named] = []
+        experience: _Named | None = None
+        schedule: _Named | None = None
+
+
+class MsgspecJsonDecoder(JsonDecoder):
+    """
+    Представляет разборщик ответов на библиотеке msgspec: ответ разбирается сразу в типизированные
+    структуры без промежуточных словарей, неиспользуемые поля пропускаются.
+    """
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("Для разбора ответов через msgspec установите пакет msgspec.")
+
+        self.__decoder = msgspec.json.Decoder()
+        self.__employer_decoder = msgspec.json.Decoder(_Employer)
+        self.__page_decoder = msgspec.json.Decoder(_VacanciesPage)
+        self.__details_decoder = msgspec.json.Decoder(_VacancyDetails)
+
+    def decode(self, content: bytes) -> Any:
+        with metrics.timer("json") as timer:
+            timer.bytes = len(content)
+            return self.__decoder.decode(content)
+
+    def decode_employer(self, content: bytes) -> Employer:
+        with metrics.timer("json") as timer:
+            timer.bytes = len(content)
+            data = self.__employer_decoder.decode(content)
+        with metrics.timer("parse"):
+            return Employer(data.id, data.name, data.alternate_url, data.area.name if data.area else "",
+                            data.description, data.site_url, data.vacancies_url, data.open_vacancies)
+
+    def decode_vacancies_page(self, content: bytes, company_id: int) -> VacanciesPage:
+        with metrics.timer("json") as timer:
+            timer.bytes = len(content)
+            page = self.__page_decoder.decode(content)
+        with metrics.timer("parse"):
+            from_salary_range = Vacancy.from_salary_range
+            items = [from_salary_range(item.id, item.name, item.url,
+                                       item.salary.from_ if item.salary else None,
+                                       item.salary.to if item.salary else None,
+                                       item.snippet.requirement if item.snippet else None,
+                                       company_id,
+                                       item.salary.currency if item.salary else None,
+                                       item.salary.gross if item.salary else None)
+                     for item in page.items]
+        return VacanciesPage(items, page.found, page.pages, page.per_page)
+
+    def decode_vacancy_details(self, content: bytes, vacancy_id: str) -> VacancyDetails:
+        with metrics.timer("json") as timer:
+            timer.bytes = len(content)
+            data = self.__details_decoder.decode(content)
+        with metrics.timer("parse"):
+            return VacancyDetails(vacancy_id, data.description or "",
+                                  ", ".join(skill.name or "" for skill in data.key_skills),
+                                  data.experience.name if data.experience else None,
+                                  data.schedule.name if data.schedule else None)
+
+
+def make_decoder(name: str = json_decoder) -> JsonDecoder:
+    """
+    Создает разборщик ответов API по имени.
+
+    Args:
+        name(str): "msgspec", "json" или "auto" (msgspec, если он установлен).
+    Returns:
+        JsonDecoder: разборщик ответов.
+    """
+    if name == "auto":
+        name = "msgspec" if msgspec is not None else "json"
+    if name == "msgspec":
+        return MsgspecJsonDecoder()
+    if name == "json":
+        return StdlibJsonDecoder()
+    raise ValueError(f"Неизвестный разборщик ответов API: {name}")
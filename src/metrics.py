@@ -0,0 +1,143 @@
+import json
+import threading
+from time import perf_counter
+from typing import Any
+
+from config import metrics_enabled
+
+
+class _Timer:
+    """
+    Замеряет один вызов этапа; в атрибут bytes можно записать объем переданных данных.
+    """
+    __slots__ = ("_metrics", "_stage", "_start", "bytes")
+
+    def __init__(self, metrics: 'Metrics', stage: str) -> None:
+        self._metrics = metrics
+        self._stage = stage
+        self.bytes = 0
+
+    def __enter__(self) -> '_Timer':
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._metrics.record(self._stage, perf_counter() - self._start, self.bytes, exc_type is not None)
+        return False
+
+
+class _NullTimer:
+    """
+    Пустой замер для выключенных метрик: один общий объект без вычислений.
+    """
+    __slots__ = ("bytes",)
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Представляет реестр метрик горячих участков: HTTP-запросов, разбора JSON, создания объектов и SQL.
+
+    По каждому этапу накапливаются число вызовов, ошибки, суммарное и максимальное время и объем данных.
+    При выключенных метриках timer() возвращает общий пустой объект, и замер почти ничего не стоит.
+    """
+
+    def __init__(self, enabled: bool = False, namespace: str = "cw5") -> None:
+        self.enabled = enabled
+        self.__namespace = namespace
+        self.__lock = threading.Lock()
+        self.__stages: dict[str, dict[str, float]] = {}
+
+    def timer(self, stage: str) -> _Timer | _NullTimer:
+        """
+        Возвращает контекстный менеджер для замера одного вызова этапа stage.
+        Исключение внутри блока засчитывается как ошибка этапа.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def record(self, stage: str, seconds: float, nbytes: int = 0, error: bool = False) -> None:
+        """
+        Добавляет результат одного вызова этапа stage.
+        """
+        with self.__lock:
+            data = self.__stages.get(stage)
+            if data is None:
+                data = self.__stages[stage] = {"count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                               "bytes": 0}
+            data["count"] += 1
+            data["errors"] += error
+            data["seconds"] += seconds
+            data["bytes"] += nbytes
+            if seconds > data["max_seconds"]:
+                data["max_seconds"] = seconds
+
+    def reset(self) -> None:
+        """
+        Обнуляет накопленные метрики.
+        """
+        with self.__lock:
+            self.__stages.clear()
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Возвращает копию накопленных метрик по этапам.
+        """
+        with self.__lock:
+            return {stage: dict(data) for stage, data in sorted(self.__stages.items())}
+
+    def summary(self) -> str:
+        """
+        Возвращает сводку по этапам в виде текстовой таблицы.
+        """
+        lines = [f"{'этап':<16}{'вызовов':>10}{'ошибок':>8}{'всего, с':>11}{'среднее, мс':>13}"
+                 f"{'макс, мс':>10}{'КиБ':>11}"]
+        for stage, data in self.snapshot().items():
+            average_ms = data["seconds"] / data["count"] * 1000 if data["count"] else 0.0
+            lines.append(f"{stage:<16}{data['count']:>10}{data['errors']:>8}{data['seconds']:>11.3f}"
+                         f"{average_ms:>13.2f}{data['max_seconds'] * 1000:>10.2f}{data['bytes'] / 1024:>11.1f}")
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        """
+        Возвращает метрики в формате JSON.
+        """
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Возвращает метрики в текстовом формате Prometheus.
+        """
+        families: tuple[tuple[str, str, str, str], ...] = (
+            ("calls_total", "counter", "count", "Число вызовов этапа."),
+            ("errors_total", "counter", "errors", "Число вызовов этапа, завершившихся ошибкой."),
+            ("seconds_total", "counter", "seconds", "Суммарное время этапа в секундах."),
+            ("seconds_max", "gauge", "max_seconds", "Максимальное время одного вызова этапа в секундах."),
+            ("bytes_total", "counter", "bytes", "Объем данных этапа в байтах."),
+        )
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for suffix, metric_type, key, help_text in families:
+            name = f"{self.__namespace}_stage_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for stage, data in snapshot.items():
+                lines.append(f'{name}{{stage="{stage}"}} {self._format_value(data[key])}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# общий реестр метрик приложения
+metrics = Metrics(enabled=metrics_enabled)
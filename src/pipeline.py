@@ -0,0 +1,135 @@
+import queue
+import threading
+import time
+from itertools import islice
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from config import db_batch_size, ingest_queue_size
+from src.metrics import metrics
+
+T = TypeVar("T")
+
+# признак конца потока в очереди
+_DONE = object()
+
+
+class _Failure:
+    """
+    Исключение производителя, передаваемое через очередь потребителю.
+    """
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class IngestPipeline(Generic[T]):
+    """
+    Представляет конвейер загрузки: производитель в отдельном потоке читает источник (например,
+    Parser.iter_vacancies) и кладет пакеты объектов в ограниченную очередь, потребитель (запись в БД)
+    забирает их, итерируясь по конвейеру.
+
+    Пока потребитель пишет пакет в БД, производитель получает следующие страницы, поэтому время
+    загрузки стремится к max(получение, запись), а не к их сумме. Очередь ограничена: если запись
+    отстает, производитель ждет (backpressure), и в памяти не больше queue_size пакетов.
+    Исключение производителя передается потребителю и поднимается из итерации; если потребитель
+    прекращает итерацию (ошибка записи, break) или вызывает close, производитель останавливается
+    и закрывает источник. Конвейер можно использовать как контекстный менеджер.
+
+    Время ожидания потребителем пакетов и производителем места в очереди записывается в метрики
+    (этапы "pipeline_wait_fetch" и "pipeline_wait_write").
+    """
+
+    def __init__(self, source: Iterable[T], batch_size: int = db_batch_size,
+                 queue_size: int = ingest_queue_size) -> None:
+        """
+        Конструктор экземпляра класса IngestPipeline. Производитель запускается сразу.
+
+        Args:
+            source(Iterable[T]): источник объектов; читается только в потоке производителя.
+            batch_size(int): число объектов в пакете очереди.
+            queue_size(int): максимальное число пакетов в очереди.
+        """
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("Размер пакета и длина очереди должны быть положительными.")
+
+        self.__source = source
+        self.__batch_size = batch_size
+        self.__queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.__stop = threading.Event()
+        self.__produced = 0
+        self.__thread = threading.Thread(target=self._produce, name="ingest-producer", daemon=True)
+        self.__thread.start()
+
+    @property
+    def produced(self):
+        return self.__produced
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            while True:
+                started = time.perf_counter()
+                item = self.__queue.get()
+                if metrics.enabled:
+                    metrics.record("pipeline_wait_fetch", time.perf_counter() - started)
+
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield from item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает производителя и ждет завершения его потока.
+        """
+        self.__stop.set()
+        # освобождаем место в очереди, если производитель ждет его
+        while self.__thread.is_alive():
+            try:
+                self.__queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.__thread.join(timeout=0.05)
+
+    def __enter__(self) -> 'IngestPipeline[T]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _produce(self) -> None:
+        """
+        Читает источник пакетами и кладет их в очередь до конца источника, ошибки или остановки.
+        """
+        iterator = iter(self.__source)
+        try:
+            while not self.__stop.is_set():
+                batch = list(islice(iterator, self.__batch_size))
+                if not batch:
+                    self._put(_DONE)
+                    return
+                self.__produced += len(batch)
+                self._put(batch)
+        except BaseException as error:
+            self._put(_Failure(error))
+        finally:
+            # генератор источника закрывается в том же потоке, где он выполнялся
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def _put(self, item: object) -> None:
+        """
+        Кладет элемент в очередь, ожидая свободного места, пока конвейер не остановлен.
+        """
+        started = time.perf_counter()
+        while not self.__stop.is_set():
+            try:
+                self.__queue.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if metrics.enabled:
+            metrics.record("pipeline_wait_write", time.perf_counter() - started)
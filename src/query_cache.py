@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class QueryCache:
+    """
+    Представляет LRU-кэш результатов запросов к БД.
+
+    Каждая очистка увеличивает номер поколения. Результат, вычисленный до очистки, в кэш не
+    попадает, поэтому запрос, выполнявшийся одновременно с записью, не закэширует устаревшие данные.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Конструктор экземпляра класса QueryCache.
+
+        Args:
+            max_size(int): максимальное число хранимых результатов; 0 отключает кэш.
+        """
+        self.__max_size = max_size
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__generation = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+    @property
+    def generation(self):
+        return self.__generation
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.__hits, "misses": self.__misses, "size": len(self.__entries)}
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Возвращает результат по ключу или _MISSING, если его нет в кэше.
+        """
+        with self.__lock:
+            value = self.__entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Сохраняет результат, если с момента начала запроса (generation) кэш не очищался.
+        """
+        with self.__lock:
+            if generation != self.__generation or self.__max_size <= 0:
+                return
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и начинает новое поколение.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__generation += 1
+
+
+def cached_query(method: Callable) -> Callable:
+    """
+    Декоратор читающего метода менеджера БД: результат кэшируется в self.query_cache
+    по имени метода и аргументам. Именованный аргумент use_cache=False выполняет запрос
+    в обход кэша (и не сохраняет результат).
+
+    Результат из кэша - тот же объект, что вернул первый вызов, изменять его нельзя.
+    """
+    @wraps(method)
+    def wrapper(self, *args, use_cache: bool = True, **kwargs):
+        if not use_cache:
+            return method(self, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        cache: QueryCache = self.query_cache
+        value = cache.get(key)
+        if value is _MISSING:
+            generation = cache.generation
+            value = method(self, *args, **kwargs)
+            cache.set(key, value, generation)
+        return value
+
+    return wrapper
+
+
+def invalidates_cache(method: Callable) -> Callable:
+    """
+    Декоратор изменяющего метода менеджера БД: после выполнения (в том числе с ошибкой)
+    кэш результатов запросов очищается.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.query_cache.clear()
+
+    return wrapper
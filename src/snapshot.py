@@ -0,0 +1,376 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from src.vacancy import normalize_salary
+
+# Формат файла снимка (все числа - little-endian):
+#   блоки столбцов, каждый с границы 8 байт;
+#   оглавление в JSON: число строк таблиц, тип, смещение, длина и сжатие блоков каждого столбца;
+#   8 байт - длина оглавления, 8 байт - MAGIC.
+# Столбец int64 - один блок из 8-байтных чисел. Столбец str - блок смещений (int64, строк + 1)
+# и блок строк в UTF-8 подряд. Несжатые блоки читаются через mmap без копирования.
+MAGIC = b"CW5SNAP1"
+# версия 2 добавила подробности вакансий (description ... enriched_at); снимки версии 1 читаются,
+# недостающие столбцы заполняются в vacancy_rows
+FORMAT_VERSION = 2
+SUPPORTED_VERSIONS = frozenset({1, FORMAT_VERSION})
+_FOOTER = struct.Struct("<Q8s")
+_ALIGNMENT = 8
+
+# Столбцы снимка в порядке столбцов таблиц БД; id работодателя в vacancies.company_id -
+# значение companies.id из того же снимка, salary_norm = 0 - зарплата не определена,
+# enriched_at - время получения подробностей вакансии в UTC (ISO 8601), пустая строка - не получены
+COMPANY_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "int64"), ("employer_id", "str"), ("name", "str"), ("alternate_url", "str"), ("city", "str"),
+    ("description", "str"), ("site_url", "str"), ("vacancies_url", "str"), ("open_vacancies", "int64"),
+)
+VACANCY_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("vacancy_id", "str"), ("name", "str"), ("company_id", "int64"), ("url", "str"),
+    ("salary_min", "int64"), ("salary_max", "int64"), ("requirement", "str"), ("salary_norm", "int64"),
+    ("description", "str"), ("key_skills", "str"), ("experience", "str"), ("schedule", "str"),
+    ("enriched_at", "str"),
+)
+SNAPSHOT_TABLES: dict[str, tuple[tuple[str, str], ...]] = {"companies": COMPANY_COLUMNS,
+                                                           "vacancies": VACANCY_COLUMNS}
+COMPRESSIONS = (None, "zlib")
+
+
+class StringColumn(Sequence[str]):
+    """
+    Представляет строковый столбец снимка: строки декодируются из буфера при обращении.
+    """
+
+    def __init__(self, offsets: Sequence[int], data: memoryview | bytes) -> None:
+        """
+        Конструктор экземпляра класса StringColumn.
+
+        Args:
+            offsets(Sequence[int]): смещения начала строк в data и смещение конца последней строки.
+            data(memoryview | bytes): строки в UTF-8 подряд.
+        """
+        self.__offsets = offsets
+        self.__data = data
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс строки вне столбца.")
+        return str(self.__data[self.__offsets[index]:self.__offsets[index + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        data, offsets = self.__data, self.__offsets
+        start = offsets[0] if len(offsets) else 0
+        for end in offsets[1:]:
+            yield str(data[start:end], "utf-8")
+            start = end
+
+
+class SnapshotTable:
+    """
+    Представляет таблицу снимка: столбцы доступны по имени, строки - потоком кортежей.
+    """
+
+    def __init__(self, name: str, rows: int, columns: dict[str, Sequence[Any]]) -> None:
+        self.__name = name
+        self.__rows = rows
+        self.__columns = columns
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def columns(self):
+        return tuple(self.__columns)
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Возвращает столбец по имени: memoryview с форматом "q" для int64 (без копирования, если блок
+        не сжат) или StringColumn для строк.
+
+        Args:
+            name(str): имя столбца.
+        """
+        if name not in self.__columns:
+            raise KeyError(f"Столбец '{name}' не найден в таблице '{self.__name}' снимка.")
+        return self.__columns[name]
+
+    def rows(self, columns: Iterable[str] | None = None) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по строкам таблицы.
+
+        Args:
+            columns(Iterable[str] | None): имена столбцов в нужном порядке, по умолчанию - все.
+        """
+        names = list(columns) if columns is not None else list(self.__columns)
+        return zip(*(self.column(name) for name in names))
+
+
+class Snapshot:
+    """
+    Представляет открытый файл снимка данных.
+
+    Файл отображается в память (mmap), столбцы ссылаются на отображение без копирования,
+    поэтому открытие снимка не зависит от его размера. Снимок можно использовать как контекстный
+    менеджер; если после закрытия остались ссылки на столбцы (например, массивы VacancyTable),
+    отображение освобождается вместе с последним из них.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Открывает файл снимка.
+
+        Args:
+            path(Path | str): путь к файлу снимка.
+        """
+        self.__path = Path(path)
+        with open(self.__path, "rb") as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__buffer = memoryview(self.__mmap)
+        try:
+            self.__manifest = self._read_manifest()
+            self.__tables = {name: self._load_table(name, info) for name, info in self.__manifest["tables"].items()}
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def created_at(self):
+        return self.__manifest.get("created_at")
+
+    @property
+    def tables(self):
+        return tuple(self.__tables)
+
+    def table(self, name: str) -> SnapshotTable:
+        """
+        Возвращает таблицу снимка по имени ("companies" или "vacancies").
+        """
+        if name not in self.__tables:
+            raise KeyError(f"Таблица '{name}' не найдена в снимке {self.__path}.")
+        return self.__tables[name]
+
+    def close(self) -> None:
+        """
+        Освобождает отображение файла в память.
+        """
+        self.__tables = {}
+        self.__buffer.release()
+        try:
+            self.__mmap.close()
+        except BufferError:
+            # на отображение ссылаются столбцы, оставшиеся у вызывающего кода
+            pass
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_manifest(self) -> dict[str, Any]:
+        """
+        Читает оглавление снимка из конца файла.
+        """
+        size = len(self.__buffer)
+        if size < _FOOTER.size:
+            raise ValueError(f"Файл {self.__path} не является снимком данных.")
+
+        manifest_size, magic = _FOOTER.unpack_from(self.__buffer, size - _FOOTER.size)
+        if magic != MAGIC or manifest_size > size - _FOOTER.size:
+            raise ValueError(f"Файл {self.__path} не является снимком данных.")
+
+        start = size - _FOOTER.size - manifest_size
+        manifest = json.loads(bytes(self.__buffer[start:start + manifest_size]))
+        if manifest.get("version") not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Неподдерживаемая версия снимка: {manifest.get('version')}.")
+        return manifest
+
+    def _load_table(self, name: str, info: dict[str, Any]) -> SnapshotTable:
+        """
+        Создает столбцы таблицы поверх отображения файла.
+        """
+        columns: dict[str, Sequence[Any]] = {}
+        for column, spec in info["columns"].items():
+            if spec["type"] == "int64":
+                columns[column] = self._int64_block(spec["values"])
+            else:
+                columns[column] = StringColumn(self._int64_block(spec["offsets"]), self._block(spec["data"]))
+        return SnapshotTable(name, info["rows"], columns)
+
+    def _block(self, spec: dict[str, Any]) -> memoryview | bytes:
+        """
+        Возвращает содержимое блока: срез отображения или, для сжатого блока, распакованные байты.
+        """
+        data = self.__buffer[spec["offset"]:spec["offset"] + spec["length"]]
+        if spec["compression"] == "zlib":
+            return zlib.decompress(data)
+        return data
+
+    def _int64_block(self, spec: dict[str, Any]) -> Sequence[int]:
+        """
+        Возвращает блок 8-байтных чисел.
+        """
+        data = self._block(spec)
+        if sys.byteorder == "little":
+            return memoryview(data).cast("q")
+
+        values = array("q", bytes(data))
+        values.byteswap()
+        return values
+
+
+def vacancy_rows(table: SnapshotTable) -> Iterator[tuple[Any, ...]]:
+    """
+    Возвращает итератор по строкам таблицы vacancies снимка в порядке столбцов VACANCY_COLUMNS.
+
+    В снимках, записанных до появления столбца salary_norm, он вычисляется из границ вилки;
+    валюта в таких снимках не сохранена и считается базовой. Подробностей вакансий в снимках
+    версии 1 нет: их столбцы - пустые строки, и подробности будут получены заново.
+
+    Args:
+        table(SnapshotTable): таблица vacancies снимка.
+    """
+    columns = [column for column, _ in VACANCY_COLUMNS]
+    present = [column for column in columns if column in table.columns]
+    if len(present) == len(columns):
+        return table.rows(columns)
+    return (_complete_vacancy_row(dict(zip(present, row))) for row in table.rows(present))
+
+
+def _complete_vacancy_row(values: dict[str, Any]) -> tuple[Any, ...]:
+    """
+    Дополняет строку вакансии из снимка прежней версии недостающими столбцами VACANCY_COLUMNS.
+    """
+    if "salary_norm" not in values:
+        values["salary_norm"] = normalize_salary(values["salary_min"], values["salary_max"], None) or 0
+    return tuple(values.get(column, 0 if kind == "int64" else "") for column, kind in VACANCY_COLUMNS)
+
+
+def write_snapshot(path: Path | str, tables: dict[str, Iterable[tuple[Any, ...]]],
+                   compression: str | None = None) -> dict[str, int]:
+    """
+    Записывает таблицы в файл снимка.
+
+    Строки раскладываются по столбцам в компактные буферы (array и bytearray), затем столбцы
+    записываются блоками. Файл пишется во временный и атомарно заменяет существующий.
+    Пустые значения записываются как 0 для чисел и пустая строка для строк.
+
+    Args:
+        path(Path | str): путь к файлу снимка.
+        tables(dict[str, Iterable[tuple[Any, ...]]]): строки таблиц "companies" и "vacancies"
+        в порядке столбцов COMPANY_COLUMNS и VACANCY_COLUMNS.
+        compression(str | None): None - без сжатия (чтение без копирования) или "zlib".
+    Returns:
+        dict[str, int]: число записанных строк каждой таблицы.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Неизвестный метод сжатия: {compression}")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    manifest: dict[str, Any] = {"version": FORMAT_VERSION, "created_at": datetime.now(timezone.utc).isoformat(),
+                                "tables": {}}
+    counts: dict[str, int] = {}
+
+    with open(tmp_path, "wb") as file:
+        for name, rows in tables.items():
+            if name not in SNAPSHOT_TABLES:
+                raise ValueError(f"Таблица '{name}' не поддерживается снимком.")
+
+            schema = SNAPSHOT_TABLES[name]
+            buffers, count = _columnize(rows, schema)
+            columns: dict[str, Any] = {}
+            for (column, kind), buffer in zip(schema, buffers):
+                if kind == "int64":
+                    columns[column] = {"type": kind, "values": _write_block(file, buffer, compression)}
+                else:
+                    offsets, data = buffer
+                    columns[column] = {"type": kind, "offsets": _write_block(file, offsets, compression),
+                                       "data": _write_block(file, data, compression)}
+            manifest["tables"][name] = {"rows": count, "columns": columns}
+            counts[name] = count
+
+        manifest_bytes = json.dumps(manifest).encode("utf-8")
+        file.write(manifest_bytes)
+        file.write(_FOOTER.pack(len(manifest_bytes), MAGIC))
+
+    os.replace(tmp_path, path)
+    return counts
+
+
+def _columnize(rows: Iterable[tuple[Any, ...]], schema: tuple[tuple[str, str], ...]) -> tuple[list[Any], int]:
+    """
+    Раскладывает строки по буферам столбцов: array("q") для int64, (смещения, bytearray) для строк.
+    """
+    buffers: list[Any] = [array("q") if kind == "int64" else (array("q", [0]), bytearray()) for _, kind in schema]
+    count = 0
+    for row in rows:
+        if len(row) != len(schema):
+            raise ValueError(f"Строка из {len(row)} значений не соответствует {len(schema)} столбцам снимка.")
+        for value, buffer in zip(row, buffers):
+            if isinstance(buffer, array):
+                buffer.append(value or 0)
+            else:
+                offsets, data = buffer
+                if value:
+                    data += value.encode("utf-8")
+                offsets.append(len(data))
+        count += 1
+    return buffers, count
+
+
+def _write_block(file, buffer: array | bytearray, compression: str | None) -> dict[str, Any]:
+    """
+    Записывает блок с границы 8 байт и возвращает его описание для оглавления.
+    """
+    if isinstance(buffer, array) and sys.byteorder != "little":
+        buffer = array("q", buffer)
+        buffer.byteswap()
+
+    data = buffer.tobytes() if isinstance(buffer, array) else bytes(buffer)
+    if compression == "zlib":
+        data = zlib.compress(data)
+
+    file.write(b"\0" * (-file.tell() % _ALIGNMENT))
+    offset = file.tell()
+    file.write(data)
+    return {"offset": offset, "length": len(data), "compression": compression}
+
+
+def export_snapshot(db, path: Path | str, compression: str | None = None) -> dict[str, int]:
+    """
+    Выгружает таблицы companies и vacancies из БД в файл снимка; строки читаются потоково.
+
+    Args:
+        db(DBManager): менеджер БД.
+        path(Path | str): путь к файлу снимка.
+        compression(str | None): None или "zlib".
+    Returns:
+        dict[str, int]: число выгруженных строк каждой таблицы.
+    """
+    return write_snapshot(path, {"companies": db.iter_company_rows(), "vacancies": db.iter_vacancy_rows()},
+                          compression)
@@ -0,0 +1,1012 @@
+import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from config import db_batch_size, db_page_size, db_query_cache_size, db_stream_itersize
+from src.dbmanager import AbstractDBManager, InstrumentedCursor, Page
+from src.employer import Employer
+from src.json_decoder import VacancyDetails
+from src.metrics import metrics
+from src.query_cache import QueryCache, cached_query, invalidates_cache
+from src.snapshot import COMPANY_COLUMNS, Snapshot, vacancy_rows
+from src.vacancy import Vacancy
+
+
+class InstrumentedSQLiteCursor(sqlite3.Cursor):
+    """
+    Курсор SQLite, замеряющий каждый SQL-запрос (этапы "sql_<команда>" в метриках, как InstrumentedCursor).
+    """
+
+    def execute(self, sql, parameters=()):
+        if not metrics.enabled:
+            return super().execute(sql, parameters)
+
+        with metrics.timer(InstrumentedCursor._stage(sql)):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not metrics.enabled:
+            return super().executemany(sql, seq_of_parameters)
+
+        with metrics.timer(InstrumentedCursor._stage(sql)):
+            return super().executemany(sql, seq_of_parameters)
+
+
+class _InstrumentedConnection(sqlite3.Connection):
+    """
+    Соединение SQLite, по умолчанию создающее InstrumentedSQLiteCursor.
+    """
+
+    def cursor(self, factory=InstrumentedSQLiteCursor):
+        return super().cursor(factory)
+
+
+class SQLiteDBManager(AbstractDBManager):
+    """
+    Представляет менеджер встроенной БД SQLite с тем же интерфейсом, что и DBManager.
+
+    Запросы выполняются в процессе, без сервера и обращений по сети. БД работает в режиме WAL
+    (чтение не блокируется записью), массовая вставка выполняется одной транзакцией.
+    Зарплата в базовой валюте salary_norm хранится и индексируется, статистика по зарплатам salary_stats -
+    таблица, пересчитываемая при изменении вакансий (аналог материализованного представления).
+    Поиск по ключевым словам - полнотекстовый индекс FTS5 по названию и требованиям: слова запроса
+    ищутся как начала слов без учета регистра; морфология и поиск с опечатками, как в PostgreSQL,
+    не поддерживаются.
+
+    Результаты читающих методов get_* и search_vacancies кэшируются до ближайшего изменения данных
+    через этот менеджер; передайте use_cache=False, чтобы выполнить запрос в обход кэша.
+    """
+    _PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        # в режиме WAL при NORMAL данные не теряются при сбое приложения, fsync - только на контрольных точках
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA temp_store = MEMORY",
+        # кэш страниц 64 МиБ и чтение файла БД через mmap до 256 МиБ
+        "PRAGMA cache_size = -65536",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA busy_timeout = 5000",
+    )
+
+    _HIGHER_SALARY_SQL = """
+        WITH stats AS (
+            SELECT avg_salary FROM salary_stats WHERE is_total
+        )
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.salary_norm > (SELECT avg_salary FROM stats)
+        ORDER BY v.salary_norm DESC, v.id DESC;
+    """
+
+    _SALARY_RANGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.salary_norm BETWEEN :salary_from AND :salary_to
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT :limit;
+    """
+
+    # найденные вакансии с оценкой релевантности score (bm25: меньше - релевантнее);
+    # совпадения в названии весят больше, чем в требованиях (веса столбцов bm25)
+    _KEYWORD_MATCH_SQL = """
+        SELECT c.name AS company, v.name, v.salary_min, v.salary_max, v.url, v.id,
+               bm25(vacancies_fts, 10.0, 1.0) AS score
+        FROM vacancies_fts AS f
+        JOIN vacancies AS v ON v.id = f.rowid
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE vacancies_fts MATCH :query
+    """
+
+    _KEYWORD_SEARCH_SQL = f"""
+        SELECT company, name, salary_min, salary_max, url
+        FROM ({_KEYWORD_MATCH_SQL}) AS found
+        ORDER BY score, id
+        LIMIT :limit;
+    """
+
+    # постраничные запросы (keyset), см. DBManager._VACANCIES_BY_ID_PAGE_SQL
+    _VACANCIES_BY_ID_PAGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE v.id > :id
+        ORDER BY v.id
+        LIMIT :limit;
+    """
+
+    _VACANCIES_BY_SALARY_PAGE_SQL = """
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE (v.salary_norm, v.id) < (:salary, :id)
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT :limit;
+    """
+
+    _HIGHER_SALARY_PAGE_SQL = """
+        WITH stats AS (
+            SELECT avg_salary FROM salary_stats WHERE is_total
+        )
+        SELECT c.name, v.name, v.salary_min, v.salary_max, v.url, v.salary_norm, v.id
+        FROM vacancies AS v
+        JOIN companies AS c ON v.company_id = c.id
+        WHERE (v.salary_norm, v.id) < (:salary, :id)
+          AND v.salary_norm > (SELECT avg_salary FROM stats)
+        ORDER BY v.salary_norm DESC, v.id DESC
+        LIMIT :limit;
+    """
+
+    _KEYWORD_PAGE_SQL = f"""
+        SELECT company, name, salary_min, salary_max, url, score, id
+        FROM ({_KEYWORD_MATCH_SQL}) AS found
+        WHERE (score, id) > (:score, :id)
+        ORDER BY score, id
+        LIMIT :limit;
+    """
+
+    # ключ первой страницы при порядке по убыванию: больше любых id и salary_norm
+    _MAX_KEY = 2 ** 63 - 1
+
+    # столбцы подробностей вакансии; enriched_at - время получения в UTC (ISO 8601)
+    _DETAIL_COLUMNS = (("description", "TEXT"), ("key_skills", "TEXT"), ("experience", "TEXT"),
+                       ("schedule", "TEXT"), ("enriched_at", "TEXT"))
+
+    def __init__(self, path: str, query_cache_size: int = db_query_cache_size) -> None:
+        """
+        Конструктор экземпляра класса SQLiteDBManager.
+
+        Args:
+            path(str): путь к файлу БД (создается при отсутствии) или ":memory:".
+            query_cache_size(int): максимальное число результатов читающих запросов в кэше.
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._path = path
+        self.conn = self._connect()
+        # соединение одно, поэтому обращения из разных потоков выполняются по очереди
+        self._lock = threading.RLock()
+        # результаты читающих запросов; сбрасываются любым изменяющим методом
+        self.query_cache = QueryCache(query_cache_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Открывает соединение с файлом БД и применяет _PRAGMAS.
+        """
+        # транзакциями управляет _connection, поэтому модуль sqlite3 не начинает их сам
+        conn = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False,
+                               factory=_InstrumentedConnection)
+        for pragma in self._PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Выдает соединение на время одной транзакции.
+
+        При успешном выходе из блока транзакция фиксируется, при исключении - откатывается.
+        Вложенный вызов выполняется в уже открытой транзакции.
+        """
+        with self._lock:
+            if self.conn.in_transaction:
+                yield self.conn
+                return
+
+            self.conn.execute("BEGIN")
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с БД.
+        """
+        self.conn.close()
+
+    @invalidates_cache
+    def create_table(self) -> None:
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS companies(
+                id INTEGER PRIMARY KEY,
+                employer_id TEXT UNIQUE,
+                name TEXT NOT NULL,
+                alternate_url TEXT,
+                city TEXT NOT NULL,
+                description TEXT,
+                site_url TEXT,
+                vacancies_url TEXT,
+                open_vacancies INTEGER
+            );
+            """)
+
+            # зарплата в базовой валюте вычисляется при загрузке, хранится и индексируется, как в PostgreSQL
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS vacancies(
+                id INTEGER PRIMARY KEY,
+                vacancy_id TEXT UNIQUE,
+                name TEXT NOT NULL,
+                company_id INTEGER REFERENCES companies(id),
+                url TEXT NOT NULL,
+                salary_min INTEGER,
+                salary_max INTEGER,
+                requirement TEXT NOT NULL,
+                salary_norm INTEGER
+            );
+            """)
+            # подробности вакансии из /vacancies/{id} и salary_norm; в SQLite нет ADD COLUMN IF NOT EXISTS,
+            # поэтому недостающие столбцы таблиц, созданных ранее, добавляются по списку столбцов
+            # (salary_norm таких вакансий заполнится при ближайшей синхронизации)
+            cur.execute("SELECT name FROM pragma_table_info('vacancies');")
+            existing = {row[0] for row in cur.fetchall()}
+            for column, column_type in self._DETAIL_COLUMNS + (("salary_norm", "INTEGER"),):
+                if column not in existing:
+                    cur.execute(f"ALTER TABLE vacancies ADD COLUMN {column} {column_type};")
+            cur.execute("CREATE INDEX IF NOT EXISTS vacancies_company_id_idx ON vacancies (company_id);")
+            cur.execute("CREATE INDEX IF NOT EXISTS vacancies_salary_norm_id_idx ON vacancies (salary_norm, id);")
+            cur.execute("""
+            CREATE INDEX IF NOT EXISTS vacancies_not_enriched_idx ON vacancies (id) WHERE enriched_at IS NULL;
+            """)
+
+            # полнотекстовый индекс по названию и требованиям, синхронизируется триггерами
+            cur.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+                name, requirement, content='vacancies', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            );
+            """)
+            cur.execute("""
+            CREATE TRIGGER IF NOT EXISTS vacancies_fts_insert AFTER INSERT ON vacancies BEGIN
+                INSERT INTO vacancies_fts (rowid, name, requirement) VALUES (new.id, new.name, new.requirement);
+            END;
+            """)
+            cur.execute("""
+            CREATE TRIGGER IF NOT EXISTS vacancies_fts_delete AFTER DELETE ON vacancies BEGIN
+                INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirement)
+                VALUES ('delete', old.id, old.name, old.requirement);
+            END;
+            """)
+            cur.execute("""
+            CREATE TRIGGER IF NOT EXISTS vacancies_fts_update AFTER UPDATE OF name, requirement ON vacancies BEGIN
+                INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirement)
+                VALUES ('delete', old.id, old.name, old.requirement);
+                INSERT INTO vacancies_fts (rowid, name, requirement) VALUES (new.id, new.name, new.requirement);
+            END;
+            """)
+
+            cur.execute("""
+            CREATE TABLE IF NOT EXISTS salary_stats(
+                company_id INTEGER,
+                is_total INTEGER NOT NULL,
+                vacancies_count INTEGER NOT NULL,
+                avg_salary REAL,
+                median_salary REAL,
+                min_salary REAL,
+                max_salary REAL
+            );
+            """)
+            self._refresh_salary_stats(cur)
+
+    @invalidates_cache
+    def insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url(self,
+                                                                             data: Iterable[Vacancy | Employer],
+                                                                             table: str,
+                                                                             batch_size: int | None = None
+                                                                             ) -> dict[int, str]:
+        """
+        Заполняет таблицу данными и возвращает словарь с данными, где ключом является id работодателя,
+        а значением - api - ссылка на вакансии работодателя.
+
+        Встроенной БД не нужны пакеты ради сокращения обращений к серверу, поэтому строки всегда
+        вставляются одной транзакцией через insert_companies_bulk / insert_vacancies_bulk.
+
+        Args:
+             data(Iterable[Vacancy | Employer]): объекты класса Вакансия или Работодатель
+             table(str): наименование таблицы
+             batch_size(int | None): число строк, передаваемых в executemany за один вызов.
+        Returns:
+            dict[int, str]: словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+        """
+        if table not in ("companies", "vacancies"):
+            raise ValueError(f"Таблица '{table}' не найдена.")
+
+        batch_size = batch_size if batch_size is not None else db_batch_size
+        if table == "companies":
+            return self.insert_companies_bulk(data, batch_size)
+        self.insert_vacancies_bulk(data, batch_size)
+        return {}
+
+    @invalidates_cache
+    def insert_companies_bulk(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Массово вставляет работодателей одной транзакцией; уже существующие работодатели (по employer_id)
+        обновляются, например, в таблицах, оставшихся от прерванной загрузки.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк, передаваемых в executemany за один вызов.
+        Returns:
+            dict[int, str]: словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+        """
+        employer_ids: list[str] = []
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            for batch in self._batches((self._company_row(item) for item in data), batch_size):
+                cur.executemany("""
+                    INSERT INTO companies (employer_id, name, alternate_url, city,
+                    description, site_url, vacancies_url, open_vacancies) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (employer_id) DO UPDATE SET
+                        name = excluded.name,
+                        alternate_url = excluded.alternate_url,
+                        city = excluded.city,
+                        description = excluded.description,
+                        site_url = excluded.site_url,
+                        vacancies_url = excluded.vacancies_url,
+                        open_vacancies = excluded.open_vacancies;
+                """, batch)
+                employer_ids.extend(row[0] for row in batch)
+
+            return self._vacancies_urls(cur, employer_ids)
+
+    @invalidates_cache
+    def insert_vacancies_bulk(self, data: Iterable[Vacancy], batch_size: int = db_batch_size) -> int:
+        """
+        Массово вставляет вакансии одной транзакцией; уже существующие вакансии пропускаются.
+
+        Данные читаются из итератора по одному пакету, поэтому можно передавать генератор
+        Parser.iter_vacancies без сборки полного списка.
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             batch_size(int): число строк, передаваемых в executemany за один вызов.
+        Returns:
+            int: количество вставленных строк.
+        """
+        inserted = 0
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            for batch in self._batches((self._vacancy_row(item) for item in data), batch_size):
+                cur.executemany("""
+                    INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                           salary_norm)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (vacancy_id) DO NOTHING;
+                """, batch)
+                inserted += cur.rowcount
+
+            self._refresh_salary_stats(cur)
+
+        return inserted
+
+    @invalidates_cache
+    def sync_companies(self, data: Iterable[Employer], batch_size: int = db_batch_size) -> dict[int, str]:
+        """
+        Синхронизирует работодателей с таблицей companies по employer_id.
+
+        Новые работодатели добавляются, изменившиеся - обновляются, строки с неизменившимися
+        данными не перезаписываются.
+
+        Args:
+             data(Iterable[Employer]): объекты класса Работодатель.
+             batch_size(int): число строк, передаваемых в executemany за один вызов.
+        Returns:
+            dict[int, str]: словарь с данными, где ключом является id работодателя,
+            а значением - api - ссылка на вакансии работодателя.
+        """
+        employer_ids: list[str] = []
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            for batch in self._batches(self._unique_rows((self._company_row(item) for item in data)), batch_size):
+                cur.executemany("""
+                    INSERT INTO companies (employer_id, name, alternate_url, city,
+                    description, site_url, vacancies_url, open_vacancies) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (employer_id) DO UPDATE SET
+                        name = excluded.name,
+                        alternate_url = excluded.alternate_url,
+                        city = excluded.city,
+                        description = excluded.description,
+                        site_url = excluded.site_url,
+                        vacancies_url = excluded.vacancies_url,
+                        open_vacancies = excluded.open_vacancies
+                    WHERE companies.name IS NOT excluded.name
+                       OR companies.alternate_url IS NOT excluded.alternate_url
+                       OR companies.city IS NOT excluded.city
+                       OR companies.description IS NOT excluded.description
+                       OR companies.site_url IS NOT excluded.site_url
+                       OR companies.vacancies_url IS NOT excluded.vacancies_url
+                       OR companies.open_vacancies IS NOT excluded.open_vacancies;
+                """, batch)
+                employer_ids.extend(row[0] for row in batch)
+
+            return self._vacancies_urls(cur, employer_ids)
+
+    @invalidates_cache
+    def sync_vacancies(self, data: Iterable[Vacancy], company_ids: Iterable[int],
+                       batch_size: int = db_batch_size) -> dict[str, int]:
+        """
+        Синхронизирует вакансии с таблицей vacancies по vacancy_id.
+
+        Новые вакансии добавляются, изменившиеся - обновляются, неизменившиеся не перезаписываются.
+        У изменившихся вакансий сбрасывается enriched_at, и их подробности будут получены заново.
+        Вакансии работодателей из company_ids, которых нет в data, удаляются как снятые с hh.ru.
+        company_ids читается после того, как data исчерпан (см. DBManager.sync_vacancies).
+
+        Args:
+             data(Iterable[Vacancy]): объекты класса Вакансия.
+             company_ids(Iterable[int]): id работодателей, вакансии которых получены полностью.
+             batch_size(int): число строк, передаваемых в executemany за один вызов.
+        Returns:
+            dict[str, int]: количество добавленных, обновленных, неизменившихся и удаленных вакансий.
+        """
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS seen_vacancies (vacancy_id TEXT PRIMARY KEY);")
+            cur.execute("DELETE FROM seen_vacancies;")
+
+            for batch in self._batches(self._unique_rows((self._vacancy_row(item) for item in data)), batch_size):
+                cur.execute("""
+                    SELECT COUNT(*) FROM vacancies WHERE vacancy_id IN (SELECT value FROM json_each(?));
+                """, (json.dumps([row[0] for row in batch]),))
+                existing = cur.fetchone()[0]
+
+                # rowcount учитывает добавленные и обновленные строки, но не пропущенные условием WHERE
+                cur.executemany("""
+                    INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                           salary_norm)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (vacancy_id) DO UPDATE SET
+                        name = excluded.name,
+                        company_id = excluded.company_id,
+                        url = excluded.url,
+                        salary_min = excluded.salary_min,
+                        salary_max = excluded.salary_max,
+                        requirement = excluded.requirement,
+                        salary_norm = excluded.salary_norm,
+                        -- подробности устаревают при изменении вакансии, но не при пересчете salary_norm
+                        enriched_at = CASE
+                            WHEN vacancies.name IS excluded.name AND vacancies.url IS excluded.url
+                             AND vacancies.salary_min IS excluded.salary_min
+                             AND vacancies.salary_max IS excluded.salary_max
+                             AND vacancies.requirement IS excluded.requirement
+                            THEN vacancies.enriched_at
+                        END
+                    WHERE vacancies.name IS NOT excluded.name
+                       OR vacancies.company_id IS NOT excluded.company_id
+                       OR vacancies.url IS NOT excluded.url
+                       OR vacancies.salary_min IS NOT excluded.salary_min
+                       OR vacancies.salary_max IS NOT excluded.salary_max
+                       OR vacancies.requirement IS NOT excluded.requirement
+                       OR vacancies.salary_norm IS NOT excluded.salary_norm;
+                """, batch)
+                inserted = len(batch) - existing
+                stats["inserted"] += inserted
+                stats["updated"] += cur.rowcount - inserted
+                stats["unchanged"] += len(batch) - cur.rowcount
+
+                cur.executemany("""
+                    INSERT INTO seen_vacancies (vacancy_id) VALUES (?) ON CONFLICT DO NOTHING;
+                """, ((row[0],) for row in batch))
+
+            cur.execute("""
+                DELETE FROM vacancies
+                WHERE company_id IN (SELECT value FROM json_each(?))
+                AND vacancy_id NOT IN (SELECT vacancy_id FROM seen_vacancies);
+            """, (json.dumps(list(company_ids)),))
+            stats["deleted"] = cur.rowcount
+            cur.execute("DROP TABLE seen_vacancies;")
+
+            if stats["inserted"] or stats["updated"] or stats["deleted"]:
+                self._refresh_salary_stats(cur)
+
+        return stats
+
+    def get_vacancies_to_enrich(self, limit: int | None = None) -> list[tuple[str, str]]:
+        """
+        Получает вакансии, подробности которых еще не получены или устарели (enriched_at IS NULL),
+        в порядке добавления. Результат не кэшируется.
+
+        Args:
+            limit(int | None): максимальное число вакансий, по умолчанию - все.
+        Returns:
+            list[tuple[str, str]]: пары (vacancy_id, api - ссылка на вакансию).
+        """
+        return self._fetch_all("""
+            SELECT vacancy_id, url FROM vacancies
+            WHERE enriched_at IS NULL
+            ORDER BY id
+            LIMIT ?;
+        """, (limit if limit is not None else -1,))
+
+    @invalidates_cache
+    def update_vacancy_details(self, data: Iterable[VacancyDetails], batch_size: int = db_batch_size) -> int:
+        """
+        Записывает подробности вакансий и отмечает время их получения (enriched_at).
+
+        Каждый пакет фиксируется отдельной транзакцией, поэтому прерванное получение подробностей
+        продолжается с места остановки.
+
+        Args:
+            data(Iterable[VacancyDetails]): подробности вакансий, например из Parser.iter_vacancy_details.
+            batch_size(int): число строк в одной транзакции.
+        Returns:
+            int: количество обновленных вакансий.
+        """
+        updated = 0
+
+        for batch in self._batches(self._unique_rows(data), batch_size):
+            with self._connection() as conn:
+                cur = conn.cursor()
+                cur.executemany("""
+                    UPDATE vacancies SET
+                        description = ?,
+                        key_skills = ?,
+                        experience = ?,
+                        schedule = ?,
+                        enriched_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                    WHERE vacancy_id = ?;
+                """, ((description, key_skills, experience, schedule, vacancy_id)
+                      for vacancy_id, description, key_skills, experience, schedule in batch))
+                updated += cur.rowcount
+
+        return updated
+
+    @invalidates_cache
+    def load_snapshot(self, snapshot: Snapshot) -> dict[str, int]:
+        """
+        Загружает снимок данных (см. src/snapshot.py) в таблицы companies и vacancies одной транзакцией.
+
+        Уже существующие работодатели (по employer_id) и вакансии (по vacancy_id) сохраняются,
+        вакансии снимка привязываются к работодателям по employer_id.
+
+        Args:
+            snapshot(Snapshot): открытый снимок данных.
+        Returns:
+            dict[str, int]: количество добавленных работодателей и вакансий.
+        """
+        # id работодателя в снимке -> employer_id
+        snapshot_employers: dict[int, str] = {}
+
+        def company_rows() -> Iterator[tuple[Any, ...]]:
+            for row in snapshot.table("companies").rows(column for column, _ in COMPANY_COLUMNS):
+                snapshot_employers[row[0]] = row[1]
+                yield row[1:]
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.executemany("""
+                INSERT INTO companies (employer_id, name, alternate_url, city,
+                description, site_url, vacancies_url, open_vacancies) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (employer_id) DO NOTHING;
+            """, company_rows())
+            stats = {"companies": cur.rowcount}
+
+            cur.execute("""
+                SELECT employer_id, id FROM companies WHERE employer_id IN (SELECT value FROM json_each(?));
+            """, (json.dumps(list(snapshot_employers.values())),))
+            ids: dict[str, int] = dict(cur.fetchall())
+            company_ids = {snapshot_id: ids[employer_id] for snapshot_id, employer_id in snapshot_employers.items()
+                           if employer_id in ids}
+
+            # пустые строки и нулевая зарплата снимка - NULL
+            rows = ((vacancy_id, name, company_ids[company_id], url, salary_min, salary_max, requirement,
+                     salary_norm or None, *(value or None for value in details))
+                    for vacancy_id, name, company_id, url, salary_min, salary_max, requirement, salary_norm, *details
+                    in vacancy_rows(snapshot.table("vacancies"))
+                    if company_id in company_ids)
+            cur.executemany("""
+                INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement,
+                                       salary_norm, description, key_skills, experience, schedule, enriched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (vacancy_id) DO NOTHING;
+            """, rows)
+            stats["vacancies"] = cur.rowcount
+
+            self._refresh_salary_stats(cur)
+
+        return stats
+
+    @staticmethod
+    def _vacancies_urls(cur: sqlite3.Cursor, employer_ids: list[str]) -> dict[int, str]:
+        """
+        Возвращает словарь id работодателя в БД -> api - ссылка на вакансии для employer_ids.
+        """
+        cur.execute("""
+            SELECT id, vacancies_url FROM companies WHERE employer_id IN (SELECT value FROM json_each(?));
+        """, (json.dumps(employer_ids),))
+        return dict(cur.fetchall())
+
+    @staticmethod
+    def _refresh_salary_stats(cur: sqlite3.Cursor) -> None:
+        """
+        Пересчитывает статистику по зарплатам в текущей транзакции.
+
+        Медиана - среднее двух центральных значений (или центральное значение), как percentile_cont(0.5).
+        """
+        cur.execute("DELETE FROM salary_stats;")
+        cur.execute("""
+            INSERT INTO salary_stats (company_id, is_total, vacancies_count, avg_salary, median_salary,
+                                      min_salary, max_salary)
+            WITH ranked AS (
+                SELECT company_id, salary_norm,
+                       ROW_NUMBER() OVER (PARTITION BY company_id ORDER BY salary_norm) AS company_rank,
+                       COUNT(*) OVER (PARTITION BY company_id) AS company_count,
+                       ROW_NUMBER() OVER (ORDER BY salary_norm) AS total_rank,
+                       COUNT(*) OVER () AS total_count
+                FROM vacancies
+                WHERE salary_norm IS NOT NULL
+            )
+            SELECT company_id, 0, COUNT(*), AVG(salary_norm),
+                   AVG(CASE WHEN company_rank IN ((company_count + 1) / 2, (company_count + 2) / 2)
+                            THEN salary_norm END),
+                   MIN(salary_norm), MAX(salary_norm)
+            FROM ranked
+            GROUP BY company_id
+            UNION ALL
+            SELECT NULL, 1, COUNT(*), AVG(salary_norm),
+                   AVG(CASE WHEN total_rank IN ((total_count + 1) / 2, (total_count + 2) / 2) THEN salary_norm END),
+                   MIN(salary_norm), MAX(salary_norm)
+            FROM ranked;
+        """)
+
+    @invalidates_cache
+    def drop_table(self, table: str) -> None:
+        """
+        Удаляет таблицу, если она существует.
+        Вместе с таблицей vacancies удаляются ее полнотекстовый индекс и статистика salary_stats.
+
+        Args:
+             table(str): наименование таблицы.
+        """
+        with self._connection() as conn:
+            cur = conn.cursor()
+            if table == "vacancies":
+                cur.execute("DROP TABLE IF EXISTS salary_stats;")
+                cur.execute("DROP TABLE IF EXISTS vacancies_fts;")
+            cur.execute(f"DROP TABLE IF EXISTS {table};")
+
+    def remove_duplicates(self) -> dict[str, int]:
+        """
+        Удаляет повторы работодателей и вакансий (см. DBManager.remove_duplicates).
+        Таблицы SQLite с самого начала создаются с уникальными employer_id и vacancy_id,
+        поэтому повторов в них нет.
+
+        Returns:
+            dict[str, int]: нулевые счетчики "companies", "moved_vacancies" и "vacancies".
+        """
+        return {"companies": 0, "moved_vacancies": 0, "vacancies": 0}
+
+    @cached_query
+    def get_companies_and_vacancies_count(self) -> list[tuple[Any, ...]]:
+        """
+        Получает список всех компаний и количество вакансий у каждой компании.
+
+        Returns:
+            list[tuple[Any, ...]]: список всех компаний и количество вакансий у каждой компании.
+        """
+        return self._fetch_all("""
+            SELECT companies.name, COUNT(vacancies.id)
+            FROM companies
+            LEFT JOIN vacancies ON companies.id = vacancies.company_id
+            GROUP BY companies.name;
+        """)
+
+    @cached_query
+    def get_all_vacancies(self) -> list[tuple[Any, ...]]:
+        """
+        Получает список всех вакансий с указанием названия компании, названия вакансии
+        и зарплаты и ссылки на вакансию.
+
+        Returns:
+            list[tuple[Any, ...]]: список всех вакансий.
+        """
+        return self._fetch_all("""
+            SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+            FROM vacancies as v
+            JOIN companies as c ON v.company_id = c.id;
+        """)
+
+    @cached_query
+    def get_avg_salary(self) -> float:
+        """
+        Получает среднюю зарплату по вакансиям из статистики salary_stats.
+
+        Returns:
+            float: Средняя зарплата по вакансиям.
+        """
+        rows = self._fetch_all("SELECT avg_salary FROM salary_stats WHERE is_total;")
+        avg_salary = rows[0][0] if rows and rows[0][0] is not None else 0.0
+        return round(avg_salary, 2)
+
+    @cached_query
+    def get_salary_stats(self) -> list[tuple[Any, ...]]:
+        """
+        Получает статистику по зарплатам: сначала по всем вакансиям, затем по каждой компании.
+
+        Returns:
+            list[tuple[Any, ...]]: строки (компания, число вакансий, средняя, медианная,
+            минимальная и максимальная зарплата); для итоговой строки компания - "Все компании".
+        """
+        return self._fetch_all("""
+            SELECT CASE WHEN s.is_total THEN 'Все компании' ELSE c.name END,
+                   s.vacancies_count, ROUND(s.avg_salary, 2), s.median_salary, s.min_salary, s.max_salary
+            FROM salary_stats AS s
+            LEFT JOIN companies AS c ON s.company_id = c.id
+            ORDER BY s.is_total DESC, c.name;
+        """)
+
+    @cached_query
+    def get_vacancies_with_higher_salary(self) -> list[tuple[Any, ...]]:
+        """
+        Получает список всех вакансий, у которых зарплата выше средней по всем вакансиям
+        (по индексу на salary_norm, от большей зарплаты к меньшей).
+
+        Returns:
+            list[tuple[Any, ...]]: Список вакансий с зарплатой выше средней.
+        """
+        return self._fetch_all(self._HIGHER_SALARY_SQL)
+
+    @cached_query
+    def get_vacancies_by_salary(self, salary_from: int | None = None, salary_to: int | None = None,
+                                limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Получает вакансии с зарплатой в базовой валюте (salary_norm) от salary_from до salary_to
+        включительно, от большей зарплаты к меньшей (по индексу на salary_norm, см. DBManager).
+
+        Args:
+            salary_from(int | None): нижняя граница зарплаты, по умолчанию - без ограничения.
+            salary_to(int | None): верхняя граница зарплаты, по умолчанию - без ограничения.
+            limit(int | None): максимальное число результатов, по умолчанию - все.
+        Returns:
+            list[tuple[Any, ...]]: строки (компания, вакансия, salary_min, salary_max, ссылка, salary_norm).
+        """
+        return self._fetch_all(self._SALARY_RANGE_SQL, {
+            "salary_from": salary_from if salary_from is not None else -1,
+            "salary_to": salary_to if salary_to is not None else 2 ** 63 - 1,
+            "limit": limit if limit is not None else -1,
+        })
+
+    @cached_query
+    def get_vacancies_with_keyword(self, keyword: str) -> list[tuple[Any, ...]]:
+        """
+        Получает список всех вакансий, в названии или требованиях которых содержатся переданные в метод слова.
+        Результаты отсортированы по релевантности (см. search_vacancies).
+
+        Args:
+            keyword (str): переданное в запрос слово
+        Returns:
+            list[tuple[Any, ...]]: список найденных вакансий.
+        """
+        # кэшируется сам этот вызов, поэтому результат поиска отдельно не сохраняется
+        return self.search_vacancies(keyword, use_cache=False)
+
+    @cached_query
+    def search_vacancies(self, query: str, limit: int | None = None) -> list[tuple[Any, ...]]:
+        """
+        Ищет вакансии по названию и требованиям с ранжированием по релевантности (bm25).
+
+        Вакансия подходит, если каждое слово запроса является началом какого-либо слова в названии
+        или требованиях (без учета регистра). Совпадения в названии весят больше, чем в требованиях.
+
+        Args:
+            query(str): поисковый запрос из одного или нескольких слов.
+            limit(int | None): максимальное число результатов, по умолчанию - без ограничения.
+        Returns:
+            list[tuple[Any, ...]]: список найденных вакансий, от наиболее релевантных.
+        """
+        params = self._search_params(query, limit)
+        if params is None:
+            return []
+        return self._fetch_all(self._KEYWORD_SEARCH_SQL, params)
+
+    @staticmethod
+    def _search_params(query: str, limit: int | None) -> dict[str, Any] | None:
+        """
+        Возвращает параметры поискового запроса FTS5 (каждое слово - префикс в кавычках)
+        или None, если в запросе нет слов.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        return {"query": " ".join(f'"{word}"*' for word in words), "limit": limit if limit is not None else -1}
+
+    @cached_query
+    def get_vacancies_page(self, after: str | None = None, limit: int = db_page_size, order: str = "id") -> Page:
+        """
+        Получает страницу списка всех вакансий (keyset-пагинация по индексу, см. DBManager.get_vacancies_page).
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+            order(str): "id" - в порядке добавления, "salary" - вакансии с зарплатой, от большей к меньшей.
+        Returns:
+            Page: вакансии страницы и курсор следующей страницы.
+        """
+        if order == "id":
+            (last_id,) = self._page_key(after, (0,), limit)
+            return self._fetch_page(self._VACANCIES_BY_ID_PAGE_SQL, {"id": last_id}, limit, 1)
+        if order == "salary":
+            salary, last_id = self._page_key(after, (self._MAX_KEY, self._MAX_KEY), limit)
+            return self._fetch_page(self._VACANCIES_BY_SALARY_PAGE_SQL, {"salary": salary, "id": last_id}, limit, 2)
+        raise ValueError(f"Неизвестный порядок вакансий: {order!r}")
+
+    @cached_query
+    def get_vacancies_with_higher_salary_page(self, after: str | None = None, limit: int = db_page_size) -> Page:
+        """
+        Получает страницу вакансий с зарплатой выше средней, от большей зарплаты к меньшей.
+
+        Args:
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        Returns:
+            Page: вакансии страницы и курсор следующей страницы.
+        """
+        salary, last_id = self._page_key(after, (self._MAX_KEY, self._MAX_KEY), limit)
+        return self._fetch_page(self._HIGHER_SALARY_PAGE_SQL, {"salary": salary, "id": last_id}, limit, 2)
+
+    @cached_query
+    def get_vacancies_with_keyword_page(self, keyword: str, after: str | None = None,
+                                        limit: int = db_page_size) -> Page:
+        """
+        Получает страницу вакансий, найденных по ключевому слову, от наиболее релевантных (см. search_vacancies).
+
+        Args:
+            keyword (str): переданное в запрос слово
+            after(str | None): курсор next_after предыдущей страницы; None - первая страница.
+            limit(int): число вакансий на странице.
+        Returns:
+            Page: вакансии страницы и курсор следующей страницы.
+        """
+        score, last_id = self._page_key(after, (float("-inf"), 0), limit)
+        params = self._search_params(keyword, None)
+        if params is None:
+            return Page([], None)
+        return self._fetch_page(self._KEYWORD_PAGE_SQL, params | {"score": score, "id": last_id}, limit, 2)
+
+    def _fetch_page(self, sql: str, params: dict[str, Any], limit: int, key_size: int) -> Page:
+        """
+        Выполняет постраничный запрос с LIMIT limit + 1 и собирает страницу (см. AbstractDBManager._page).
+        """
+        return self._page(self._fetch_all(sql, params | {"limit": limit + 1}), limit, key_size)
+
+    def iter_all_vacancies(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем вакансиям с указанием названия компании, названия вакансии,
+        зарплаты и ссылки на вакансию.
+
+        Строки читаются порциями по itersize через отдельное соединение (см. _stream).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям.
+        """
+        return self._stream("""
+            SELECT c.name, v.name, v.salary_min, v.salary_max, v.url
+            FROM vacancies as v
+            JOIN companies as c ON v.company_id = c.id;
+        """, (), itersize)
+
+    def iter_vacancies_with_higher_salary(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по вакансиям, у которых зарплата выше средней по всем вакансиям.
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям с зарплатой выше средней.
+        """
+        return self._stream(self._HIGHER_SALARY_SQL, (), itersize)
+
+    def iter_vacancies_with_keyword(self, keyword: str,
+                                    itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по вакансиям, найденным по ключевому слову (см. search_vacancies).
+
+        Args:
+            keyword (str): переданное в запрос слово
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по найденным вакансиям, от наиболее релевантных.
+        """
+        params = self._search_params(keyword, None)
+        if params is None:
+            return iter(())
+        return self._stream(self._KEYWORD_SEARCH_SQL, params, itersize)
+
+    def iter_vacancy_salaries(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по строкам (vacancy_id, company_id, salary_min, salary_max, salary_norm)
+        всех вакансий для построения VacancyTable.
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по зарплатам вакансий.
+        """
+        return self._stream("SELECT vacancy_id, company_id, salary_min, salary_max, salary_norm FROM vacancies;", (),
+                            itersize)
+
+    def iter_company_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем строкам таблицы companies в порядке столбцов снимка (COMPANY_COLUMNS).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по работодателям.
+        """
+        return self._stream("""
+            SELECT id, employer_id, name, alternate_url, city, description, site_url, vacancies_url, open_vacancies
+            FROM companies
+            ORDER BY id;
+        """, (), itersize)
+
+    def iter_vacancy_rows(self, itersize: int = db_stream_itersize) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает итератор по всем строкам таблицы vacancies в порядке столбцов снимка (VACANCY_COLUMNS).
+
+        Args:
+            itersize(int): число строк, получаемых за одно обращение.
+        Returns:
+            Iterator[tuple[Any, ...]]: итератор по вакансиям.
+        """
+        return self._stream("""
+            SELECT vacancy_id, name, company_id, url, salary_min, salary_max, requirement, salary_norm,
+                   description, key_skills, experience, schedule, enriched_at
+            FROM vacancies
+            ORDER BY id;
+        """, (), itersize)
+
+    def _fetch_all(self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()) -> list[tuple[Any, ...]]:
+        """
+        Выполняет читающий запрос и возвращает все строки результата.
+        """
+        with self._connection() as conn:
+            return conn.cursor().execute(sql, params).fetchall()
+
+    def _stream(self, sql: str, params: tuple[Any, ...] | dict[str, Any], itersize: int) -> Iterator[tuple[Any, ...]]:
+        """
+        Выполняет запрос и отдает строки порциями по itersize по мере получения.
+
+        Запрос выполняется на отдельном соединении в одной читающей транзакции (согласованный снимок БД;
+        в режиме WAL запись через основное соединение при этом не блокируется), поэтому недочитанный
+        итератор не занимает основное соединение. У БД ":memory:" второго соединения нет: строки
+        результата читаются целиком под блокировкой основного соединения.
+
+        Args:
+            sql(str): текст запроса.
+            params(tuple[Any, ...] | dict[str, Any]): параметры запроса.
+            itersize(int): число строк, получаемых за одно обращение.
+        """
+        if self._path == ":memory:":
+            with self._connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            yield from rows
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            while rows := cur.fetchmany(itersize):
+                yield from rows
+        finally:
+            conn.close()
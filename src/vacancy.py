@@ -1,10 +1,50 @@
 from abc import ABC, abstractmethod
 
+from config import currency_rates, salary_base_currency, salary_net_ratio
+
+
+def normalize_salary(salary_from: int | None, salary_to: int | None, currency: str | None, gross: bool = False,
+                     rates: dict[str, float] = currency_rates, base_currency: str = salary_base_currency,
+                     net_ratio: float = salary_net_ratio) -> int | None:
+    """
+    Приводит зарплату к базовой валюте: середина вилки или единственная указанная граница,
+    пересчитанная по курсу и, для зарплаты до вычета налога, умноженная на net_ratio.
+
+    Args:
+        salary_from(int | None): нижняя граница зарплаты (0 или None - не указана).
+        salary_to(int | None): верхняя граница зарплаты (0 или None - не указана).
+        currency(str | None): код валюты hh.ru, None - базовая валюта.
+        gross(bool): зарплата указана до вычета налога.
+        rates(dict[str, float]): стоимость единицы валюты в рублях.
+        base_currency(str): валюта результата.
+        net_ratio(float): доля зарплаты после вычета налога.
+    Returns:
+        int | None: зарплата в базовой валюте, округленная до целого, или None, если зарплата
+        не указана или ее валюты нет в rates.
+    """
+    if salary_from and salary_to:
+        amount = (salary_from + salary_to) / 2
+    else:
+        amount = salary_from or salary_to
+    if not amount:
+        return None
+
+    rate = rates.get(currency or base_currency)
+    base_rate = rates.get(base_currency)
+    if rate is None or not base_rate:
+        return None
+
+    amount = amount * rate / base_rate
+    if gross:
+        amount *= net_ratio
+    return round(amount)
+
 
 class BaseVacancy(ABC):
     """
     Абстрактный базовый класс для представления вакансии.
     """
+    __slots__ = ()
 
     @classmethod
     @abstractmethod
@@ -24,7 +64,15 @@ class BaseVacancy(ABC):
 class Vacancy(BaseVacancy):
     """
     Представляет класс Вакансия.
+
+    Атрибуты хранятся в слотах, а зарплата - двумя целыми числами с кодом валюты и признаком gross,
+    без словаря на каждый объект: при загрузке вакансии создаются миллионами.
+    Ключ сравнения по зарплате вычисляется один раз при создании, поэтому сравнения и сортировка
+    не пересчитывают зарплату в базовую валюту.
     """
+    __slots__ = ('__vacancy_id', '__name', '__url', '__salary_from', '__salary_to', '__salary_currency',
+                 '__salary_gross', '__requirement', '__company_id', '__salary_key')
+
     vacancy_id: str
     name: str
     url: str
@@ -38,14 +86,13 @@ class Vacancy(BaseVacancy):
         self.__vacancy_id = vacancy_id if vacancy_id else ""
         self.__name = name if name else ""
         self.__url = url if url else ""
-        # Если зарплата не указана, создаем пустой диапазон
-        if salary:
-            salary_from = salary.get('from', 0) if salary.get('from') is not None else 0
-            salary_to = salary.get('to', 0) if salary.get('to') is not None else 0
-
-            self.__salary = {'from': salary_from, 'to': salary_to}
-        else:
-            self.__salary = {"from": 0, "to": 0}
+        # Если зарплата или ее границы не указаны, граница равна 0
+        salary = salary if salary else {}
+        self.__salary_from = salary.get('from') or 0
+        self.__salary_to = salary.get('to') or 0
+        self.__salary_currency = salary.get('currency') or ""
+        self.__salary_gross = bool(salary.get('gross'))
+        self.__salary_key = self.__make_salary_key()
 
         self.__requirement = requirement if requirement else ""
         self.__company_id = company_id
@@ -66,7 +113,31 @@ class Vacancy(BaseVacancy):
 
     @property
     def salary(self):
-        return self.__salary
+        return {'from': self.__salary_from, 'to': self.__salary_to, 'currency': self.__salary_currency,
+                'gross': self.__salary_gross}
+
+    @property
+    def salary_from(self):
+        return self.__salary_from
+
+    @property
+    def salary_to(self):
+        return self.__salary_to
+
+    @property
+    def salary_currency(self):
+        return self.__salary_currency
+
+    @property
+    def salary_gross(self):
+        return self.__salary_gross
+
+    @property
+    def salary_norm(self) -> int | None:
+        """
+        Зарплата в базовой валюте (см. normalize_salary) или None, если ее нельзя определить.
+        """
+        return None if self.__salary_key < 0 else self.__salary_key
 
     @property
     def requirement(self):
@@ -81,10 +152,10 @@ class Vacancy(BaseVacancy):
        Выводит строковое представление объекта класса Вакансия.
         """
         # salary_str = ""
-        if self.salary.get("from") and self.salary.get("to"):
-            salary_str = f"{self.salary['from']} - {self.salary['to']}"
+        if self.__salary_from and self.__salary_to:
+            salary_str = f"{self.__salary_from} - {self.__salary_to}"
         else:
-            salary_value = self.salary.get("from") or self.salary.get("to")
+            salary_value = self.__salary_from or self.__salary_to
             salary_str = str(salary_value) if salary_value else ""
 
         return (f"ID: {self.__vacancy_id}"
@@ -103,44 +174,90 @@ class Vacancy(BaseVacancy):
         Returns:
             Vacancy: экземпляр класса Вакансия.
         """
-        salary = data.get("salary")
-        if salary:
-            salary_from = salary.get('from', 0) if salary.get('from') is not None else 0
-            salary_to = salary.get('to', 0) if salary.get('to') is not None else 0
-        else:
-            # Устанавливаем значения зарплаты по умолчанию, если отсутствует salary
-            salary_from, salary_to = 0, 0
-        vacancy_id = data.get("id", "")
-        name = data.get("name", "")
-        url = data.get("url", "")
-        salary = {'from': salary_from, 'to': salary_to}
-        requirement = data.get("snippet", {}).get("requirement", "")
-        company_id = company_id
-
-        return cls(vacancy_id, name, url, salary, requirement, company_id)
-
-    # Метод сравнения вакансий по зарплате
-    def compare_salaries(self, other):
-        from1 = self.salary.get('from', 0)
-        to1 = self.salary.get('to', from1)
-        from2 = other.salary.get('from', 0)
-        to2 = other.salary.get('to', from2)
-
-        if to1 < from2:
-            return -1
-        elif from1 > to2:
-            return 1
-        else:
-            return 0
+        # зарплата нормализуется один раз - в конструкторе
+        snippet = data.get("snippet") or {}
+        return cls(data.get("id", ""), data.get("name", ""), data.get("url", ""), data.get("salary"),
+                   snippet.get("requirement", ""), company_id)
+
+    @classmethod
+    def from_salary_range(cls, vacancy_id: str | None, name: str | None, url: str | None, salary_from: int | None,
+                          salary_to: int | None, requirement: str | None, company_id: int,
+                          salary_currency: str | None = None, salary_gross: bool | None = None) -> 'Vacancy':
+        """
+        Создает экземпляр класса Вакансия из готовых границ зарплаты, без промежуточного словаря
+        (используется при типизированном разборе ответов API).
+        Args:
+            vacancy_id(str | None): id вакансии.
+            name(str | None): название вакансии.
+            url(str | None): api - ссылка на вакансию.
+            salary_from(int | None): нижняя граница зарплаты.
+            salary_to(int | None): верхняя граница зарплаты.
+            requirement(str | None): требования к вакансии.
+            company_id(int): ID работодателя.
+            salary_currency(str | None): код валюты зарплаты.
+            salary_gross(bool | None): зарплата указана до вычета налога.
+        Returns:
+            Vacancy: экземпляр класса Вакансия.
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.__vacancy_id = vacancy_id or ""
+        vacancy.__name = name or ""
+        vacancy.__url = url or ""
+        vacancy.__salary_from = salary_from or 0
+        vacancy.__salary_to = salary_to or 0
+        vacancy.__salary_currency = salary_currency or ""
+        vacancy.__salary_gross = bool(salary_gross)
+        vacancy.__salary_key = vacancy.__make_salary_key()
+        vacancy.__requirement = requirement or ""
+        vacancy.__company_id = company_id
+        return vacancy
+
+    def compare_salaries(self, other: 'Vacancy') -> int:
+        """
+        Сравнивает вакансии по зарплате в базовой валюте (salary_norm); вакансия без зарплаты меньше
+        любой вакансии с зарплатой. Порядок линейный (транзитивный), поэтому списки вакансий можно сортировать,
+        но большие списки быстрее сортировать по готовому ключу (см. src.vacancy_order).
+
+        Returns:
+            int: -1, 0 или 1, если зарплата меньше, равна или больше зарплаты other.
+        """
+        salary, other_salary = self.__salary_key, other.__salary_key
+        return (salary > other_salary) - (salary < other_salary)
+
+    def __make_salary_key(self) -> int:
+        """
+        Возвращает ключ сравнения по зарплате: salary_norm или -1, если зарплату нельзя определить.
+        """
+        salary = normalize_salary(self.__salary_from, self.__salary_to, self.__salary_currency, self.__salary_gross)
+        return -1 if salary is None else salary
 
     def __lt__(self, other):
-        return self.compare_salaries(other) == -1
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.__salary_key < other.__salary_key
 
     def __eq__(self, other):
-        return self.compare_salaries(other) == 0
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.__salary_key == other.__salary_key
+
+    def __le__(self, other):
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.__salary_key <= other.__salary_key
 
     def __gt__(self, other):
-        return self.compare_salaries(other) == 1
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.__salary_key > other.__salary_key
+
+    def __ge__(self, other):
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.__salary_key >= other.__salary_key
+
+    # равенство по зарплате не идентифицирует вакансию, поэтому вакансии не хешируются
+    __hash__ = None
 
     @classmethod
     def cast_to_object_list(cls, data: list[dict], company_id: int) -> list['Vacancy']:
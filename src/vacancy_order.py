@@ -0,0 +1,141 @@
+import heapq
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator
+
+from src.vacancy import Vacancy
+
+SalaryKey = Callable[[Vacancy], Any]
+
+
+def salary_norm_key(vacancy: Vacancy) -> int | None:
+    """
+    Ключ по зарплате в базовой валюте (Vacancy.salary_norm: середина вилки с пересчетом по курсу)
+    или None, если зарплата не указана или ее валюта неизвестна.
+    """
+    return vacancy.salary_norm
+
+
+def salary_range_key(vacancy: Vacancy) -> tuple[int, int] | None:
+    """
+    Ключ по границам вилки (from, to) в валюте вакансии без пересчета или None, если зарплата не указана.
+    """
+    if not (vacancy.salary_from or vacancy.salary_to):
+        return None
+    return vacancy.salary_from, vacancy.salary_to
+
+
+SALARY_KEYS: dict[str, SalaryKey] = {"norm": salary_norm_key, "range": salary_range_key}
+
+# ключ пары (ключ вакансии, вакансия)
+_first = itemgetter(0)
+
+
+def sort_by_salary(vacancies: Iterable[Vacancy], key: SalaryKey = salary_norm_key,
+                   reverse: bool = True) -> list[Vacancy]:
+    """
+    Сортирует вакансии по зарплате; вакансии без зарплаты - в конце списка в исходном порядке.
+
+    Ключ вычисляется один раз на вакансию, и сортировка сравнивает готовые ключи (числа или пары чисел),
+    а не вызывает Vacancy.__lt__ на каждое сравнение. Сортировка устойчива: вакансии с равными ключами
+    остаются в исходном порядке.
+
+    Args:
+        vacancies(Iterable[Vacancy]): вакансии.
+        key(SalaryKey): функция ключа (см. SALARY_KEYS).
+        reverse(bool): от большей зарплаты к меньшей.
+    Returns:
+        list[Vacancy]: отсортированный список вакансий.
+    """
+    with_salary: list[tuple[Any, Vacancy]] = []
+    without_salary: list[Vacancy] = []
+    for vacancy in vacancies:
+        value = key(vacancy)
+        if value is None:
+            without_salary.append(vacancy)
+        else:
+            with_salary.append((value, vacancy))
+
+    # сортируется список пар, а ключ - первый элемент пары, поэтому вакансии между собой не сравниваются
+    with_salary.sort(key=_first, reverse=reverse)
+    return [vacancy for _, vacancy in with_salary] + without_salary
+
+
+def top_k(vacancies: Iterable[Vacancy], k: int, key: SalaryKey = salary_norm_key) -> list[Vacancy]:
+    """
+    Возвращает k вакансий с наибольшей зарплатой, от большей к меньшей, за один проход по вакансиям
+    с кучей из k элементов: O(n log k) сравнений и O(k) памяти вместо сортировки всех вакансий.
+    Вакансии без зарплаты пропускаются; при равных зарплатах - в исходном порядке.
+
+    Args:
+        vacancies(Iterable[Vacancy]): вакансии, например, итератор без промежуточного списка.
+        k(int): число вакансий.
+        key(SalaryKey): функция ключа (см. SALARY_KEYS).
+    Returns:
+        list[Vacancy]: не больше k вакансий.
+    """
+    return [vacancy for _, vacancy in heapq.nlargest(k, _with_keys(vacancies, key), key=_first)]
+
+
+def bottom_k(vacancies: Iterable[Vacancy], k: int, key: SalaryKey = salary_norm_key) -> list[Vacancy]:
+    """
+    Возвращает k вакансий с наименьшей зарплатой, от меньшей к большей (см. top_k).
+    Вакансии без зарплаты пропускаются.
+
+    Args:
+        vacancies(Iterable[Vacancy]): вакансии.
+        k(int): число вакансий.
+        key(SalaryKey): функция ключа (см. SALARY_KEYS).
+    Returns:
+        list[Vacancy]: не больше k вакансий.
+    """
+    return [vacancy for _, vacancy in heapq.nsmallest(k, _with_keys(vacancies, key), key=_first)]
+
+
+def merge_sorted(streams: Iterable[Iterable[Vacancy]], key: SalaryKey = salary_norm_key,
+                 reverse: bool = True) -> Iterator[Vacancy]:
+    """
+    Объединяет потоки вакансий, каждый из которых отсортирован sort_by_salary с теми же key и reverse
+    (например, вакансии каждого работодателя), в один отсортированный поток.
+
+    Потоки читаются лениво, в памяти - по одной вакансии каждого потока: O(n log m) сравнений
+    для m потоков вместо повторной сортировки всех вакансий. Вакансии без зарплаты из всех потоков
+    следуют в конце.
+
+    Args:
+        streams(Iterable[Iterable[Vacancy]]): отсортированные потоки вакансий.
+        key(SalaryKey): функция ключа, по которой отсортированы потоки.
+        reverse(bool): потоки отсортированы от большей зарплаты к меньшей.
+    Returns:
+        Iterator[Vacancy]: итератор по всем вакансиям в порядке зарплаты.
+    """
+    # вакансии без зарплаты замыкают каждый поток; они откладываются до исчерпания всех потоков
+    without_salary: list[Vacancy] = []
+
+    def with_salary(stream: Iterable[Vacancy]) -> Iterator[tuple[Any, Vacancy]]:
+        for vacancy in stream:
+            value = key(vacancy)
+            if value is None:
+                without_salary.append(vacancy)
+            else:
+                yield value, vacancy
+
+    merged = heapq.merge(*(with_salary(stream) for stream in streams), key=_first, reverse=reverse)
+    return chain((vacancy for _, vacancy in merged), _drain(without_salary))
+
+
+def _with_keys(vacancies: Iterable[Vacancy], key: SalaryKey) -> Iterator[tuple[Any, Vacancy]]:
+    """
+    Возвращает пары (ключ, вакансия) вакансий с зарплатой.
+    """
+    for vacancy in vacancies:
+        value = key(vacancy)
+        if value is not None:
+            yield value, vacancy
+
+
+def _drain(vacancies: list[Vacancy]) -> Iterator[Vacancy]:
+    """
+    Отдает вакансии списка, заполненного к моменту первого обращения к итератору.
+    """
+    yield from vacancies
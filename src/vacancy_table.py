@@ -0,0 +1,216 @@
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("Для VacancyTable установите пакет numpy: poetry install -E analytics "
+                      "или pip install numpy.") from error
+
+from src.vacancy import Vacancy
+
+
+class VacancyTable:
+    """
+    Представляет колоночную таблицу вакансий в памяти для аналитики без обращения к БД.
+
+    Столбцы хранятся массивами NumPy, поэтому средняя зарплата, процентили, отбор вакансий
+    выше средней, подсчет по компаниям и top-k вычисляются векторно.
+    Зарплата вакансии - зарплата в базовой валюте, как столбец salary_norm в БД (см. normalize_salary);
+    вакансии без зарплаты (NaN) не учитываются в средней и процентилях и попадают в конец top-k.
+
+    Требует пакет numpy.
+    """
+
+    def __init__(self, vacancy_id: np.ndarray, company_id: np.ndarray, salary_min: np.ndarray,
+                 salary_max: np.ndarray, salary_norm: np.ndarray | None = None) -> None:
+        """
+        Конструктор экземпляра класса VacancyTable.
+
+        Args:
+            vacancy_id(np.ndarray): id вакансий.
+            company_id(np.ndarray): id работодателей.
+            salary_min(np.ndarray): нижние границы зарплаты.
+            salary_max(np.ndarray): верхние границы зарплаты.
+            salary_norm(np.ndarray | None): зарплаты в базовой валюте (NaN - не определена); по умолчанию
+            вычисляются из границ вилки, как для зарплат в базовой валюте.
+        """
+        if not len(vacancy_id) == len(company_id) == len(salary_min) == len(salary_max):
+            raise ValueError("Столбцы таблицы вакансий должны быть одной длины.")
+
+        self.__vacancy_id = np.asarray(vacancy_id, dtype=str)
+        self.__company_id = np.asarray(company_id, dtype=np.int64)
+        self.__salary_min = np.asarray(salary_min, dtype=np.int64)
+        self.__salary_max = np.asarray(salary_max, dtype=np.int64)
+        if salary_norm is None:
+            # середина вилки или единственная указанная граница, без зарплаты - NaN
+            both = (self.__salary_min > 0) & (self.__salary_max > 0)
+            salary_norm = np.where(both, (self.__salary_min + self.__salary_max) / 2.0,
+                                   np.maximum(self.__salary_min, self.__salary_max).astype(np.float64))
+            salary_norm[salary_norm <= 0] = np.nan
+        self.__salary_norm = np.asarray(salary_norm, dtype=np.float64)
+        if len(self.__salary_norm) != len(self.__vacancy_id):
+            raise ValueError("Столбцы таблицы вакансий должны быть одной длины.")
+
+    @property
+    def vacancy_id(self):
+        return self.__vacancy_id
+
+    @property
+    def company_id(self):
+        return self.__company_id
+
+    @property
+    def salary_min(self):
+        return self.__salary_min
+
+    @property
+    def salary_max(self):
+        return self.__salary_max
+
+    @property
+    def salary_norm(self):
+        return self.__salary_norm
+
+    def __len__(self) -> int:
+        return len(self.__vacancy_id)
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> 'VacancyTable':
+        """
+        Создает таблицу из объектов класса Вакансия (например, результата Vacancy.cast_to_object_list).
+
+        Args:
+            vacancies(Iterable[Vacancy]): объекты класса Вакансия.
+        Returns:
+            VacancyTable: таблица вакансий.
+        """
+        return cls.from_rows((item.vacancy_id, item.company_id, item.salary_from, item.salary_to, item.salary_norm)
+                             for item in vacancies)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[Any, ...]]) -> 'VacancyTable':
+        """
+        Создает таблицу из строк (vacancy_id, company_id, salary_min, salary_max, salary_norm);
+        пустые границы зарплаты считаются нулем, пустая salary_norm - NaN.
+
+        Args:
+            rows(Iterable[tuple[Any, ...]]): строки таблицы.
+        Returns:
+            VacancyTable: таблица вакансий.
+        """
+        vacancy_ids: list[str] = []
+        company_ids: list[int] = []
+        salaries_min: list[int] = []
+        salaries_max: list[int] = []
+        salaries_norm: list[float] = []
+        for vacancy_id, company_id, salary_min, salary_max, salary_norm in rows:
+            vacancy_ids.append(vacancy_id)
+            company_ids.append(company_id)
+            salaries_min.append(salary_min or 0)
+            salaries_max.append(salary_max or 0)
+            salaries_norm.append(salary_norm if salary_norm is not None else np.nan)
+
+        return cls(np.array(vacancy_ids, dtype=str), np.array(company_ids, dtype=np.int64),
+                   np.array(salaries_min, dtype=np.int64), np.array(salaries_max, dtype=np.int64),
+                   np.array(salaries_norm, dtype=np.float64))
+
+    @classmethod
+    def from_db(cls, db) -> 'VacancyTable':
+        """
+        Создает таблицу из вакансий в БД, строки читаются потоково.
+
+        Args:
+            db(DBManager): менеджер БД.
+        Returns:
+            VacancyTable: таблица вакансий.
+        """
+        return cls.from_rows(db.iter_vacancy_salaries())
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'VacancyTable':
+        """
+        Создает таблицу из снимка данных (см. src/snapshot.py).
+
+        Числовые столбцы несжатого снимка становятся массивами поверх отображения файла в память,
+        без копирования; копируются только id вакансий и зарплаты в базовой валюте (0 в снимке - NaN).
+        В снимках без столбца salary_norm зарплата вычисляется из границ вилки.
+
+        Args:
+            snapshot(Snapshot): открытый снимок данных.
+        Returns:
+            VacancyTable: таблица вакансий.
+        """
+        vacancies = snapshot.table("vacancies")
+        salary_norm = None
+        if "salary_norm" in vacancies.columns:
+            salary_norm = np.frombuffer(vacancies.column("salary_norm"), dtype=np.int64).astype(np.float64)
+            salary_norm[salary_norm == 0] = np.nan
+        return cls(np.array(list(vacancies.column("vacancy_id")), dtype=str),
+                   np.frombuffer(vacancies.column("company_id"), dtype=np.int64),
+                   np.frombuffer(vacancies.column("salary_min"), dtype=np.int64),
+                   np.frombuffer(vacancies.column("salary_max"), dtype=np.int64),
+                   salary_norm)
+
+    def filter(self, mask: np.ndarray) -> 'VacancyTable':
+        """
+        Возвращает таблицу из строк, отмеченных в mask (булев массив или массив индексов).
+        """
+        return VacancyTable(self.__vacancy_id[mask], self.__company_id[mask],
+                            self.__salary_min[mask], self.__salary_max[mask], self.__salary_norm[mask])
+
+    def average_salary(self) -> float:
+        """
+        Возвращает среднюю зарплату по вакансиям с зарплатой (0.0, если таких нет).
+        """
+        return round(float(np.nanmean(self.__salary_norm)), 2) if self.__has_salaries() else 0.0
+
+    def percentiles(self, q: Iterable[float]) -> np.ndarray:
+        """
+        Возвращает процентили зарплаты.
+
+        Args:
+            q(Iterable[float]): процентили от 0 до 100, например (25, 50, 75).
+        """
+        return np.nanpercentile(self.__salary_norm, list(q))
+
+    def above_average_mask(self) -> np.ndarray:
+        """
+        Возвращает булев массив: True для вакансий с зарплатой выше средней.
+        """
+        if not self.__has_salaries():
+            return np.zeros(len(self), dtype=bool)
+        return self.__salary_norm > np.nanmean(self.__salary_norm)
+
+    def above_average(self) -> 'VacancyTable':
+        """
+        Возвращает таблицу вакансий с зарплатой выше средней.
+        """
+        return self.filter(self.above_average_mask())
+
+    def counts_by_company(self) -> dict[int, int]:
+        """
+        Возвращает количество вакансий у каждой компании.
+        """
+        companies, counts = np.unique(self.__company_id, return_counts=True)
+        return dict(zip(companies.tolist(), counts.tolist()))
+
+    def top_k(self, k: int) -> 'VacancyTable':
+        """
+        Возвращает k вакансий с наибольшей зарплатой, от большей к меньшей.
+
+        Выбор выполняется за линейное время (argpartition), сортируются только k найденных строк.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return self.filter(np.zeros(0, dtype=np.int64))
+
+        keys = np.nan_to_num(-self.__salary_norm, nan=np.inf)
+        candidates = np.argpartition(keys, k - 1)[:k]
+        order = candidates[np.argsort(keys[candidates], kind="stable")]
+        return self.filter(order)
+
+    def __has_salaries(self) -> bool:
+        """
+        Проверяет, есть ли в таблице вакансии с зарплатой.
+        """
+        return bool(len(self)) and not np.isnan(self.__salary_norm).all()
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+from psycopg2.extensions import parse_dsn
+
+from src.dbmanager import DBManager
+from src.employer import Employer
+from src.sqlite_dbmanager import SQLiteDBManager
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def db(tmp_path):
+    """
+    БД SQLite во временном каталоге с созданными таблицами.
+    """
+    manager = SQLiteDBManager(str(tmp_path / "vacancies.sqlite3"))
+    manager.create_table()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def pg_params():
+    """
+    Параметры подключения к PostgreSQL из переменной окружения TEST_POSTGRES_DSN;
+    без нее тесты PostgreSQL пропускаются. Таблицы в этой БД удаляются тестами.
+    """
+    dsn = os.environ.get("TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("TEST_POSTGRES_DSN не задан")
+    return {"host": None, "port": None, "user": None, "password": None} | parse_dsn(dsn)
+
+
+@pytest.fixture
+def pg_db(pg_params):
+    """
+    БД PostgreSQL с пересозданными таблицами.
+    """
+    manager = DBManager(**pg_params)
+    manager.drop_table("vacancies")
+    manager.drop_table("companies")
+    manager.create_table()
+    yield manager
+    manager.drop_table("vacancies")
+    manager.drop_table("companies")
+    manager.close()
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def any_db(request):
+    """
+    БД каждой из СУБД: SQLite и PostgreSQL (если задан TEST_POSTGRES_DSN).
+    """
+    return request.getfixturevalue("db" if request.param == "sqlite" else "pg_db")
+
+
+@pytest.fixture
+def make_employer():
+    """
+    Фабрика работодателей с заполненными обязательными полями.
+    """
+    def factory(employer_id: str, name: str | None = None) -> Employer:
+        return Employer(employer_id, name or f"Компания {employer_id}", f"https://hh.ru/employer/{employer_id}",
+                        "Москва", "", "", f"https://api.hh.ru/vacancies?employer_id={employer_id}", 1)
+
+    return factory
+
+
+@pytest.fixture
+def make_vacancy():
+    """
+    Фабрика вакансий с зарплатой в рублях (0 - граница не указана).
+    """
+    def factory(vacancy_id: str, company_id: int, salary_from: int = 0, salary_to: int = 0,
+                name: str | None = None, requirement: str = "") -> Vacancy:
+        return Vacancy.from_salary_range(vacancy_id, name or f"Вакансия {vacancy_id}",
+                                         f"https://api.hh.ru/vacancies/{vacancy_id}", salary_from, salary_to,
+                                         requirement, company_id, "RUR", False)
+
+    return factory
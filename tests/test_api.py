@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from benchmarks.datagen import vacancy_id
+from benchmarks.fake_hh import FakeHHServer
+from config import params_for_getting_employers, params_for_getting_vacancies
+from src.api import Parser
+from src.http_client import HttpClient
+
+
+class RecordingSession(requests.Session):
+    """
+    Сессия, запоминающая ссылку и параметры каждого запроса.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[tuple[str, dict]] = []
+
+    def get(self, url, **kwargs) -> requests.Response:
+        self.sent.append((url, dict(kwargs.get("params") or {})))
+        return super().get(url, **kwargs)
+
+
+@pytest.fixture
+def fake_hh():
+    with FakeHHServer(employers=3, vacancies_per_employer=5) as server:
+        yield server
+
+
+def local_parser(server: FakeHHServer, **kwargs) -> Parser:
+    """
+    Возвращает парсер локального сервера без ограничения частоты и повторов.
+    """
+    client = HttpClient(RecordingSession(), max_rps=1_000, burst=1_000, max_retries=0)
+    return Parser(f"{server.url}/employers", client=client, favorite_companies_id_hh=server.employer_ids, **kwargs)
+
+
+def vacancies_urls(server: FakeHHServer) -> dict[int, str]:
+    """
+    Возвращает ссылки на вакансии работодателей сервера по id компаний 1, 2, ...
+    """
+    return {company_id: f"{server.url}/vacancies?employer_id={employer}"
+            for company_id, employer in enumerate(server.employer_ids, 1)}
+
+
+def test_iter_vacancy_details(fake_hh):
+    employer = fake_hh.employer_ids[0]
+    ids = [vacancy_id(employer, index) for index in (2, 0, 2, 1)] + [vacancy_id(employer, 99)]
+    vacancies = [(vacancy, f"{fake_hh.url}/vacancies/{vacancy}") for vacancy in ids]
+
+    details = list(local_parser(fake_hh).iter_vacancy_details(vacancies, max_workers=2))
+
+    # повтор пропускается без запроса, несуществующая вакансия - после ошибки запроса
+    assert [item.vacancy_id for item in details] == ids[:2] + ids[3:4]
+    assert fake_hh.requests_count == 4
+    assert all(item.description and item.experience and item.schedule for item in details)
+
+
+def test_get_employers(fake_hh):
+    ids = list(reversed(fake_hh.employer_ids)) + ["999"]
+
+    employers = local_parser(fake_hh, max_workers=4).get_employers(ids)
+
+    # порядок совпадает с порядком id, работодатель с ошибкой запроса пропускается
+    assert [employer["id"] for employer in employers] == ids[:-1]
+    assert [employer.employer_id for employer in local_parser(fake_hh).get_employer_objects()] == fake_hh.employer_ids
+
+
+def test_get_vacancies(fake_hh):
+    data = vacancies_urls(fake_hh)
+    parser = local_parser(fake_hh, max_workers=2)
+
+    vacancies = parser.get_vacancies(data)
+
+    assert [vacancy.vacancy_id for vacancy in vacancies] == [vacancy_id(employer, index)
+                                                             for employer in fake_hh.employer_ids for index in range(5)]
+    assert [vacancy.company_id for vacancy in vacancies] == [company_id for company_id in data for _ in range(5)]
+    assert parser.completed_companies == set(data)
+
+
+def test_concurrent_calls_do_not_share_params(fake_hh):
+    # обходы вакансий и работодателей одним экземпляром из разных потоков не меняют параметры друг друга
+    parser = local_parser(fake_hh, max_workers=4)
+    data = {1: f"{fake_hh.url}/vacancies?employer_id={fake_hh.employer_ids[0]}"}
+    default_params = dict(parser.params)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        vacancies = [executor.submit(parser.get_vacancies, data) for _ in range(4)]
+        employers = [executor.submit(parser.get_employers) for _ in range(4)]
+        assert all(len(future.result()) == 5 for future in vacancies)
+        assert all(len(future.result()) == 3 for future in employers)
+
+    for url, params in parser.client.session.sent:
+        expected = params_for_getting_vacancies if "/vacancies" in url else params_for_getting_employers
+        assert params == {**expected, "page": params.get("page", expected["page"])}
+    assert parser.params == default_params
+
+
+@pytest.fixture
+def paged_hh():
+    # 250 вакансий - 3 страницы по per_page = 100
+    with FakeHHServer(employers=4, vacancies_per_employer=250) as server:
+        yield server
+
+
+def test_iter_vacancies_pages(paged_hh):
+    parser = local_parser(paged_hh, max_workers=3)
+    data = vacancies_urls(paged_hh)
+
+    ids = [vacancy.vacancy_id for vacancy in parser.iter_vacancies(data)]
+
+    assert ids == [vacancy_id(employer, index) for employer in paged_hh.employer_ids for index in range(250)]
+    assert paged_hh.requests_count == 4 * 3
+    assert parser.completed_companies == set(data)
+
+
+def test_iter_vacancies_early_stop(paged_hh):
+    parser = local_parser(paged_hh, max_workers=1)
+
+    vacancies = parser.iter_vacancies(vacancies_urls(paged_hh))
+    first = [next(vacancies) for _ in range(10)]
+    vacancies.close()
+
+    assert [vacancy.vacancy_id for vacancy in first] == [vacancy_id(paged_hh.employer_ids[0], i) for i in range(10)]
+    # страницы в очереди отменены: запрошены не все 12 страниц
+    assert paged_hh.requests_count < 12
+    assert parser.completed_companies == set()
@@ -0,0 +1,48 @@
+import sqlite3
+
+import psycopg2
+import pytest
+
+
+def test_insert_companies_bulk(any_db, make_employer):
+    employers = (make_employer(str(i)) for i in range(1, 6))
+
+    inserted = any_db.insert_companies_bulk(employers, batch_size=2)
+
+    # id из RETURNING всех пакетов, повторная вставка возвращает те же id
+    assert sorted(inserted.values()) == [f"https://api.hh.ru/vacancies?employer_id={i}" for i in range(1, 6)]
+    assert any_db.insert_companies_bulk([make_employer("3")], batch_size=2) == {
+        company_id: url for company_id, url in inserted.items() if url.endswith("=3")}
+
+
+def test_insert_vacancies_bulk(any_db, make_employer, make_vacancy):
+    (company_id,) = any_db.insert_companies_bulk([make_employer("1")])
+    vacancies = (make_vacancy(str(i), company_id, 1_000 * i) for i in range(1, 8))
+
+    assert any_db.insert_vacancies_bulk(vacancies, batch_size=3) == 7
+    # уже существующие вакансии пропускаются
+    assert any_db.insert_vacancies_bulk([make_vacancy("7", company_id), make_vacancy("8", company_id)], 3) == 1
+    assert len(any_db.get_all_vacancies()) == 8
+    assert any_db.get_avg_salary() == 4_000.0
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_insert_data_to_table(any_db, make_employer, make_vacancy, batch_size):
+    insert = any_db.insert_data_to_table_and_get_dict_with_employer_id_and_vacancies_url
+    companies = insert([make_employer("1"), make_employer("2")], "companies", batch_size)
+
+    assert insert([make_vacancy(str(i), next(iter(companies)), 100_000) for i in range(3)], "vacancies",
+                  batch_size) == {}
+    assert sorted(count for _, count in any_db.get_companies_and_vacancies_count()) == [0, 3]
+    with pytest.raises(ValueError):
+        insert([], "employers", batch_size)
+
+
+def test_insert_bulk_rolls_back_failed_batch(any_db, make_employer, make_vacancy):
+    (company_id,) = any_db.insert_companies_bulk([make_employer("1")])
+
+    # вакансия с несуществующим работодателем нарушает внешний ключ - не сохраняется ни один пакет
+    with pytest.raises((sqlite3.IntegrityError, psycopg2.IntegrityError)):
+        any_db.insert_vacancies_bulk([make_vacancy("1", company_id), make_vacancy("2", company_id + 100)], 1)
+
+    assert any_db.get_all_vacancies() == []
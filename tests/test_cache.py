@@ -0,0 +1,148 @@
+import time
+
+import pytest
+import requests
+
+from src.api import Parser
+from src.cache import CachedResponse, DiskResponseCache, MemoryResponseCache
+from src.http_client import HttpClient
+
+
+class RevalidatingSession:
+    """
+    Отдает тело с ETag и отвечает 304 на условный запрос с текущим ETag.
+    """
+
+    def __init__(self, etag: str | None = '"v1"', last_modified: str | None = None) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = b'{"id": "1"}'
+        self.sent: list[dict] = []
+
+    def get(self, url, params=None, headers=None, timeout=None) -> requests.Response:
+        headers = headers or {}
+        self.sent.append(headers)
+        response = requests.Response()
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+            return response
+        response.status_code = 200
+        response._content = self.content
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = self.last_modified
+        return response
+
+
+def make_parser(session: RevalidatingSession, cache_ttl: dict[str, float]) -> Parser:
+    client = HttpClient(session, max_rps=1_000, burst=1_000, max_retries=0)
+    return Parser("https://api.hh.ru/employers", cache=MemoryResponseCache(), cache_ttl=cache_ttl, client=client)
+
+
+def test_cached_response_freshness():
+    response = CachedResponse(b"", stored_at=time.time() - 10)
+
+    assert response.is_fresh(60) and not response.is_fresh(5)
+    assert not response.can_revalidate()
+    assert CachedResponse(b"", last_modified="Wed, 21 Oct 2015 07:28:00 GMT").can_revalidate()
+
+
+def test_memory_cache_lru():
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set("a", CachedResponse(b"a"))
+    cache.set("b", CachedResponse(b"b"))
+    cache.get("a")
+    cache.set("c", CachedResponse(b"c"))
+
+    # вытеснен давно не читавшийся ответ
+    assert cache.get("b") is None
+    assert cache.get("a").content == b"a" and cache.get("c").content == b"c"
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_disk_cache_persists(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_size_bytes=1_000)
+    key = cache.make_key("https://api.hh.ru/employers/1")
+    cache.set(key, CachedResponse(b"body", '"v1"', None, stored_at=100.0))
+
+    reopened = DiskResponseCache(tmp_path, max_size_bytes=1_000)
+    response = reopened.get(key)
+
+    assert (response.content, response.etag, response.last_modified, response.stored_at) == (b"body", '"v1"',
+                                                                                              None, 100.0)
+    assert reopened.size == 4
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_disk_cache_evicts_by_size(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_size_bytes=10)
+    cache.set("a", CachedResponse(b"aaaa"))
+    cache.set("b", CachedResponse(b"bbbb"))
+    cache.get("a")
+    cache.set("c", CachedResponse(b"cccc"))
+
+    assert cache.get("b") is None and not tmp_path.joinpath("b.body").exists()
+    assert cache.size == 8
+    # меньший предел при открытии вытесняет лишнее
+    assert DiskResponseCache(tmp_path, max_size_bytes=4).size == 4
+
+
+def test_disk_cache_damaged_entry(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_size_bytes=1_000)
+    cache.set("a", CachedResponse(b"aaaa"))
+    tmp_path.joinpath("a.json").write_text("{", encoding="utf-8")
+
+    assert cache.get("a") is None
+    assert cache.size == 0 and not tmp_path.joinpath("a.body").exists()
+
+
+def test_fresh_response_served_from_cache():
+    session = RevalidatingSession()
+    parser = make_parser(session, {"employers": 60})
+
+    assert parser._get_content("https://api.hh.ru/employers/1", {}) == session.content
+    assert parser._get_content("https://api.hh.ru/employers/1", {}) == session.content
+
+    assert len(session.sent) == 1
+    assert parser.cache.stats == {"hits": 1, "misses": 1, "revalidations": 0}
+
+
+@pytest.mark.parametrize("ttl", [0, 60])
+def test_stale_response_revalidated(ttl):
+    session = RevalidatingSession()
+    parser = make_parser(session, {"employers": ttl})
+    url = "https://api.hh.ru/employers/1"
+    parser._get_content(url, {"page": 0})
+    key = parser.cache.make_key(f"{url}?page=0")
+    parser.cache.set(key, CachedResponse(session.content, '"v1"', None, stored_at=time.time() - 120))
+
+    assert parser._get_content(url, {"page": 0}) == session.content
+
+    assert session.sent[-1] == {"If-None-Match": '"v1"'}
+    assert parser.cache.stats == {"hits": 0, "misses": 1, "revalidations": 1}
+    # подтвержденный ответ снова свежий
+    assert parser.cache.get(key).is_fresh(60)
+
+
+def test_changed_response_replaces_cached():
+    session = RevalidatingSession()
+    parser = make_parser(session, {"employers": 0})
+    parser._get_content("https://api.hh.ru/employers/1", {})
+    session.etag, session.content = '"v2"', b'{"id": "2"}'
+
+    assert parser._get_content("https://api.hh.ru/employers/1", {}) == b'{"id": "2"}'
+    assert parser.cache.stats == {"hits": 0, "misses": 2, "revalidations": 0}
+
+
+def test_response_without_validators_not_cached():
+    session = RevalidatingSession(etag=None)
+    parser = make_parser(session, {"employers": 0})
+
+    parser._get_content("https://api.hh.ru/employers/1", {})
+    parser._get_content("https://api.hh.ru/employers/1", {})
+
+    assert session.sent == [{}, {}]
+    assert parser.cache.stats["misses"] == 2
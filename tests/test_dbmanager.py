@@ -0,0 +1,53 @@
+import pytest
+
+
+@pytest.fixture
+def legacy_db(pg_db):
+    """
+    Таблицы прежней схемы - без уникальных employer_id и vacancy_id - с повторами.
+    """
+    pg_db.drop_table("vacancies")
+    pg_db.drop_table("companies")
+    with pg_db.conn.cursor() as cur:
+        cur.execute("""
+            CREATE TABLE companies(id SERIAL PRIMARY KEY, employer_id TEXT, name TEXT NOT NULL,
+                                   alternate_url TEXT, city TEXT NOT NULL, description TEXT, site_url TEXT,
+                                   vacancies_url TEXT, open_vacancies INTEGER);
+            CREATE TABLE vacancies(id SERIAL PRIMARY KEY, vacancy_id TEXT, name TEXT NOT NULL,
+                                   company_id INTEGER REFERENCES companies(id), url TEXT NOT NULL,
+                                   salary_min INTEGER, salary_max INTEGER, requirement TEXT NOT NULL);
+            INSERT INTO companies (employer_id, name, city) VALUES ('1', 'Альфа', 'Москва'), ('2', 'Бета', 'Москва'),
+                                                                   ('1', 'Альфа', 'Москва');
+            INSERT INTO vacancies (vacancy_id, name, company_id, url, salary_min, salary_max, requirement)
+            VALUES ('10', 'Python', 1, 'url', 0, 0, ''), ('11', 'Java', 3, 'url', 0, 0, ''),
+                   ('11', 'Java', 3, 'url', 0, 0, ''), ('12', 'Go', 2, 'url', 0, 0, '');
+        """)
+    pg_db.conn.commit()
+    return pg_db
+
+
+def test_create_table_refuses_duplicates(legacy_db):
+    with pytest.raises(RuntimeError, match="dedupe"):
+        legacy_db.create_table()
+
+    # таблицы не изменены
+    with legacy_db.conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM companies;")
+        assert cur.fetchone()[0] == 3
+    legacy_db.conn.rollback()
+
+
+def test_remove_duplicates(legacy_db):
+    assert legacy_db.remove_duplicates() == {"companies": 1, "moved_vacancies": 2, "vacancies": 1}
+    legacy_db.create_table()
+
+    assert sorted(legacy_db.get_companies_and_vacancies_count()) == [("Альфа", 2), ("Бета", 1)]
+    assert legacy_db.remove_duplicates() == {"companies": 0, "moved_vacancies": 0, "vacancies": 0}
+
+
+def test_insert_companies_upsert(pg_db, make_employer):
+    first = pg_db.insert_companies_bulk([make_employer("1", "Альфа")])
+    second = pg_db.insert_companies_bulk([make_employer("1", "Альфа 2")])
+
+    assert list(first) == list(second)
+    assert pg_db.get_companies_and_vacancies_count() == [("Альфа 2", 0)]
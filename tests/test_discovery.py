@@ -0,0 +1,80 @@
+from src.discovery import DiscoveryCheckpoint
+
+
+def test_query_key_ignores_page():
+    assert (DiscoveryCheckpoint.query_key({"area": "1", "page": 0, "text": ""})
+            == DiscoveryCheckpoint.query_key({"text": "", "page": 5, "area": "1"}))
+    assert DiscoveryCheckpoint.query_key({"area": "1"}) != DiscoveryCheckpoint.query_key({"area": "2"})
+
+
+def test_pending_pages():
+    checkpoint = DiscoveryCheckpoint()
+    checkpoint.add_query("q")
+
+    assert checkpoint.pages("q") is None
+    assert checkpoint.pending_pages("q") == [0]
+    assert not checkpoint.is_complete()
+
+    checkpoint.record_page("q", 0, 3, ["1", "2"])
+    checkpoint.record_page("q", 2, 3, ["5"])
+
+    assert checkpoint.pages("q") == 3
+    assert checkpoint.pending_pages("q") == [1]
+    assert not checkpoint.is_complete(["q"])
+
+    checkpoint.record_page("q", 1, 3, ["3", "2"])
+
+    assert checkpoint.pending_pages("q") == []
+    assert checkpoint.is_complete()
+    # без повторов, в порядке страниц
+    assert checkpoint.employer_ids() == ["1", "2", "3", "5"]
+
+
+def test_add_query_keeps_progress():
+    checkpoint = DiscoveryCheckpoint()
+    checkpoint.add_query("q")
+    checkpoint.record_page("q", 0, 2, ["1"])
+    checkpoint.add_query("q")
+
+    assert checkpoint.pending_pages("q") == [1]
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = DiscoveryCheckpoint(path)
+    checkpoint.add_query("a")
+    checkpoint.add_query("b")
+    checkpoint.record_page("a", 0, 2, ["1"])
+    checkpoint.record_page("b", 0, 1, ["2"])
+
+    restored = DiscoveryCheckpoint(path)
+
+    assert restored.pending_pages("a") == [1]
+    assert restored.is_complete(["b"])
+    assert restored.employer_ids() == ["1", "2"]
+    assert restored.employer_ids(["b"]) == ["2"]
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_retain(tmp_path):
+    checkpoint = DiscoveryCheckpoint(tmp_path / "checkpoint.json")
+    for key in ("a", "b"):
+        checkpoint.add_query(key)
+        checkpoint.record_page(key, 0, 1, [key])
+
+    checkpoint.retain(["b", "c"])
+
+    assert checkpoint.employer_ids() == ["b"]
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = DiscoveryCheckpoint(path)
+    checkpoint.add_query("q")
+    checkpoint.record_page("q", 0, 1, ["1"])
+
+    checkpoint.clear()
+
+    assert not path.exists()
+    assert checkpoint.employer_ids() == []
+    assert DiscoveryCheckpoint(path).employer_ids() == []
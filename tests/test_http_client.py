@@ -0,0 +1,183 @@
+import threading
+
+import pytest
+import requests
+
+from src import http_client
+from src.http_client import AdaptiveConcurrency, HttpClient, TokenBucket
+
+
+class FakeClock:
+    """
+    Заменяет модуль time в http_client: sleep не ждет, а сдвигает часы.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeSession:
+    """
+    Отдает заранее заданные ответы (код или (код, заголовки)) или выбрасывает заданные исключения.
+    """
+
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.calls: list[dict] = []
+
+    def get(self, url, **kwargs) -> requests.Response:
+        self.calls.append({"url": url, **kwargs})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(http_client, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def make_client(clock, monkeypatch):
+    # без случайной составляющей задержка повтора - верхняя граница интервала
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: high)
+
+    def factory(*outcomes, **kwargs) -> HttpClient:
+        options = {"max_rps": 100, "burst": 100, "max_concurrency": 4, "max_retries": 3, "backoff_base": 1,
+                   "backoff_max": 30, "timeout": 5, "retry_after_max": 120} | kwargs
+        return HttpClient(FakeSession(*outcomes), **options)
+
+    return factory
+
+
+def test_token_bucket_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    for _ in range(6):
+        bucket.acquire()
+
+    # 2 токена всплеска, остальные 4 - по одному в 0,5 с
+    assert clock.now - 1_000.0 == pytest.approx(2.0)
+
+
+def test_token_bucket_throttle(clock):
+    bucket = TokenBucket(rate=10, capacity=10, min_rate=1)
+
+    bucket.on_throttle()
+    assert bucket.rate == 5
+    for _ in range(10):
+        bucket.on_throttle()
+    assert bucket.rate == 1
+    bucket.on_success()
+    assert bucket.rate == pytest.approx(1.2)
+
+    # после ограничения накопленный всплеск сброшен: второй токен - через 1 / rate
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps and clock.now > 1_000.0
+
+
+def test_adaptive_concurrency_limit():
+    concurrency = AdaptiveConcurrency(max_limit=8)
+
+    concurrency.on_throttle()
+    concurrency.on_throttle()
+    assert concurrency.limit == 2
+    for _ in range(20):
+        concurrency.on_throttle()
+    assert concurrency.limit == 1
+    for _ in range(100):
+        concurrency.on_success()
+    assert concurrency.limit == 8
+
+
+def test_adaptive_concurrency_blocks_over_limit():
+    concurrency = AdaptiveConcurrency(max_limit=1)
+    entered = threading.Event()
+
+    def worker():
+        with concurrency:
+            entered.set()
+
+    with concurrency:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not entered.wait(0.1)
+    assert entered.wait(1)
+    thread.join()
+
+
+def test_backoff(make_client):
+    client = make_client()
+
+    assert [client.backoff(attempt) for attempt in range(7)] == [1, 2, 4, 8, 16, 30, 30]
+
+
+def test_retry_after(make_client, clock):
+    client = make_client()
+
+    def response(value):
+        result = requests.Response()
+        result.headers["Retry-After"] = value
+        return result
+
+    # значение больше backoff_max не обрезается
+    assert client.retry_after(response("90")) == 90
+    assert client.retry_after(response("Thu, 01 Jan 1970 00:17:40 GMT")) == pytest.approx(60)
+    assert client.retry_after(response("-5")) == 0
+    assert client.retry_after(response("скоро")) is None
+    assert client.retry_after(requests.Response()) is None
+
+
+def test_get_retries(make_client, clock):
+    client = make_client(requests.ConnectionError(), 500, (429, {"Retry-After": "45"}), 200)
+
+    response = client.get("https://api.hh.ru/vacancies", params={"page": 0})
+
+    assert response.status_code == 200
+    # задержки: backoff 1 и 2, затем полный Retry-After вместо backoff 4
+    assert clock.sleeps == [1, 2, 45]
+    assert all(call["timeout"] == 5 and call["params"] == {"page": 0} for call in client.session.calls)
+    assert client.bucket.rate < 100 and client.concurrency.limit < 4
+
+
+def test_get_returns_last_response(make_client, clock):
+    client = make_client(503, 503, max_retries=1)
+
+    assert client.get("https://api.hh.ru/vacancies").status_code == 503
+    assert len(client.session.calls) == 2
+
+
+def test_get_raises_after_retries(make_client):
+    client = make_client(requests.Timeout(), requests.Timeout(), max_retries=1)
+
+    with pytest.raises(requests.Timeout):
+        client.get("https://api.hh.ru/vacancies")
+
+
+def test_get_retry_after_too_long(make_client, clock):
+    client = make_client((429, {"Retry-After": "3600"}), 200)
+
+    with pytest.raises(requests.HTTPError) as error:
+        client.get("https://api.hh.ru/vacancies")
+
+    assert error.value.response.status_code == 429
+    assert clock.sleeps == [] and len(client.session.calls) == 1
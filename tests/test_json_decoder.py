@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from benchmarks.datagen import generate_employer, generate_vacancies_page, generate_vacancy_details
+from src import json_decoder
+from src.json_decoder import MsgspecJsonDecoder, StdlibJsonDecoder, make_decoder
+
+
+def employer_fields(employer):
+    return (employer.employer_id, employer.name, employer.alternate_url, employer.city, employer.description,
+            employer.site_url, employer.vacancies_url, employer.open_vacancies)
+
+
+def vacancy_fields(vacancy):
+    return (vacancy.vacancy_id, vacancy.name, vacancy.url, vacancy.salary, vacancy.salary_norm, vacancy.requirement,
+            vacancy.company_id)
+
+
+PAGE = {"items": [
+    {"id": "1", "name": "Python", "url": "url1", "salary": {"from": 1_000, "to": 2_000, "currency": "USD",
+                                                            "gross": True},
+     "snippet": {"requirement": "SQL", "responsibility": "код"}, "employer": {"id": "7"}},
+    {"id": "2", "name": "Java", "url": "url2", "salary": None, "snippet": None},
+    {"id": "3", "name": "Go", "url": "url3", "salary": {"from": None, "to": 90_000}},
+], "found": 3, "per_page": 20}
+
+
+@pytest.fixture(params=["json", "msgspec"])
+def decoder(request):
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    return make_decoder(request.param)
+
+
+def test_decode_vacancies_page(decoder):
+    page = decoder.decode_vacancies_page(json.dumps(PAGE).encode(), 5)
+
+    assert (page.found, page.pages, page.per_page) == (3, None, 20)
+    assert [vacancy_fields(vacancy) for vacancy in page.items] == [
+        ("1", "Python", "url1", {"from": 1_000, "to": 2_000, "currency": "USD", "gross": True}, 117_450, "SQL", 5),
+        ("2", "Java", "url2", {"from": 0, "to": 0, "currency": "", "gross": False}, None, "", 5),
+        ("3", "Go", "url3", {"from": 0, "to": 90_000, "currency": "", "gross": False}, 90_000, "", 5),
+    ]
+
+
+def test_decode_employer(decoder):
+    data = generate_employer(3, "http://localhost", 10)
+
+    assert employer_fields(decoder.decode_employer(json.dumps(data).encode())) == (
+        data["id"], data["name"], data["alternate_url"], data["area"]["name"], data["description"],
+        data["site_url"], data["vacancies_url"], 10)
+
+
+def test_decode_vacancy_details(decoder):
+    data = generate_vacancy_details("1000000", 1)
+    data["key_skills"] = [{"name": "Python"}, {"name": "SQL"}]
+
+    assert decoder.decode_vacancy_details(json.dumps(data).encode(), "v1") == (
+        "v1", data["description"], "Python, SQL", data["experience"]["name"], data["schedule"]["name"])
+    assert decoder.decode_vacancy_details(b"{}", "v2") == ("v2", "", "", None, None)
+
+
+@pytest.mark.parametrize("content", [b"{", b"not json"])
+def test_decode_malformed(decoder, content):
+    # ошибки разбора - ValueError, который Parser обрабатывает как ошибку запроса
+    with pytest.raises(ValueError):
+        decoder.decode_vacancies_page(content, 1)
+
+
+def test_decoders_agree():
+    pytest.importorskip("msgspec")
+    content = json.dumps(generate_vacancies_page("1000001", 250, 1, 100)).encode()
+    stdlib_page = StdlibJsonDecoder().decode_vacancies_page(content, 1)
+    msgspec_page = MsgspecJsonDecoder().decode_vacancies_page(content, 1)
+
+    assert stdlib_page[1:] == msgspec_page[1:]
+    assert [vacancy_fields(v) for v in stdlib_page.items] == [vacancy_fields(v) for v in msgspec_page.items]
+
+
+def test_make_decoder(monkeypatch):
+    with pytest.raises(ValueError):
+        make_decoder("yaml")
+
+    monkeypatch.setattr(json_decoder, "msgspec", None)
+    assert make_decoder("auto").name == "json"
+    with pytest.raises(ImportError):
+        make_decoder("msgspec")
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+
+import pytest
+
+import main
+from src.sqlite_dbmanager import SQLiteDBManager
+
+
+@pytest.fixture
+def run(db, tmp_path, monkeypatch, capsys, make_employer, make_vacancy):
+    """
+    Запускает main с аргументами на заполненной БД SQLite и возвращает (stdout, stderr).
+    """
+    alpha, beta = db.insert_companies_bulk([make_employer("1", "Альфа"), make_employer("2", "Бета")])
+    db.insert_vacancies_bulk([
+        make_vacancy("1", alpha, 100_000, name="Python разработчик"),
+        make_vacancy("2", alpha, 200_000, 300_000, name="Java разработчик"),
+        make_vacancy("3", beta, 50_000, name="Тестировщик", requirement="Знание Python"),
+    ], 10)
+    path = str(tmp_path / "vacancies.sqlite3")
+    monkeypatch.setattr(main, "create_db_manager", lambda: SQLiteDBManager(path))
+
+    def runner(*argv: str) -> tuple[str, str]:
+        capsys.readouterr()
+        main.main(list(argv))
+        captured = capsys.readouterr()
+        return captured.out, captured.err
+
+    return runner
+
+
+def jsonl(out: str) -> list[dict]:
+    return [json.loads(line) for line in out.splitlines()]
+
+
+def test_companies(run):
+    out, _ = run("companies")
+
+    assert sorted(map(tuple, (row.values() for row in jsonl(out)))) == [("Альфа", 2), ("Бета", 1)]
+
+
+def test_vacancies_csv(run):
+    out, _ = run("vacancies", "--format", "csv")
+    rows = list(csv.reader(io.StringIO(out)))
+
+    assert rows[0] == list(main.VACANCY_COLUMNS)
+    assert [row[1] for row in rows[1:]] == ["Python разработчик", "Java разработчик", "Тестировщик"]
+
+
+def test_avg_and_search(run):
+    assert jsonl(run("avg")[0]) == [{"avg_salary": 133_333.33}]
+    assert [row["vacancy"] for row in jsonl(run("search", "python")[0])] == ["Python разработчик", "Тестировщик"]
+
+
+def test_vacancies_pages(run):
+    out, err = run("vacancies", "--order", "salary", "--limit", "2")
+    cursor = err.strip().rsplit("--after=", 1)[1]
+    next_out, next_err = run("vacancies", "--order", "salary", "--limit", "2", f"--after={cursor}")
+
+    assert [row["vacancy"] for row in jsonl(out)] == ["Java разработчик", "Python разработчик"]
+    assert [row["vacancy"] for row in jsonl(next_out)] == ["Тестировщик"]
+    assert next_err == ""
+
+
+def test_salary_range(run):
+    out, _ = run("salary", "--from", "60000", "--to", "250000")
+
+    assert [(row["vacancy"], row["salary"]) for row in jsonl(out)] == [("Java разработчик", 250_000),
+                                                                         ("Python разработчик", 100_000)]
+
+
+def test_export_import(run, tmp_path):
+    snapshot = tmp_path / "snapshot.cw5"
+    _, err = run("export", str(snapshot), "--compress")
+    assert "работодателей 2, вакансий 3" in err
+
+    _, err = run("import", str(snapshot))
+    assert "добавлено работодателей 0, вакансий 0" in err
+
+
+def test_invalid_arguments(run):
+    with pytest.raises(SystemExit):
+        run("vacancies", "--order", "name")
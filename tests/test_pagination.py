@@ -0,0 +1,108 @@
+import pytest
+
+
+def walk(fetch_page, **kwargs):
+    """
+    Собирает страницы, переходя по курсорам next_after.
+    """
+    pages, after = [], None
+    while True:
+        page = fetch_page(after=after, **kwargs)
+        pages.append(page)
+        if page.next_after is None:
+            return pages
+        after = page.next_after
+
+
+def rows_of(pages):
+    return [row for page in pages for row in page.rows]
+
+
+@pytest.fixture
+def filled_db(db, make_employer, make_vacancy):
+    alpha, beta = db.insert_companies_bulk([make_employer("1", "Альфа"), make_employer("2", "Бета")])
+    db.insert_vacancies_bulk([
+        make_vacancy("1", alpha, 100_000, name="Python разработчик", requirement="Опыт работы с SQL"),
+        make_vacancy("2", alpha, 200_000, 300_000, name="Java разработчик"),
+        make_vacancy("3", alpha, name="Стажер"),
+        make_vacancy("4", beta, 50_000, name="Тестировщик", requirement="Знание Python"),
+        make_vacancy("5", beta, 150_000, name="Аналитик"),
+    ], 100)
+    return db
+
+
+@pytest.mark.parametrize("order", ["id", "salary"])
+def test_vacancies_page_walk(filled_db, order):
+    pages = walk(filled_db.get_vacancies_page, limit=2, order=order)
+    rows = rows_of(pages)
+
+    assert all(len(page.rows) == 2 for page in pages[:-1])
+    assert len(rows) == len(set(rows))
+    if order == "id":
+        assert rows == filled_db.get_all_vacancies()
+    else:
+        # вакансия без зарплаты не попадает в порядок по зарплате
+        assert [row[1] for row in rows] == ["Java разработчик", "Аналитик", "Python разработчик", "Тестировщик"]
+
+
+@pytest.mark.parametrize("order, limit, sizes", [("id", 5, [5]), ("id", 4, [4, 1]), ("salary", 2, [2, 2]),
+                                                 ("salary", 4, [4]), ("salary", 3, [3, 1])])
+def test_page_boundaries(filled_db, order, limit, sizes):
+    # курсор следующей страницы есть, только если после страницы остались строки
+    pages = walk(filled_db.get_vacancies_page, limit=limit, order=order)
+
+    assert [len(page.rows) for page in pages] == sizes
+    assert pages[-1].next_after is None
+
+
+def test_salary_ties_across_pages(db, make_employer, make_vacancy):
+    (company_id,) = db.insert_companies_bulk([make_employer("1")])
+    db.insert_vacancies_bulk([make_vacancy(str(i), company_id, 100_000 if i != 3 else 200_000)
+                              for i in range(1, 7)], 100)
+
+    for limit in (1, 2, 4):
+        rows = rows_of(walk(db.get_vacancies_page, limit=limit, order="salary"))
+        # равные зарплаты - по убыванию номера строки, ни одна не пропущена и не повторена
+        assert [row[4].rsplit("/", 1)[1] for row in rows] == ["3", "6", "5", "4", "2", "1"]
+
+
+def test_higher_salary_page_walk(filled_db):
+    rows = rows_of(walk(filled_db.get_vacancies_with_higher_salary_page, limit=1))
+
+    assert rows == filled_db.get_vacancies_with_higher_salary()
+
+
+def test_keyword_page_walk(filled_db):
+    rows = rows_of(walk(filled_db.get_vacancies_with_keyword_page, keyword="python", limit=1))
+
+    assert {row[1] for row in rows} == {"Python разработчик", "Тестировщик"}
+    # совпадение в названии релевантнее совпадения в требованиях
+    assert rows[0][1] == "Python разработчик"
+    assert filled_db.get_vacancies_with_keyword_page("  ").rows == []
+
+
+def test_top_vacancies(filled_db):
+    assert [row[1] for row in filled_db.get_top_vacancies(2)] == ["Java разработчик", "Аналитик"]
+
+
+@pytest.mark.parametrize("order, after", [("id", "abc"), ("id", "1:2"), ("salary", "1"), ("salary", "1:2:3"),
+                                          ("salary", "x:1")])
+def test_invalid_page_cursor(filled_db, order, after):
+    with pytest.raises(ValueError):
+        filled_db.get_vacancies_page(after=after, order=order)
+
+
+def test_page_cursor_of_other_order(filled_db):
+    # курсор страницы по зарплате (зарплата:id) не подходит для порядка по id
+    after = filled_db.get_vacancies_page(limit=1, order="salary").next_after
+
+    assert filled_db.get_vacancies_with_higher_salary_page(after=after).rows
+    with pytest.raises(ValueError):
+        filled_db.get_vacancies_page(after=after, order="id")
+
+
+def test_invalid_page_arguments(filled_db):
+    with pytest.raises(ValueError):
+        filled_db.get_vacancies_page(limit=0)
+    with pytest.raises(ValueError):
+        filled_db.get_vacancies_page(order="name")
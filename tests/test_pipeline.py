@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from src.pipeline import IngestPipeline
+
+
+def test_yields_all_items_in_order():
+    with IngestPipeline(range(10), batch_size=3, queue_size=2) as pipeline:
+        assert list(pipeline) == list(range(10))
+        assert pipeline.produced == 10
+
+
+def test_empty_source():
+    assert list(IngestPipeline([], batch_size=3)) == []
+
+
+@pytest.mark.parametrize("batch_size, queue_size", [(0, 1), (1, 0)])
+def test_invalid_sizes(batch_size, queue_size):
+    with pytest.raises(ValueError):
+        IngestPipeline([], batch_size=batch_size, queue_size=queue_size)
+
+
+def test_producer_error_reaches_consumer():
+    def source():
+        yield 1
+        yield 2
+        raise RuntimeError("ошибка источника")
+
+    received = []
+    with pytest.raises(RuntimeError, match="ошибка источника"):
+        for item in IngestPipeline(source(), batch_size=1):
+            received.append(item)
+
+    assert received == [1, 2]
+
+
+def test_consumer_stop_closes_source():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(1_000_000):
+                yield i
+        finally:
+            closed.set()
+
+    pipeline = IngestPipeline(source(), batch_size=10, queue_size=1)
+    for item in pipeline:
+        if item == 5:
+            break
+
+    # закрытие генератора останавливает производителя, не дочитывая источник
+    assert closed.wait(timeout=5)
+    assert pipeline.produced < 1_000_000
+
+
+def test_backpressure():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    with IngestPipeline(source(), batch_size=10, queue_size=1) as pipeline:
+        iterator = iter(pipeline)
+        assert next(iterator) == 0
+        # производитель ждет места в очереди: прочитаны не больше пакета в очереди и пакета, ожидающего записи
+        threading.Event().wait(0.2)
+        assert len(produced) <= 30
+        iterator.close()
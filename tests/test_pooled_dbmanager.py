@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+import pytest
+
+from src.dbmanager import PooledDBManager
+
+
+@pytest.fixture
+def pooled_db(pg_db, pg_params):
+    """
+    Менеджер с пулом из двух соединений поверх таблиц, созданных pg_db.
+    """
+    manager = PooledDBManager(**pg_params, min_size=1, max_size=2)
+    yield manager
+    manager.close()
+
+
+@pytest.mark.parametrize("min_size, max_size", [(-1, 2), (3, 2), (0, 0)])
+def test_invalid_pool_size(min_size, max_size):
+    with pytest.raises(ValueError):
+        PooledDBManager("db", "user", "", "localhost", 5432, min_size=min_size, max_size=max_size)
+
+
+def test_concurrent_calls_wait_for_connection(pooled_db, make_employer, make_vacancy):
+    (company_id,) = pooled_db.insert_companies_bulk([make_employer("1")])
+    barrier = threading.Barrier(8)
+
+    def work(index: int) -> int:
+        barrier.wait()
+        pooled_db.insert_vacancies_bulk([make_vacancy(str(index), company_id, 1_000 * index)], 10)
+        return len(pooled_db.get_all_vacancies())
+
+    # потоков больше, чем соединений: вызовы ждут свободного соединения, а не завершаются ошибкой пула
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        counts = list(executor.map(work, range(1, 9)))
+
+    assert all(1 <= count <= 8 for count in counts)
+    assert pooled_db.get_companies_and_vacancies_count() == [("Компания 1", 8)]
+
+
+def test_failed_call_returns_connection(pooled_db, make_employer, make_vacancy):
+    (company_id,) = pooled_db.insert_companies_bulk([make_employer("1")])
+
+    for _ in range(3):
+        with pytest.raises(psycopg2.IntegrityError):
+            pooled_db.insert_vacancies_bulk([make_vacancy("1", company_id + 100)], 10)
+
+    # соединения возвращены в пул после отката, транзакции не оставлены открытыми
+    assert pooled_db.insert_vacancies_bulk([make_vacancy("1", company_id)], 10) == 1
+    assert len(pooled_db.pool._used) == 0
@@ -0,0 +1,94 @@
+import sqlite3
+
+import pytest
+
+from src.query_cache import _MISSING, QueryCache
+
+
+def test_lru():
+    cache = QueryCache(max_size=2)
+    cache.set("a", 1, cache.generation)
+    cache.set("b", 2, cache.generation)
+    cache.get("a")
+    cache.set("c", 3, cache.generation)
+
+    assert cache.get("b") is _MISSING
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats == {"hits": 3, "misses": 1, "size": 2}
+
+
+def test_disabled():
+    cache = QueryCache(max_size=0)
+    cache.set("a", 1, cache.generation)
+
+    assert cache.get("a") is _MISSING
+
+
+def test_result_of_previous_generation_not_stored():
+    cache = QueryCache(max_size=10)
+    generation = cache.generation
+    # запись завершилась, пока выполнялся запрос
+    cache.clear()
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") is _MISSING
+    assert cache.generation == generation + 1
+
+
+@pytest.fixture
+def company_id(db, make_employer):
+    (company_id,) = db.insert_companies_bulk([make_employer("1", "Альфа")])
+    return company_id
+
+
+@pytest.fixture
+def filled_db(db, company_id, make_vacancy):
+    db.insert_vacancies_bulk([make_vacancy("1", company_id, 100_000, name="Python разработчик"),
+                              make_vacancy("2", company_id, 200_000, name="Java разработчик")], 10)
+    return db
+
+
+def test_repeated_reads_served_from_cache(filled_db):
+    first = filled_db.get_all_vacancies()
+    page = filled_db.get_vacancies_page(limit=1, order="salary")
+
+    assert filled_db.get_all_vacancies() is first
+    assert filled_db.get_vacancies_page(limit=1, order="salary") is page
+    # другие аргументы - другой ключ
+    assert filled_db.get_vacancies_page(limit=2, order="salary") is not page
+    assert filled_db.get_all_vacancies(use_cache=False) is not first
+    assert filled_db.query_cache.stats["hits"] == 2
+
+
+def test_writes_invalidate(filled_db, company_id, make_vacancy):
+    writes = [
+        lambda: filled_db.insert_vacancies_bulk([make_vacancy("3", company_id, 300_000)], 10),
+        lambda: filled_db.sync_vacancies([make_vacancy("3", company_id, 350_000)], []),
+        lambda: filled_db.update_vacancy_details([("3", "Описание", "Python", "noExperience", "remote")]),
+    ]
+    for write in writes:
+        before = filled_db.get_vacancies_with_higher_salary()
+        write()
+        assert filled_db.get_vacancies_with_higher_salary() is not before
+
+    assert [row[1] for row in filled_db.get_vacancies_with_higher_salary()] == ["Вакансия 3"]
+    assert filled_db.get_avg_salary() == pytest.approx((100_000 + 200_000 + 350_000) / 3)
+
+
+def test_failed_write_invalidates(filled_db, make_vacancy):
+    before = filled_db.get_all_vacancies()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        filled_db.insert_vacancies_bulk([make_vacancy("3", 100)], 10)
+
+    assert filled_db.get_all_vacancies() is not before
+    assert filled_db.get_all_vacancies() == before
+
+
+def test_drop_table_invalidates(filled_db):
+    assert len(filled_db.get_all_vacancies()) == 2
+
+    filled_db.drop_table("vacancies")
+    filled_db.create_table()
+
+    assert filled_db.get_all_vacancies() == []
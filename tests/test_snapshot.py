@@ -0,0 +1,100 @@
+import pytest
+
+from src import snapshot
+from src.snapshot import Snapshot, export_snapshot, vacancy_rows, write_snapshot
+from src.sqlite_dbmanager import SQLiteDBManager
+
+
+@pytest.fixture
+def source_db(db, make_employer, make_vacancy):
+    company_ids = list(db.insert_companies_bulk([make_employer("1", "Альфа"), make_employer("2", "Бета")]))
+    db.insert_vacancies_bulk([make_vacancy("1", company_ids[0], 100_000, 200_000, requirement="SQL"),
+                              make_vacancy("2", company_ids[0]),
+                              make_vacancy("3", company_ids[1], 50_000, name="Тестировщик\tQA")], 100)
+    db.update_vacancy_details([("1", "Описание\nвакансии", "Python, SQL", "between1And3", "fullDay")])
+    return db
+
+
+@pytest.fixture
+def target_db(tmp_path):
+    manager = SQLiteDBManager(str(tmp_path / "target.sqlite3"))
+    manager.create_table()
+    yield manager
+    manager.close()
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_round_trip(source_db, target_db, tmp_path, compression):
+    path = tmp_path / "snapshot.cw5"
+
+    assert export_snapshot(source_db, path, compression) == {"companies": 2, "vacancies": 3}
+    with Snapshot(path) as opened:
+        assert target_db.load_snapshot(opened) == {"companies": 2, "vacancies": 3}
+
+    assert list(target_db.iter_company_rows()) == list(source_db.iter_company_rows())
+    assert list(target_db.iter_vacancy_rows()) == list(source_db.iter_vacancy_rows())
+    # подробности восстановлены и не запрашиваются заново
+    assert [row[0] for row in target_db.get_vacancies_to_enrich()] == ["2", "3"]
+    assert target_db.get_salary_stats() == source_db.get_salary_stats()
+
+
+def test_load_keeps_existing_rows(source_db, tmp_path):
+    path = tmp_path / "snapshot.cw5"
+    export_snapshot(source_db, path)
+
+    with Snapshot(path) as opened:
+        assert source_db.load_snapshot(opened) == {"companies": 0, "vacancies": 0}
+
+
+def test_columns(source_db, tmp_path):
+    path = tmp_path / "snapshot.cw5"
+    export_snapshot(source_db, path)
+
+    with Snapshot(path) as opened:
+        vacancies = opened.table("vacancies")
+        assert len(vacancies) == 3
+        assert vacancies.columns == tuple(column for column, _ in snapshot.VACANCY_COLUMNS)
+        assert list(vacancies.column("salary_norm")) == [150_000, 0, 50_000]
+        assert list(vacancies.column("name"))[-1] == "Тестировщик\tQA"
+        assert list(vacancies.column("key_skills")) == ["Python, SQL", "", ""]
+        assert list(vacancies.rows(["vacancy_id", "salary_min"])) == [("1", 100_000), ("2", 0), ("3", 50_000)]
+        with pytest.raises(KeyError):
+            vacancies.column("salary_mid")
+        with pytest.raises(KeyError):
+            opened.table("employers")
+
+
+def test_version_1_snapshot(target_db, tmp_path, monkeypatch):
+    path = tmp_path / "snapshot_v1.cw5"
+    monkeypatch.setattr(snapshot, "FORMAT_VERSION", 1)
+    monkeypatch.setitem(snapshot.SNAPSHOT_TABLES, "vacancies", snapshot.VACANCY_COLUMNS[:7])
+    write_snapshot(path, {"companies": [(1, "1", "Альфа", "", "Москва", "", "", "", 1)],
+                          "vacancies": [("1", "Python", 1, "url", 100_000, 300_000, "SQL")]})
+    monkeypatch.undo()
+
+    with Snapshot(path) as opened:
+        # salary_norm вычисляется из вилки, подробностей нет
+        assert list(vacancy_rows(opened.table("vacancies"))) == [
+            ("1", "Python", 1, "url", 100_000, 300_000, "SQL", 200_000, "", "", "", "", "")]
+        assert target_db.load_snapshot(opened) == {"companies": 1, "vacancies": 1}
+
+    assert target_db.get_avg_salary() == 200_000.0
+    assert target_db.get_vacancies_to_enrich() == [("1", "url")]
+
+
+def test_row_width_mismatch(tmp_path):
+    with pytest.raises(ValueError):
+        write_snapshot(tmp_path / "snapshot.cw5", {"vacancies": [("1", "Python", 1, "url", 0, 0, "", 0)]})
+
+
+def test_unknown_compression(source_db, tmp_path):
+    with pytest.raises(ValueError):
+        export_snapshot(source_db, tmp_path / "snapshot.cw5", "lzma")
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "snapshot.cw5"
+    path.write_bytes(b"not a snapshot")
+
+    with pytest.raises(ValueError):
+        Snapshot(path)
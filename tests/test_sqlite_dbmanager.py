@@ -0,0 +1,108 @@
+import pytest
+
+
+@pytest.fixture
+def company_ids(db, make_employer):
+    return list(db.insert_companies_bulk([make_employer("1", "Альфа"), make_employer("2", "Бета")]))
+
+
+@pytest.fixture
+def filled_db(db, company_ids, make_vacancy):
+    alpha, beta = company_ids
+    db.insert_vacancies_bulk([
+        make_vacancy("1", alpha, 100_000, name="Python разработчик", requirement="Опыт работы с SQL"),
+        make_vacancy("2", alpha, 200_000, 300_000, name="Java разработчик"),
+        make_vacancy("3", alpha, name="Стажер"),
+        make_vacancy("4", beta, 50_000, name="Тестировщик", requirement="Знание Python"),
+        make_vacancy("5", beta, 150_000, name="Аналитик"),
+    ], 2)
+    return db
+
+
+def test_insert_companies_upsert(db, make_employer):
+    first = db.insert_companies_bulk([make_employer("1", "Альфа")])
+    second = db.insert_companies_bulk([make_employer("1", "Альфа 2")])
+
+    assert list(first) == list(second)
+    assert db.get_companies_and_vacancies_count() == [("Альфа 2", 0)]
+
+
+def test_sync_vacancies_stats(db, company_ids, make_vacancy):
+    alpha, beta = company_ids
+    stats = db.sync_vacancies([make_vacancy("1", alpha, 100_000), make_vacancy("2", alpha, 200_000),
+                               make_vacancy("3", beta, 300_000)], [alpha, beta])
+    assert stats == {"inserted": 3, "updated": 0, "unchanged": 0, "deleted": 0}
+
+    # вакансия 2 изменилась, вакансии 3 больше нет, вакансия 4 - новая; повторы в выдаче пропускаются
+    stats = db.sync_vacancies([make_vacancy("1", alpha, 100_000), make_vacancy("2", alpha, 250_000),
+                               make_vacancy("4", alpha, 50_000), make_vacancy("4", alpha, 50_000)], [alpha, beta])
+    assert stats == {"inserted": 1, "updated": 1, "unchanged": 1, "deleted": 1}
+
+    # вакансии работодателя, не загруженного полностью, не удаляются
+    stats = db.sync_vacancies([make_vacancy("1", alpha, 100_000)], [])
+    assert stats == {"inserted": 0, "updated": 0, "unchanged": 1, "deleted": 0}
+    assert sorted(row[4] for row in db.get_all_vacancies()) == [f"https://api.hh.ru/vacancies/{i}"
+                                                                for i in ("1", "2", "4")]
+
+
+def test_sync_vacancies_resets_enrichment(db, company_ids, make_vacancy):
+    alpha, _ = company_ids
+    db.sync_vacancies([make_vacancy("1", alpha, 100_000), make_vacancy("2", alpha, 200_000)], [alpha])
+    db.update_vacancy_details([("1", "Описание", "Python", "between1And3", "fullDay"),
+                               ("2", "Описание", "Java", "between1And3", "fullDay")])
+    assert db.get_vacancies_to_enrich() == []
+
+    db.sync_vacancies([make_vacancy("1", alpha, 100_000), make_vacancy("2", alpha, 220_000)], [alpha])
+
+    assert db.get_vacancies_to_enrich() == [("2", "https://api.hh.ru/vacancies/2")]
+
+
+def test_salary_stats(filled_db):
+    # зарплаты: 100 000, 250 000, 50 000, 150 000; вакансия без зарплаты не учитывается
+    assert filled_db.get_avg_salary() == 137_500.0
+    assert filled_db.get_salary_stats() == [
+        ("Все компании", 4, 137_500.0, 125_000.0, 50_000, 250_000),
+        ("Альфа", 2, 175_000.0, 175_000.0, 100_000, 250_000),
+        ("Бета", 2, 100_000.0, 100_000.0, 50_000, 150_000),
+    ]
+    assert [row[1] for row in filled_db.get_vacancies_with_higher_salary()] == ["Java разработчик", "Аналитик"]
+
+
+def test_salary_stats_refreshed_after_sync(filled_db, company_ids, make_vacancy):
+    _, beta = company_ids
+    filled_db.sync_vacancies([make_vacancy("6", beta, 1_000_000)], [beta])
+
+    assert filled_db.get_avg_salary() == 450_000.0
+    assert filled_db.get_salary_stats()[2] == ("Бета", 1, 1_000_000.0, 1_000_000.0, 1_000_000, 1_000_000)
+
+
+def test_companies_and_vacancies_count(filled_db):
+    assert sorted(filled_db.get_companies_and_vacancies_count()) == [("Альфа", 3), ("Бета", 2)]
+
+
+def test_search_vacancies(filled_db):
+    # слова запроса - начала слов названия или требований, без учета регистра
+    assert [row[1] for row in filled_db.search_vacancies("PYTHON")] == ["Python разработчик", "Тестировщик"]
+    assert [row[1] for row in filled_db.search_vacancies("разраб sql")] == ["Python разработчик"]
+    assert filled_db.search_vacancies("python", limit=1) == filled_db.search_vacancies("python")[:1]
+    assert filled_db.search_vacancies("  ") == []
+
+
+def test_vacancies_by_salary(filled_db):
+    rows = filled_db.get_vacancies_by_salary(100_000, 200_000)
+
+    assert [(row[1], row[5]) for row in rows] == [("Аналитик", 150_000), ("Python разработчик", 100_000)]
+    assert len(filled_db.get_vacancies_by_salary(limit=2)) == 2
+
+
+def test_iter_all_vacancies(filled_db):
+    assert sorted(filled_db.iter_all_vacancies(itersize=2)) == sorted(filled_db.get_all_vacancies())
+
+
+def test_drop_table(filled_db):
+    filled_db.drop_table("vacancies")
+    filled_db.drop_table("companies")
+    filled_db.create_table()
+
+    assert filled_db.get_all_vacancies() == []
+    assert filled_db.get_avg_salary() == 0.0
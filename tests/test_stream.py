@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.sqlite_dbmanager import SQLiteDBManager
+
+
+@pytest.fixture
+def filled_db(any_db, make_employer, make_vacancy):
+    (company_id,) = any_db.insert_companies_bulk([make_employer("1", "Альфа")])
+    any_db.insert_vacancies_bulk([make_vacancy(str(i), company_id, 100_000 * i) for i in range(1, 4)], 10)
+    return any_db, company_id
+
+
+def test_suspended_stream_and_writes(filled_db, make_vacancy):
+    db, company_id = filled_db
+    stream = db.iter_all_vacancies(itersize=1)
+    first = next(stream)
+
+    # запись и чтение, пока итератор не дочитан, не прерывают его и не ждут его завершения
+    db.insert_vacancies_bulk([make_vacancy("4", company_id, 400_000)], 10)
+    assert len(db.get_all_vacancies()) == 4
+
+    # итератор дочитывает результат на момент начала запроса
+    assert [first, *stream] == sorted(db.get_all_vacancies(), key=lambda row: row[4])[:3]
+
+
+def test_suspended_stream_does_not_block_other_threads(filled_db):
+    db, _ = filled_db
+    stream = db.iter_vacancies_with_higher_salary(itersize=1)
+    next(stream)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(db.get_avg_salary, use_cache=False).result(timeout=5) == 200_000.0
+        assert len(list(executor.submit(db.iter_all_vacancies).result(timeout=5))) == 3
+
+    stream.close()
+
+
+def test_streams_interleave(filled_db):
+    db, _ = filled_db
+    rows = db.iter_all_vacancies(itersize=1)
+    salaries = db.iter_vacancy_salaries(itersize=1)
+
+    pairs = list(zip(rows, salaries))
+
+    assert len(pairs) == 3
+
+
+def test_memory_db_stream(make_employer, make_vacancy):
+    db = SQLiteDBManager(":memory:")
+    db.create_table()
+    (company_id,) = db.insert_companies_bulk([make_employer("1")])
+    db.insert_vacancies_bulk([make_vacancy(str(i), company_id, 1_000) for i in range(5)], 10)
+
+    stream = db.iter_all_vacancies(itersize=2)
+    next(stream)
+    db.insert_vacancies_bulk([make_vacancy("5", company_id, 1_000)], 10)
+
+    assert len(list(stream)) == 4
+    db.close()
@@ -0,0 +1,80 @@
+import pytest
+
+from src import vacancy as vacancy_module
+from src.vacancy import Vacancy, normalize_salary
+
+RATES = {"RUR": 1.0, "USD": 90.0}
+
+
+@pytest.mark.parametrize("salary_from, salary_to, currency, gross, expected", [
+    (100_000, 200_000, "RUR", False, 150_000),
+    (100_000, 0, "RUR", False, 100_000),
+    (None, 200_000, None, False, 200_000),
+    (1_000, 3_000, "USD", False, 180_000),
+    (100_000, 0, "RUR", True, 87_000),
+    (0, 0, "RUR", False, None),
+    (None, None, None, False, None),
+    (100_000, 0, "XYZ", False, None),
+])
+def test_normalize_salary(salary_from, salary_to, currency, gross, expected):
+    assert normalize_salary(salary_from, salary_to, currency, gross, rates=RATES, base_currency="RUR",
+                            net_ratio=0.87) == expected
+
+
+def test_normalize_salary_base_currency():
+    assert normalize_salary(9_000, 0, "RUR", rates=RATES, base_currency="USD") == 100
+
+
+def test_vacancy_from_dict():
+    vacancy = Vacancy("1", "Python", "url", {"from": 1_000, "to": None, "currency": "USD", "gross": True}, None, 7)
+
+    assert vacancy.salary == {"from": 1_000, "to": 0, "currency": "USD", "gross": True}
+    assert vacancy.requirement == ""
+    assert vacancy.company_id == 7
+
+
+def test_vacancy_from_salary_range(make_vacancy):
+    vacancy = make_vacancy("1", 1, 100_000, 200_000, requirement="SQL")
+
+    assert vacancy.salary == {"from": 100_000, "to": 200_000, "currency": "RUR", "gross": False}
+    assert vacancy.requirement == "SQL"
+
+
+def test_vacancy_salary_norm(make_vacancy):
+    assert make_vacancy("1", 1, 100_000, 200_000).salary_norm == 150_000
+    assert make_vacancy("2", 1).salary_norm is None
+
+
+def test_vacancy_comparison(make_vacancy):
+    low, high, same, empty = (make_vacancy("1", 1, 100_000), make_vacancy("2", 1, 200_000),
+                              make_vacancy("3", 1, 100_000), make_vacancy("4", 1))
+
+    assert low < high and high > low
+    assert low <= same and low >= same and low == same
+    assert not low >= high and not high <= low
+    assert low.compare_salaries(high) == -1 and low.compare_salaries(same) == 0
+    # вакансия без зарплаты меньше любой вакансии с зарплатой
+    assert empty < low and empty <= low and low >= empty
+    assert sorted([high, empty, low]) == [empty, low, high]
+
+
+def test_vacancy_comparison_uses_stored_key(make_vacancy, monkeypatch):
+    vacancies = [make_vacancy("1", 1, 200_000), make_vacancy("2", 1), make_vacancy("3", 1, 100_000)]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("зарплата пересчитана при сравнении")
+
+    monkeypatch.setattr(vacancy_module, "normalize_salary", fail)
+
+    assert [vacancy.vacancy_id for vacancy in sorted(vacancies)] == ["2", "3", "1"]
+    assert [vacancy.salary_norm for vacancy in vacancies] == [200_000, None, 100_000]
+
+
+def test_vacancy_comparison_with_other_types(make_vacancy):
+    vacancy = make_vacancy("1", 1, 100_000)
+
+    assert vacancy != 100_000
+    with pytest.raises(TypeError):
+        vacancy <= 100_000
+    with pytest.raises(TypeError):
+        hash(vacancy)
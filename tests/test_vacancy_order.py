@@ -0,0 +1,66 @@
+import pytest
+
+from src.vacancy_order import bottom_k, merge_sorted, salary_norm_key, salary_range_key, sort_by_salary, top_k
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    return [make_vacancy("1", 1, 100_000), make_vacancy("2", 1), make_vacancy("3", 1, 300_000),
+            make_vacancy("4", 1, 200_000, 400_000), make_vacancy("5", 1, 100_000), make_vacancy("6", 1)]
+
+
+def ids(vacancies):
+    return [vacancy.vacancy_id for vacancy in vacancies]
+
+
+def test_salary_keys(make_vacancy):
+    vacancy = make_vacancy("1", 1, 100_000, 200_000)
+
+    assert salary_norm_key(vacancy) == 150_000
+    assert salary_range_key(vacancy) == (100_000, 200_000)
+    assert salary_norm_key(make_vacancy("2", 1)) is None
+    assert salary_range_key(make_vacancy("2", 1)) is None
+
+
+def test_sort_by_salary(vacancies):
+    # равные зарплаты (вакансии 3 и 4, 1 и 5) и вакансии без зарплаты - в исходном порядке
+    assert ids(sort_by_salary(vacancies)) == ["3", "4", "1", "5", "2", "6"]
+    assert ids(sort_by_salary(vacancies, reverse=False)) == ["1", "5", "3", "4", "2", "6"]
+    assert ids(sort_by_salary(vacancies, key=salary_range_key)) == ["3", "4", "1", "5", "2", "6"]
+
+
+def test_sort_by_salary_matches_comparisons(vacancies):
+    by_key = sort_by_salary(vacancies)
+    by_lt = sorted(vacancies, reverse=True)
+
+    assert [v.salary_norm for v in by_key] == [v.salary_norm for v in by_lt]
+
+
+def test_top_k(vacancies):
+    assert ids(top_k(vacancies, 2)) == ["3", "4"]
+    assert ids(top_k(iter(vacancies), 3)) == ["3", "4", "1"]
+    assert ids(top_k(vacancies, 10)) == ["3", "4", "1", "5"]
+    assert top_k(vacancies, 0) == []
+
+
+def test_bottom_k(vacancies):
+    assert ids(bottom_k(vacancies, 2)) == ["1", "5"]
+    assert ids(bottom_k(vacancies, 10)) == ["1", "5", "3", "4"]
+
+
+def test_merge_sorted(vacancies):
+    streams = [sort_by_salary(vacancies[:3]), sort_by_salary(vacancies[3:]), []]
+    merged = list(merge_sorted(streams))
+
+    assert [v.salary_norm for v in merged] == [v.salary_norm for v in sort_by_salary(vacancies)]
+    assert ids(merged[-2:]) == ["2", "6"]
+
+
+def test_merge_sorted_is_lazy(make_vacancy):
+    def stream():
+        yield make_vacancy("1", 1, 300_000)
+        raise AssertionError("поток прочитан дальше необходимого")
+
+    merged = merge_sorted([stream(), [make_vacancy("2", 1, 200_000)]])
+
+    assert next(merged).vacancy_id == "1"